@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import sys
 from pathlib import Path
 
@@ -11,7 +12,7 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from simpleai.provider_smoke import resolve_sample_file_path, run_provider_matrix
+from simpleai.provider_smoke import arun_provider_matrix, resolve_sample_file_path
 
 
 
@@ -41,17 +42,14 @@ def build_parser() -> argparse.ArgumentParser:
 
 
 
-def main() -> int:
-    parser = build_parser()
-    args = parser.parse_args()
-
+async def _amain(args: argparse.Namespace) -> int:
     try:
         file_path = resolve_sample_file_path(args.file)
     except FileNotFoundError as exc:
         print(str(exc), file=sys.stderr)
         return 2
 
-    results = run_provider_matrix(
+    results = await arun_provider_matrix(
         file_path=file_path,
         settings_file=args.settings_file,
         providers=args.providers,
@@ -65,5 +63,12 @@ def main() -> int:
     return 0
 
 
+
+def main() -> int:
+    parser = build_parser()
+    args = parser.parse_args()
+    return asyncio.run(_amain(args))
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
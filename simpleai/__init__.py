@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from .api import run_prompt
+from .api import arun_prompt, run_prompt
 from .exceptions import SimpleAIException
 
-__all__ = ["run_prompt", "SimpleAIException"]
+__all__ = ["arun_prompt", "run_prompt", "SimpleAIException"]
 __version__ = "0.1.0"
@@ -0,0 +1,30 @@
+"""JSON parsing with orjson as an optional fast path."""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+# orjson turns integers wider than 64 bits into floats; documents with such runs go to json.
+_WIDE_DIGITS_RE = re.compile(rb"\d{19}")
+
+
+def loads_json(data: bytes) -> Any:
+    """Parse JSON bytes with orjson when installed, accepting exactly what `json.loads` does.
+
+    Raises `json.JSONDecodeError` on invalid input.
+    """
+
+    if orjson is not None and _WIDE_DIGITS_RE.search(data) is None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects some inputs json accepts (NaN, lone surrogates); let json decide.
+            pass
+    return json.loads(data)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+import threading
 from typing import Any
 
 from .anthropic_adapter import AnthropicAdapter
@@ -20,6 +22,22 @@ ADAPTER_CLASSES = {
 }
 
 
+# Adapters hold SDK clients with their own connection pools, so they are reused
+# for identical provider settings instead of being rebuilt per call.
+_ADAPTER_CACHE: dict[tuple[str, frozenset[tuple[str, str]]], BaseAdapter] = {}
+_ADAPTER_CACHE_LOCK = threading.Lock()
+
+
+def _adapter_cache_key(provider: str, provider_settings: dict[str, Any]) -> tuple[str, frozenset[tuple[str, str]]]:
+    return (
+        provider,
+        frozenset(
+            (key, json.dumps(value, sort_keys=True, default=str))
+            for key, value in provider_settings.items()
+        ),
+    )
+
+
 def get_adapter(provider: str, provider_settings: dict[str, Any]) -> BaseAdapter:
     """Return instantiated adapter for canonical provider key."""
 
@@ -27,12 +45,30 @@ def get_adapter(provider: str, provider_settings: dict[str, Any]) -> BaseAdapter
         adapter_cls = ADAPTER_CLASSES[provider]
     except KeyError as exc:
         raise ValueError(f"Unsupported provider: {provider}") from exc
-    return adapter_cls(provider_settings)
+
+    key = _adapter_cache_key(provider, provider_settings)
+    adapter = _ADAPTER_CACHE.get(key)
+    if adapter is not None:
+        return adapter
+    with _ADAPTER_CACHE_LOCK:
+        adapter = _ADAPTER_CACHE.get(key)
+        if adapter is None:
+            adapter = adapter_cls(provider_settings)
+            _ADAPTER_CACHE[key] = adapter
+    return adapter
+
+
+def clear_adapter_cache() -> None:
+    """Drop pooled adapters so the next `get_adapter` call builds fresh ones."""
+
+    with _ADAPTER_CACHE_LOCK:
+        _ADAPTER_CACHE.clear()
 
 
 __all__ = [
     "AnthropicAdapter",
     "BaseAdapter",
+    "clear_adapter_cache",
     "GeminiAdapter",
     "get_adapter",
     "GrokAdapter",
@@ -0,0 +1,68 @@
+"""Shared HTTP transports for provider SDK clients.
+
+Provider SDKs each build their own httpx connection pool per client instance.
+Handing every adapter the same pooled clients lets TCP/TLS connections be
+reused across adapter instances and `run_prompt` calls.
+
+An async client's connections belong to the event loop that opened them, so
+async clients are pooled per running loop (`asyncio.run` and Django's
+`async_to_sync` each start a fresh one) instead of process-wide.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Callable, Generic, TypeVar
+from weakref import WeakKeyDictionary
+
+import httpx
+
+T = TypeVar("T")
+
+# Matches the provider SDK defaults; SDKs still pass per-request timeouts.
+_TIMEOUT = httpx.Timeout(600.0, connect=10.0)
+_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=32)
+
+
+class LoopLocal(Generic[T]):
+    """One lazily built value per running event loop."""
+
+    def __init__(self, factory: Callable[[], T]) -> None:
+        self._factory = factory
+        self._values: WeakKeyDictionary[asyncio.AbstractEventLoop, T] = WeakKeyDictionary()
+
+    def get(self) -> T:
+        """Return the value for the running loop; raises RuntimeError outside a loop."""
+
+        loop = asyncio.get_running_loop()
+        value = self._values.get(loop)
+        if value is None:
+            # Pooled connections can keep a closed loop alive, so drop those entries explicitly.
+            for stale in [item for item in self._values if item.is_closed()]:
+                del self._values[stale]
+            value = self._values[loop] = self._factory()
+        return value
+
+
+def _http2_available() -> bool:
+    return find_spec("h2") is not None
+
+
+@lru_cache(maxsize=1)
+def get_sync_httpx() -> httpx.Client:
+    """Return the process-wide pooled sync httpx client."""
+
+    return httpx.Client(timeout=_TIMEOUT, limits=_LIMITS, http2=_http2_available(), follow_redirects=True)
+
+
+_async_clients: LoopLocal[httpx.AsyncClient] = LoopLocal(
+    lambda: httpx.AsyncClient(timeout=_TIMEOUT, limits=_LIMITS, http2=_http2_available(), follow_redirects=True)
+)
+
+
+def get_async_httpx() -> httpx.AsyncClient:
+    """Return the pooled async httpx client for the running event loop."""
+
+    return _async_clients.get()
@@ -2,16 +2,20 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
+import asyncio
 import json
 import os
 import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Sequence
+from types import MappingProxyType
+from typing import Any, Mapping, Sequence
 
 from pydantic import BaseModel
 
+from simpleai.adapters._http import LoopLocal, get_async_httpx, get_sync_httpx
 from simpleai.adapters.base import BaseAdapter
+from simpleai.cache import acached_response, cached_response
 from simpleai.exceptions import ProviderError
 from simpleai.schema import (
     ANTHROPIC_UNSUPPORTED_SCHEMA_KEYS,
@@ -22,6 +26,18 @@ from simpleai.schema import (
 from simpleai.types import AdapterResponse, Citation, PromptInput
 
 
+_EMPTY: tuple[Any, ...] = ()
+_EMPTY_MAP: Mapping[str, Any] = MappingProxyType({})
+
+
+@lru_cache(maxsize=1)
+def _sdk() -> tuple[Any, Any, type[Exception]]:
+    """Resolve the SDK classes once, on first use rather than at `import simpleai`."""
+    from anthropic import Anthropic, AsyncAnthropic, RateLimitError
+
+    return Anthropic, AsyncAnthropic, RateLimitError
+
+
 DEFAULT_MAX_RETRIES = 3
 
 
@@ -33,29 +49,35 @@ class AnthropicAdapter(BaseAdapter):
         super().__init__(provider_settings)
 
         try:
-            from anthropic import Anthropic
+            Anthropic, AsyncAnthropic, _ = _sdk()
         except Exception as exc:  # pragma: no cover - dependency missing path
             raise ProviderError("anthropic package is required for AnthropicAdapter.") from exc
 
         api_key = provider_settings.get("api_key") or os.getenv("ANTHROPIC_API_KEY") or os.getenv("CLAUDE_API_KEY")
-        self.client = Anthropic(api_key=api_key)
+        self.client = Anthropic(api_key=api_key, http_client=get_sync_httpx())
+        self._aclients = LoopLocal(lambda: AsyncAnthropic(api_key=api_key, http_client=get_async_httpx()))
 
         # Rate limiting configuration
         self._max_retries = int(provider_settings.get("max_retries", DEFAULT_MAX_RETRIES))
         self._skip_citation_followup = bool(provider_settings.get("skip_citation_followup", False))
+        # List prompts go out as one multi-part message unless callers need one message per turn.
+        self._split_turns = bool(provider_settings.get("split_turns", False))
+
+    @property
+    def aclient(self) -> Any:
+        """Async SDK client bound to the running event loop."""
+        return self._aclients.get()
 
     def _build_messages(self, prompt: PromptInput) -> list[dict[str, Any]]:
         if isinstance(prompt, str):
             return [{"role": "user", "content": [{"type": "text", "text": prompt}]}]
 
-        messages: list[dict[str, Any]] = []
-        for turn in prompt:
-            messages.append({"role": "user", "content": [{"type": "text", "text": str(turn)}]})
-
-        if not messages:
-            messages.append({"role": "user", "content": [{"type": "text", "text": ""}]})
-
-        return messages
+        content = [{"type": "text", "text": text} for text in map(str, prompt)]
+        if not content:
+            return [{"role": "user", "content": [{"type": "text", "text": ""}]}]
+        if self._split_turns:
+            return [{"role": "user", "content": [part]} for part in content]
+        return [{"role": "user", "content": content}]
 
     def _prompt_as_text(self, prompt: PromptInput) -> str:
         if isinstance(prompt, str):
@@ -66,13 +88,15 @@ class AnthropicAdapter(BaseAdapter):
         """Backwards-compatible wrapper for tests and internal call sites."""
 
         return strip_schema_keywords(
-            enforce_closed_objects(deepcopy(schema)),
+            enforce_closed_objects(schema),
             ANTHROPIC_UNSUPPORTED_SCHEMA_KEYS,
         )
 
     def _extract_citations(self, response_dict: dict[str, Any]) -> list[Citation]:
         citations: list[Citation] = []
+        append = citations.append
         seen: set[tuple[Any, ...]] = set()
+        provider = self.provider_name
 
         def append_citation(
             *,
@@ -86,9 +110,9 @@ class AnthropicAdapter(BaseAdapter):
             if key in seen:
                 return
             seen.add(key)
-            citations.append(
+            append(
                 Citation(
-                    provider=self.provider_name,
+                    provider=provider,
                     url=url,
                     title=title,
                     source=source,
@@ -97,31 +121,32 @@ class AnthropicAdapter(BaseAdapter):
                 )
             )
 
-        for block in response_dict.get("content", []):
-            if block.get("type") == "text":
-                for item in block.get("citations") or []:
-                    source_obj = item.get("source") or {}
-                    if not isinstance(source_obj, dict):
+        for block in response_dict.get("content") or _EMPTY:
+            block_type = block.get("type")
+            if block_type == "text":
+                for item in block.get("citations") or _EMPTY:
+                    get = item.get
+                    source_obj = get("source") or _EMPTY_MAP
+                    if not isinstance(source_obj, Mapping):
                         source_obj = {"source": source_obj}
-                    url = item.get("url") or source_obj.get("url")
-                    title = item.get("title") or source_obj.get("title")
-                    source = url or source_obj.get("source")
+                    url = get("url") or source_obj.get("url")
                     append_citation(
                         url=url,
-                        title=title,
-                        source=source,
-                        snippet=item.get("cited_text"),
+                        title=get("title") or source_obj.get("title"),
+                        source=url or source_obj.get("source"),
+                        snippet=get("cited_text"),
                         raw=item,
                     )
 
-            if block.get("type") == "web_search_tool_result":
-                raw_content = block.get("content") or []
-                items = [raw_content] if isinstance(raw_content, dict) else raw_content
+            elif block_type == "web_search_tool_result":
+                raw_content = block.get("content") or _EMPTY
+                items = (raw_content,) if isinstance(raw_content, dict) else raw_content
                 for result in items:
+                    url = result.get("url")
                     append_citation(
-                        url=result.get("url"),
+                        url=url,
                         title=result.get("title"),
-                        source=result.get("url"),
+                        source=url,
                         snippet=None,
                         raw=result,
                     )
@@ -129,13 +154,10 @@ class AnthropicAdapter(BaseAdapter):
         return citations
 
     def _extract_text(self, response_dict: dict[str, Any]) -> str:
-        texts: list[str] = []
-        for block in response_dict.get("content", []):
-            if block.get("type") == "text":
-                text = block.get("text", "")
-                if text:
-                    texts.append(text)
-        return "\n".join(texts).strip()
+        blocks = response_dict.get("content") or _EMPTY
+        return "\n".join(
+            filter(None, (block.get("text") for block in blocks if block.get("type") == "text"))
+        ).strip()
 
     def _has_web_search_result(self, response_dict: dict[str, Any]) -> bool:
         for block in response_dict.get("content", []):
@@ -192,31 +214,194 @@ class AnthropicAdapter(BaseAdapter):
 
         return None
 
-    def _create_with_retry(self, payload: dict[str, Any]) -> Any:
+    def _retry_delay(self, exc: Exception) -> float:
+        retry_after = self._get_retry_after(exc)
+        if retry_after is not None:
+            # Use the retry-after header value with a small buffer
+            return retry_after + 1.0
+        # Fallback if header is missing (shouldn't happen with Anthropic)
+        return 60.0
+
+    def _create_with_retry(self, payload: dict[str, Any]) -> dict[str, Any]:
         """Make API call with retry based on retry-after header from 429 responses."""
-        from anthropic import RateLimitError
+        RateLimitError = _sdk()[2]
 
-        last_error: Exception | None = None
         for attempt in range(self._max_retries + 1):
             try:
-                return self.client.messages.create(**payload)
+                return self._dump(self.client.messages.create(**payload))
             except RateLimitError as exc:
-                last_error = exc
-                if attempt < self._max_retries:
-                    retry_after = self._get_retry_after(exc)
-                    if retry_after is not None:
-                        # Use the retry-after header value with a small buffer
-                        time.sleep(retry_after + 1.0)
-                    else:
-                        # Fallback if header is missing (shouldn't happen with Anthropic)
-                        time.sleep(60.0)
-                else:
+                if attempt >= self._max_retries:
                     raise
+                time.sleep(self._retry_delay(exc))
 
-        if last_error:
-            raise last_error
         raise ProviderError("Unexpected error in retry logic")
 
+    async def _acreate_with_retry(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Async variant of `_create_with_retry`."""
+        RateLimitError = _sdk()[2]
+
+        for attempt in range(self._max_retries + 1):
+            try:
+                return self._dump(await self.aclient.messages.create(**payload))
+            except RateLimitError as exc:
+                if attempt >= self._max_retries:
+                    raise
+                await asyncio.sleep(self._retry_delay(exc))
+
+        raise ProviderError("Unexpected error in retry logic")
+
+    def _dump(self, response: Any) -> dict[str, Any]:
+        return response.model_dump(mode="json") if hasattr(response, "model_dump") else {}
+
+    def _merge_citations(self, citations: list[Citation], response_dict: dict[str, Any]) -> None:
+        existing_keys = {self._citation_key(c) for c in citations}
+        for extra in self._extract_citations(response_dict):
+            if self._citation_key(extra) not in existing_keys:
+                citations.append(extra)
+                existing_keys.add(self._citation_key(extra))
+
+    def _build_payload(
+        self,
+        *,
+        prompt: PromptInput,
+        model: str,
+        require_search: bool,
+        output_format: type[BaseModel] | None,
+        adapter_options: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        payload: dict[str, Any] = {
+            "model": model,
+            "max_tokens": int(self.provider_settings.get("max_tokens", 4096)),
+            "messages": self._build_messages(prompt),
+        }
+
+        if require_search:
+            payload["tools"] = [
+                {
+                    "name": "web_search",
+                    "type": "web_search_20250305",
+                }
+            ]
+            payload["tool_choice"] = {"type": "any"}
+
+        if output_format is not None:
+            payload["output_config"] = {
+                "format": {
+                    "type": "json_schema",
+                    "schema": anthropic_response_schema(output_format),
+                }
+            }
+
+        if adapter_options:
+            payload.update(adapter_options)
+
+        return payload
+
+    def _citation_followup_payload(
+        self,
+        *,
+        text: str,
+        model: str,
+        adapter_options: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        structured_preview = text.strip()[:4000] if text else ""
+        citation_prompt = (
+            "Use web search and return citations supporting this structured answer. "
+            "Prefer official sources and include company homepages when relevant.\n\n"
+            f"Structured answer:\n{structured_preview}"
+        )
+        citation_payload: dict[str, Any] = {
+            "model": model,
+            "max_tokens": int(self.provider_settings.get("max_tokens", 4096)),
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [{"type": "text", "text": citation_prompt}],
+                }
+            ],
+            "tools": [
+                {
+                    "name": "web_search",
+                    "type": "web_search_20250305",
+                }
+            ],
+            "tool_choice": {"type": "any"},
+        }
+        if adapter_options:
+            citation_passthrough = dict(adapter_options)
+            citation_passthrough.pop("output_config", None)
+            citation_payload.update(citation_passthrough)
+        return citation_payload
+
+    def _synthesis_payload(
+        self,
+        *,
+        prompt: PromptInput,
+        response_dict: dict[str, Any],
+        model: str,
+        output_format: type[BaseModel] | None,
+        adapter_options: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        search_context = self._render_web_search_context(response_dict)
+        prompt_text = self._prompt_as_text(prompt)
+        synthesis_text = (
+            f"{prompt_text}\n\n"
+            "Web search results already gathered:\n"
+            f"{search_context}\n\n"
+            "Return the final answer now. "
+            "If a JSON schema is required, return only valid JSON."
+        )
+        synthesis_payload: dict[str, Any] = {
+            "model": model,
+            "max_tokens": int(self.provider_settings.get("max_tokens", 4096)),
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [{"type": "text", "text": synthesis_text}],
+                }
+            ],
+        }
+        if output_format is not None:
+            synthesis_payload["output_config"] = {
+                "format": {
+                    "type": "json_schema",
+                    "schema": anthropic_response_schema(output_format),
+                }
+            }
+        if adapter_options:
+            passthrough = dict(adapter_options)
+            passthrough.pop("tools", None)
+            passthrough.pop("tool_choice", None)
+            synthesis_payload.update(passthrough)
+        return synthesis_payload
+
+    def _needs_citation_followup(
+        self,
+        *,
+        citations: list[Citation],
+        require_search: bool,
+        return_citations: bool,
+        output_format: type[BaseModel] | None,
+    ) -> bool:
+        # Anthropic output schemas can omit citation blocks when output_config is active.
+        # If citations were requested but absent, issue a search-only pass to collect them.
+        # Skip this if skip_citation_followup is set (helps with rate limits on Tier 1 accounts).
+        return (
+            return_citations
+            and require_search
+            and output_format is not None
+            and not citations
+            and not self._skip_citation_followup
+        )
+
+    def _tool_input_fallback(self, response_dict: dict[str, Any]) -> str:
+        # Last-resort fallback: some schema-compatible outputs may appear as tool-like input.
+        for block in response_dict.get("content", []):
+            if block.get("type") in {"tool_use", "server_tool_use"} and isinstance(block.get("input"), dict):
+                return json.dumps(block["input"], ensure_ascii=True)
+        return ""
+
+    @cached_response
     def run(
         self,
         *,
@@ -231,141 +416,109 @@ class AnthropicAdapter(BaseAdapter):
         del files  # unsupported in this adapter; caller should pass extracted text instead
 
         try:
-            payload: dict[str, Any] = {
-                "model": model,
-                "max_tokens": int(self.provider_settings.get("max_tokens", 4096)),
-                "messages": self._build_messages(prompt),
-            }
+            payload = self._build_payload(
+                prompt=prompt,
+                model=model,
+                require_search=require_search,
+                output_format=output_format,
+                adapter_options=adapter_options,
+            )
+            response_dict = self._create_with_retry(payload)
+            text = self._extract_text(response_dict)
 
-            if require_search:
-                payload["tools"] = [
-                    {
-                        "name": "web_search",
-                        "type": "web_search_20250305",
-                    }
-                ]
-                payload["tool_choice"] = {"type": "any"}
-
-            if output_format is not None:
-                payload["output_config"] = {
-                    "format": {
-                        "type": "json_schema",
-                        "schema": anthropic_response_schema(output_format),
-                    }
-                }
+            citations = self._extract_citations(response_dict) if return_citations else []
 
-            if adapter_options:
-                payload.update(adapter_options)
+            if self._needs_citation_followup(
+                citations=citations,
+                require_search=require_search,
+                return_citations=return_citations,
+                output_format=output_format,
+            ):
+                citation_payload = self._citation_followup_payload(
+                    text=text, model=model, adapter_options=adapter_options
+                )
+                self._merge_citations(citations, self._create_with_retry(citation_payload))
 
-            response = self._create_with_retry(payload)
-            response_dict = response.model_dump(mode="json") if hasattr(response, "model_dump") else {}
+            # If a forced search turn returns only tool blocks (no text), synthesize a final response.
+            if not text and require_search and self._has_web_search_result(response_dict):
+                synthesis_payload = self._synthesis_payload(
+                    prompt=prompt,
+                    response_dict=response_dict,
+                    model=model,
+                    output_format=output_format,
+                    adapter_options=adapter_options,
+                )
+                synthesis_dict = self._create_with_retry(synthesis_payload)
+                text = self._extract_text(synthesis_dict)
+                if return_citations:
+                    self._merge_citations(citations, synthesis_dict)
+                if text:
+                    response_dict = synthesis_dict
+
+            if not text and output_format is not None:
+                text = self._tool_input_fallback(response_dict)
+
+            return AdapterResponse(text=text, citations=citations, raw=response_dict)
+
+        except Exception as exc:  # pragma: no cover - network/provider behavior
+            raise ProviderError(f"Anthropic adapter failed: {exc}") from exc
+
+    @acached_response
+    async def arun(
+        self,
+        *,
+        prompt: PromptInput,
+        model: str,
+        require_search: bool,
+        return_citations: bool,
+        files: Sequence[Path] | None,
+        output_format: type[BaseModel] | None,
+        adapter_options: dict[str, Any] | None,
+    ) -> AdapterResponse:
+        del files  # unsupported in this adapter; caller should pass extracted text instead
+
+        try:
+            payload = self._build_payload(
+                prompt=prompt,
+                model=model,
+                require_search=require_search,
+                output_format=output_format,
+                adapter_options=adapter_options,
+            )
+            response_dict = await self._acreate_with_retry(payload)
             text = self._extract_text(response_dict)
 
             citations = self._extract_citations(response_dict) if return_citations else []
 
-            # Anthropic output schemas can omit citation blocks when output_config is active.
-            # If citations were requested but absent, issue a search-only pass to collect them.
-            # Skip this if skip_citation_followup is set (helps with rate limits on Tier 1 accounts).
-            if return_citations and require_search and output_format is not None and not citations and not self._skip_citation_followup:
-                structured_preview = text.strip()[:4000] if text else ""
-                citation_prompt = (
-                    "Use web search and return citations supporting this structured answer. "
-                    "Prefer official sources and include company homepages when relevant.\n\n"
-                    f"Structured answer:\n{structured_preview}"
-                )
-                citation_payload: dict[str, Any] = {
-                    "model": model,
-                    "max_tokens": int(self.provider_settings.get("max_tokens", 4096)),
-                    "messages": [
-                        {
-                            "role": "user",
-                            "content": [{"type": "text", "text": citation_prompt}],
-                        }
-                    ],
-                    "tools": [
-                        {
-                            "name": "web_search",
-                            "type": "web_search_20250305",
-                        }
-                    ],
-                    "tool_choice": {"type": "any"},
-                }
-                if adapter_options:
-                    citation_passthrough = dict(adapter_options)
-                    citation_passthrough.pop("output_config", None)
-                    citation_payload.update(citation_passthrough)
-
-                citation_response = self._create_with_retry(citation_payload)
-                citation_dict = (
-                    citation_response.model_dump(mode="json")
-                    if hasattr(citation_response, "model_dump")
-                    else {}
+            if self._needs_citation_followup(
+                citations=citations,
+                require_search=require_search,
+                return_citations=return_citations,
+                output_format=output_format,
+            ):
+                citation_payload = self._citation_followup_payload(
+                    text=text, model=model, adapter_options=adapter_options
                 )
-                existing_keys = {self._citation_key(c) for c in citations}
-                for extra in self._extract_citations(citation_dict):
-                    if self._citation_key(extra) not in existing_keys:
-                        citations.append(extra)
-                        existing_keys.add(self._citation_key(extra))
+                self._merge_citations(citations, await self._acreate_with_retry(citation_payload))
 
             # If a forced search turn returns only tool blocks (no text), synthesize a final response.
-            if not text:
-                has_search_result = self._has_web_search_result(response_dict)
-                if require_search and has_search_result:
-                    search_context = self._render_web_search_context(response_dict)
-                    prompt_text = self._prompt_as_text(prompt)
-                    synthesis_text = (
-                        f"{prompt_text}\n\n"
-                        "Web search results already gathered:\n"
-                        f"{search_context}\n\n"
-                        "Return the final answer now. "
-                        "If a JSON schema is required, return only valid JSON."
-                    )
-                    synthesis_payload: dict[str, Any] = {
-                        "model": model,
-                        "max_tokens": int(self.provider_settings.get("max_tokens", 4096)),
-                        "messages": [
-                            {
-                                "role": "user",
-                                "content": [{"type": "text", "text": synthesis_text}],
-                            }
-                        ],
-                    }
-                    if output_format is not None:
-                        synthesis_payload["output_config"] = {
-                            "format": {
-                                "type": "json_schema",
-                                "schema": anthropic_response_schema(output_format),
-                            }
-                        }
-                    if adapter_options:
-                        passthrough = dict(adapter_options)
-                        passthrough.pop("tools", None)
-                        passthrough.pop("tool_choice", None)
-                        synthesis_payload.update(passthrough)
-
-                    synthesis_response = self._create_with_retry(synthesis_payload)
-                    synthesis_dict = (
-                        synthesis_response.model_dump(mode="json")
-                        if hasattr(synthesis_response, "model_dump")
-                        else {}
-                    )
-                    text = self._extract_text(synthesis_dict)
-                    if return_citations:
-                        existing_keys = {self._citation_key(c) for c in citations}
-                        for extra in self._extract_citations(synthesis_dict):
-                            if self._citation_key(extra) not in existing_keys:
-                                citations.append(extra)
-                                existing_keys.add(self._citation_key(extra))
-
-                    if text:
-                        response_dict = synthesis_dict
-
-            # Last-resort fallback: some schema-compatible outputs may appear as tool-like input.
+            if not text and require_search and self._has_web_search_result(response_dict):
+                synthesis_payload = self._synthesis_payload(
+                    prompt=prompt,
+                    response_dict=response_dict,
+                    model=model,
+                    output_format=output_format,
+                    adapter_options=adapter_options,
+                )
+                synthesis_dict = await self._acreate_with_retry(synthesis_payload)
+                text = self._extract_text(synthesis_dict)
+                if return_citations:
+                    self._merge_citations(citations, synthesis_dict)
+                if text:
+                    response_dict = synthesis_dict
+
             if not text and output_format is not None:
-                for block in response_dict.get("content", []):
-                    if block.get("type") in {"tool_use", "server_tool_use"} and isinstance(block.get("input"), dict):
-                        text = json.dumps(block["input"], ensure_ascii=True)
-                        break
+                text = self._tool_input_fallback(response_dict)
 
             return AdapterResponse(text=text, citations=citations, raw=response_dict)
 
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, Sequence
 
 from pydantic import BaseModel
 
+from simpleai.cache import CacheBackend, cache_key, resolve_cache
+from simpleai.schema import _cached_model_schema
 from simpleai.types import AdapterResponse, PromptInput
 
 
@@ -19,6 +22,42 @@ class BaseAdapter(ABC):
 
     def __init__(self, provider_settings: dict[str, Any]) -> None:
         self.provider_settings = provider_settings
+        self.cache: CacheBackend | None = resolve_cache(provider_settings.get("cache"))
+
+    def _response_cache_key(self, call: dict[str, Any]) -> str | None:
+        """Return the exact-match cache key for a `run` call, or None to bypass the cache."""
+
+        if self.cache is None:
+            return None
+
+        adapter_options = call.get("adapter_options") or {}
+        # Only deterministic calls are safe to replay.
+        if adapter_options.get("temperature", 0) != 0:
+            return None
+
+        output_format = call.get("output_format")
+        files = []
+        for path in call.get("files") or ():
+            stat = path.stat()
+            files.append([str(path), stat.st_size, stat.st_mtime_ns])
+
+        return cache_key(
+            {
+                "provider": self.provider_name,
+                "settings": {
+                    key: value
+                    for key, value in self.provider_settings.items()
+                    if key not in ("api_key", "cache")
+                },
+                "model": call.get("model"),
+                "prompt": call.get("prompt"),
+                "require_search": call.get("require_search"),
+                "return_citations": call.get("return_citations"),
+                "output_format": _cached_model_schema(output_format) if output_format else None,
+                "files": files,
+                "adapter_options": adapter_options,
+            }
+        )
 
     @abstractmethod
     def run(
@@ -33,3 +72,31 @@ class BaseAdapter(ABC):
         adapter_options: dict[str, Any] | None,
     ) -> AdapterResponse:
         """Execute the prompt on the provider and return normalized output."""
+
+    async def arun(
+        self,
+        *,
+        prompt: PromptInput,
+        model: str,
+        require_search: bool,
+        return_citations: bool,
+        files: Sequence[Path] | None,
+        output_format: type[BaseModel] | None,
+        adapter_options: dict[str, Any] | None,
+    ) -> AdapterResponse:
+        """Async variant of `run`.
+
+        Defaults to running the sync implementation in a worker thread; adapters
+        with native async SDK clients override this.
+        """
+
+        return await asyncio.to_thread(
+            self.run,
+            prompt=prompt,
+            model=model,
+            require_search=require_search,
+            return_citations=return_citations,
+            files=files,
+            output_format=output_format,
+            adapter_options=adapter_options,
+        )
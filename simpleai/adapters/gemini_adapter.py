@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import logging
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Sequence
+from types import MappingProxyType
+from typing import Any, Mapping, Sequence
 
 from pydantic import BaseModel
 from tenacity import (
@@ -16,12 +18,27 @@ from tenacity import (
     wait_exponential,
 )
 
+from simpleai.adapters._http import LoopLocal, get_async_httpx, get_sync_httpx
 from simpleai.adapters.base import BaseAdapter
+from simpleai.cache import acached_response, cached_response
 from simpleai.exceptions import ProviderError
-from simpleai.types import AdapterResponse, Citation, PromptInput
+from simpleai.schema import output_model_schema
+from simpleai.types import AdapterResponse, Citation, LazyRaw, PromptInput
 
 logger = logging.getLogger(__name__)
 
+_EMPTY: tuple[Any, ...] = ()
+_EMPTY_MAP: Mapping[str, Any] = MappingProxyType({})
+
+
+@lru_cache(maxsize=1)
+def _sdk() -> tuple[Any, Any]:
+    """Resolve the google-genai modules once, on first use rather than at `import simpleai`."""
+    from google import genai
+    from google.genai import types
+
+    return genai, types
+
 
 def _is_retryable_gemini_error(exc: BaseException) -> bool:
     """Check if the exception from Gemini is retryable (e.g., 503 or 429)."""
@@ -37,8 +54,7 @@ class GeminiAdapter(BaseAdapter):
         super().__init__(provider_settings)
 
         try:
-            from google import genai
-            from google.genai import types
+            genai, types = _sdk()
         except Exception as exc:  # pragma: no cover - dependency missing path
             raise ProviderError("google-genai package is required for GeminiAdapter.") from exc
 
@@ -46,14 +62,20 @@ class GeminiAdapter(BaseAdapter):
         if use_vertexai is None:
             use_vertexai = str(os.getenv("GEMINI_USE_VERTEXAI", "")).lower() in ("true", "1", "yes")
 
+        self._http_options = types.HttpOptions(httpx_client=get_sync_httpx())
+
         if use_vertexai:
             project = provider_settings.get("vertexai_project") or os.getenv("GEMINI_VERTEXAI_PROJECT")
             location = provider_settings.get("vertexai_location") or os.getenv("GEMINI_VERTEXAI_LOCATION")
-            self.client = genai.Client(vertexai=True, project=project, location=location)
+            client_kwargs: dict[str, Any] = {"vertexai": True, "project": project, "location": location}
             self._project = project
         else:
             api_key = provider_settings.get("api_key") or os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
-            self.client = genai.Client(api_key=api_key)
+            client_kwargs = {"api_key": api_key}
+
+        self.client = genai.Client(**client_kwargs, http_options=self._http_options)
+        # The SDK binds its async transport at construction, so async calls get one client per loop.
+        self._aclients = LoopLocal(lambda: genai.Client(**client_kwargs, http_options=self._async_http_options()))
 
         self.types = types
         self._genai = genai
@@ -78,6 +100,29 @@ class GeminiAdapter(BaseAdapter):
                 uploaded = _upload(path)
                 contents.append(uploaded)
 
+        return self._finish_contents(contents, prompt)
+
+    async def _abuild_contents(self, prompt: PromptInput, files: Sequence[Path] | None, client: Any) -> Any:
+        contents: list[Any] = []
+
+        if files:
+            @retry(
+                retry=retry_if_exception(_is_retryable_gemini_error),
+                wait=wait_exponential(multiplier=1, min=2, max=120),
+                stop=stop_after_attempt(9),
+                before_sleep=before_sleep_log(logger, logging.WARNING),
+                reraise=True,
+            )
+            async def _upload(p: Path) -> Any:
+                return await client.aio.files.upload(file=str(p))
+
+            for path in files:
+                uploaded = await _upload(path)
+                contents.append(uploaded)
+
+        return self._finish_contents(contents, prompt)
+
+    def _finish_contents(self, contents: list[Any], prompt: PromptInput) -> Any:
         if isinstance(prompt, str):
             contents.append(prompt)
         else:
@@ -89,7 +134,9 @@ class GeminiAdapter(BaseAdapter):
 
     def _extract_citations(self, response_dict: dict[str, Any]) -> list[Citation]:
         citations: list[Citation] = []
+        append = citations.append
         seen: set[tuple[Any, ...]] = set()
+        provider = self.provider_name
 
         def append_citation(
             *,
@@ -105,9 +152,9 @@ class GeminiAdapter(BaseAdapter):
             if key in seen:
                 return
             seen.add(key)
-            citations.append(
+            append(
                 Citation(
-                    provider=self.provider_name,
+                    provider=provider,
                     url=url,
                     title=title,
                     source=source,
@@ -118,45 +165,52 @@ class GeminiAdapter(BaseAdapter):
                 )
             )
 
-        for candidate in response_dict.get("candidates", []):
+        for candidate in response_dict.get("candidates") or _EMPTY:
+            get = candidate.get
             # Citation metadata (inline offsets + URI/title).
-            citation_meta = candidate.get("citation_metadata") or candidate.get("citationMetadata") or {}
-            for item in citation_meta.get("citations") or []:
+            citation_meta = get("citation_metadata") or get("citationMetadata") or _EMPTY_MAP
+            for item in citation_meta.get("citations") or _EMPTY:
+                item_get = item.get
+                uri = item_get("uri")
                 append_citation(
-                    url=item.get("uri"),
-                    title=item.get("title"),
-                    source=item.get("uri"),
+                    url=uri,
+                    title=item_get("title"),
+                    source=uri,
                     snippet=None,
-                    start_index=item.get("start_index") or item.get("startIndex"),
-                    end_index=item.get("end_index") or item.get("endIndex"),
+                    start_index=item_get("start_index") or item_get("startIndex"),
+                    end_index=item_get("end_index") or item_get("endIndex"),
                     raw=item,
                 )
 
             # Grounding metadata from Google Search tool.
-            grounding = candidate.get("grounding_metadata") or candidate.get("groundingMetadata") or {}
-            chunks = grounding.get("grounding_chunks") or grounding.get("groundingChunks") or []
-            for chunk in chunks:
-                web = chunk.get("web") or {}
+            grounding = get("grounding_metadata") or get("groundingMetadata") or _EMPTY_MAP
+            grounding_get = grounding.get
+            for chunk in grounding_get("grounding_chunks") or grounding_get("groundingChunks") or _EMPTY:
+                chunk_get = chunk.get
+                web = chunk_get("web")
                 if web:
+                    url = web.get("uri") or web.get("url")
                     append_citation(
-                        url=web.get("uri") or web.get("url"),
+                        url=url,
                         title=web.get("title"),
-                        source=web.get("domain") or web.get("uri") or web.get("url"),
+                        source=web.get("domain") or url,
                         snippet=None,
                         raw=chunk,
                     )
 
-                retrieved = chunk.get("retrieved_context") or chunk.get("retrievedContext") or {}
+                retrieved = chunk_get("retrieved_context") or chunk_get("retrievedContext")
                 if retrieved:
+                    document_name = retrieved.get("document_name") or retrieved.get("documentName")
+                    uri = retrieved.get("uri")
                     append_citation(
-                        url=retrieved.get("uri"),
-                        title=retrieved.get("title") or retrieved.get("document_name") or retrieved.get("documentName"),
-                        source=retrieved.get("document_name") or retrieved.get("documentName") or retrieved.get("uri"),
+                        url=uri,
+                        title=retrieved.get("title") or document_name,
+                        source=document_name or uri,
                         snippet=retrieved.get("text"),
                         raw=chunk,
                     )
 
-                maps = chunk.get("maps") or {}
+                maps = chunk_get("maps")
                 if maps:
                     append_citation(
                         url=maps.get("uri"),
@@ -167,7 +221,7 @@ class GeminiAdapter(BaseAdapter):
                     )
 
             # Query metadata can still be useful provenance even when chunks are absent.
-            for query in grounding.get("web_search_queries") or grounding.get("webSearchQueries") or []:
+            for query in grounding_get("web_search_queries") or grounding_get("webSearchQueries") or _EMPTY:
                 append_citation(
                     url=None,
                     title=None,
@@ -178,6 +232,117 @@ class GeminiAdapter(BaseAdapter):
 
         return citations
 
+    def _async_http_options(self) -> Any:
+        return self.types.HttpOptions(httpx_client=get_sync_httpx(), httpx_async_client=get_async_httpx())
+
+    def _resolve_client(self, model: str) -> Any:
+        if getattr(self, "_use_vertexai", False) and model.startswith("gemini-3.1"):
+            return self._genai.Client(
+                vertexai=True,
+                project=self._project,
+                location="global",
+                http_options=self._http_options,
+            )
+        return self.client
+
+    def _resolve_aclient(self, model: str) -> Any:
+        if getattr(self, "_use_vertexai", False) and model.startswith("gemini-3.1"):
+            return self._genai.Client(
+                vertexai=True,
+                project=self._project,
+                location="global",
+                http_options=self._async_http_options(),
+            )
+        return self._aclients.get()
+
+    def _build_config_kwargs(
+        self,
+        *,
+        model: str,
+        require_search: bool,
+        output_format: type[BaseModel] | None,
+        adapter_options: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        default_max_tokens = 65536 if "gemini-3.1" in model else 8192
+        config_kwargs: dict[str, Any] = {
+            "max_output_tokens": int(self.provider_settings.get("max_output_tokens", default_max_tokens)),
+        }
+
+        if require_search:
+            config_kwargs["tools"] = [
+                self.types.Tool(google_search=self.types.GoogleSearch())
+            ]
+            config_kwargs.setdefault(
+                "system_instruction",
+                "Use Google Search to ground your answer and provide citations to sources. Ensure that all cited URLs are publicly accessible. Do not cite links that result in a 404 or 5xx error.",
+            )
+
+        if output_format is not None:
+            config_kwargs["response_mime_type"] = "application/json"
+            config_kwargs["response_schema"] = output_model_schema(output_format)
+
+        if adapter_options:
+            config_kwargs.update(adapter_options)
+
+        return config_kwargs
+
+    def _parse_response(
+        self,
+        response: Any,
+        *,
+        model: str,
+        config_kwargs: dict[str, Any],
+        return_citations: bool,
+        output_format: type[BaseModel] | None,
+    ) -> AdapterResponse:
+        text = getattr(response, "text", "") or ""
+        # Only dump the SDK model when the dict form is actually needed.
+        response_dict: dict[str, Any] | None = None
+        if return_citations or not text.strip():
+            response_dict = response.model_dump(mode="json") if hasattr(response, "model_dump") else {}
+        if not text and response_dict:
+            text = "\n".join(
+                filter(
+                    None,
+                    (
+                        part.get("text")
+                        for candidate in response_dict.get("candidates") or _EMPTY
+                        for part in (candidate.get("content") or _EMPTY_MAP).get("parts") or _EMPTY
+                    ),
+                )
+            )
+
+        if not text.strip():
+            raise ProviderError(f"Gemini returned empty response. Raw payload: {response_dict}")
+
+        # Check if generation was cut off
+        for fr in self._finish_reasons(response, response_dict):
+            if fr in ("MAX_TOKENS", "2"):
+                if output_format is not None:
+                    max_tokens = config_kwargs.get("max_output_tokens", "unknown")
+                    raise ProviderError(f"Gemini hit MAX_TOKENS before finishing the JSON response. Try increasing max_output_tokens (currently {max_tokens} for model {model}).")
+                else:
+                    logger.warning("Gemini hit MAX_TOKENS. The response may be incomplete.")
+
+        if response_dict is None:
+            return AdapterResponse(text=text, raw=LazyRaw(response))
+        citations = self._extract_citations(response_dict) if return_citations else []
+        return AdapterResponse(text=text, citations=citations, raw=response_dict)
+
+    def _finish_reasons(self, response: Any, response_dict: dict[str, Any] | None) -> list[str]:
+        if response_dict is not None:
+            return [
+                str(candidate.get("finish_reason") or candidate.get("finishReason") or "").upper()
+                for candidate in response_dict.get("candidates", [])
+            ]
+        reasons: list[str] = []
+        for candidate in getattr(response, "candidates", None) or ():
+            fr = getattr(candidate, "finish_reason", None)
+            # SDK enums expose the wire name via `.name`; proto values may be plain ints.
+            reasons.append(str(getattr(fr, "name", None) or fr or "").upper())
+        return reasons
+
+    @cached_response
     def run(
         self,
         *,
@@ -190,31 +355,13 @@ class GeminiAdapter(BaseAdapter):
         adapter_options: dict[str, Any] | None,
     ) -> AdapterResponse:
         try:
-            client = self.client
-            if getattr(self, "_use_vertexai", False) and model.startswith("gemini-3.1"):
-                client = self._genai.Client(vertexai=True, project=self._project, location="global")
-
-            default_max_tokens = 65536 if "gemini-3.1" in model else 8192
-            config_kwargs: dict[str, Any] = {
-                "max_output_tokens": int(self.provider_settings.get("max_output_tokens", default_max_tokens)),
-            }
-
-            if require_search:
-                config_kwargs["tools"] = [
-                    self.types.Tool(google_search=self.types.GoogleSearch())
-                ]
-                config_kwargs.setdefault(
-                    "system_instruction",
-                    "Use Google Search to ground your answer and provide citations to sources. Ensure that all cited URLs are publicly accessible. Do not cite links that result in a 404 or 5xx error.",
-                )
-
-            if output_format is not None:
-                config_kwargs["response_mime_type"] = "application/json"
-                config_kwargs["response_schema"] = output_format.model_json_schema()
-
-            if adapter_options:
-                config_kwargs.update(adapter_options)
-
+            client = self._resolve_client(model)
+            config_kwargs = self._build_config_kwargs(
+                model=model,
+                require_search=require_search,
+                output_format=output_format,
+                adapter_options=adapter_options,
+            )
             config = self.types.GenerateContentConfig(**config_kwargs)
             contents = self._build_contents(prompt, files, client=client)
 
@@ -232,34 +379,61 @@ class GeminiAdapter(BaseAdapter):
                     config=config,
                 )
 
-            response = _generate()
+            return self._parse_response(
+                _generate(),
+                model=model,
+                config_kwargs=config_kwargs,
+                return_citations=return_citations,
+                output_format=output_format,
+            )
 
-            response_dict = response.model_dump(mode="json") if hasattr(response, "model_dump") else {}
-            text = getattr(response, "text", "") or ""
-            if not text and response_dict:
-                chunks: list[str] = []
-                for candidate in response_dict.get("candidates", []):
-                    content = candidate.get("content") or {}
-                    for part in content.get("parts") or []:
-                        if part.get("text"):
-                            chunks.append(part["text"])
-                text = "\n".join(chunks)
-
-            if not text.strip():
-                raise ProviderError(f"Gemini returned empty response. Raw payload: {response_dict}")
-
-            # Check if generation was cut off
-            for candidate in response_dict.get("candidates", []):
-                fr = str(candidate.get("finish_reason") or candidate.get("finishReason") or "").upper()
-                if fr in ("MAX_TOKENS", "2"):
-                    if output_format is not None:
-                        max_tokens = config_kwargs.get("max_output_tokens", "unknown")
-                        raise ProviderError(f"Gemini hit MAX_TOKENS before finishing the JSON response. Try increasing max_output_tokens (currently {max_tokens} for model {model}).")
-                    else:
-                        logger.warning("Gemini hit MAX_TOKENS. The response may be incomplete.")
-
-            citations = self._extract_citations(response_dict) if return_citations else []
-            return AdapterResponse(text=text, citations=citations, raw=response_dict)
+        except Exception as exc:  # pragma: no cover - network/provider behavior
+            raise ProviderError(f"Gemini adapter failed: {exc}") from exc
+
+    @acached_response
+    async def arun(
+        self,
+        *,
+        prompt: PromptInput,
+        model: str,
+        require_search: bool,
+        return_citations: bool,
+        files: Sequence[Path] | None,
+        output_format: type[BaseModel] | None,
+        adapter_options: dict[str, Any] | None,
+    ) -> AdapterResponse:
+        try:
+            client = self._resolve_aclient(model)
+            config_kwargs = self._build_config_kwargs(
+                model=model,
+                require_search=require_search,
+                output_format=output_format,
+                adapter_options=adapter_options,
+            )
+            config = self.types.GenerateContentConfig(**config_kwargs)
+            contents = await self._abuild_contents(prompt, files, client=client)
+
+            @retry(
+                retry=retry_if_exception(_is_retryable_gemini_error),
+                wait=wait_exponential(multiplier=1, min=2, max=120),
+                stop=stop_after_attempt(7),
+                before_sleep=before_sleep_log(logger, logging.WARNING),
+                reraise=True,
+            )
+            async def _generate() -> Any:
+                return await client.aio.models.generate_content(
+                    model=model,
+                    contents=contents,
+                    config=config,
+                )
+
+            return self._parse_response(
+                await _generate(),
+                model=model,
+                config_kwargs=config_kwargs,
+                return_citations=return_citations,
+                output_format=output_format,
+            )
 
         except Exception as exc:  # pragma: no cover - network/provider behavior
             raise ProviderError(f"Gemini adapter failed: {exc}") from exc
@@ -9,6 +9,7 @@ from typing import Any, Sequence
 from pydantic import BaseModel
 
 from simpleai.adapters.base import BaseAdapter
+from simpleai.cache import cached_response
 from simpleai.exceptions import ProviderError
 from simpleai.types import AdapterResponse, Citation, PromptInput
 
@@ -144,6 +145,7 @@ class GrokAdapter(BaseAdapter):
             pass
         return raw
 
+    @cached_response
     def run(
         self,
         *,
@@ -2,26 +2,95 @@
 
 from __future__ import annotations
 
+import atexit
+import itertools
 import json
 import logging
+import queue
+import sys
 import threading
 import time
+import weakref
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Any, Mapping
 from uuid import uuid4
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
 
-# Global lock to ensure we only instrument once
+# httpx/requests are patched once per process; exchanges fan out to every live
+# PromptLogger with network_logging enabled.
 _instrumentation_lock = threading.Lock()
-_is_instrumented = False
+_active_loggers: list[weakref.ref[PromptLogger]] = []
+
+_noop_event_ids = itertools.count()
+
+# Background writer for simpleai's own log file (not used for Django loggers).
+_listener_lock = threading.Lock()
+_listener: QueueListener | None = None
+_queue_handler: QueueHandler | None = None
+
+
+def _dumps(payload: dict[str, Any], pretty: bool) -> str:
+    """Serialize a log payload, preferring orjson when it is installed."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(payload, default=str, option=option).decode("utf-8")
+        except TypeError:
+            # e.g. integers wider than 64 bits; the stdlib encoder handles them.
+            pass
+    return json.dumps(payload, default=str, ensure_ascii=True, indent=2 if pretty else None)
 
 
 def _is_django_configured() -> bool:
-    try:
-        from django.conf import settings as django_settings  # type: ignore
-    except Exception:
-        return False
-    return bool(getattr(django_settings, "configured", False))
+    # Only an already-imported django.conf can be configured; don't import Django here.
+    django_conf = sys.modules.get("django.conf")
+    return bool(getattr(getattr(django_conf, "settings", None), "configured", False))
+
+
+def _start_file_listener(handler: logging.Handler) -> QueueHandler:
+    """Hand `handler` to a background listener and return the enqueuing handler."""
+    global _listener, _queue_handler
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+        records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        _listener = QueueListener(records, handler)
+        _listener.start()
+        _queue_handler = QueueHandler(records)
+    return _queue_handler
+
+
+def _flush_file_listener() -> None:
+    with _listener_lock:
+        if _listener is not None:
+            # stop() drains the queue and joins the writer thread.
+            _listener.stop()
+            _listener.start()
+
+
+def _stop_file_listener() -> None:
+    """Drain and close simpleai's file handler; the next PromptLogger reattaches it."""
+    global _listener, _queue_handler
+    with _listener_lock:
+        listener, _listener = _listener, None
+        queue_handler, _queue_handler = _queue_handler, None
+    if listener is None:
+        return
+    logging.getLogger("simpleai").removeHandler(queue_handler)
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+atexit.register(_stop_file_listener)
 
 
 class PromptLogger:
@@ -31,6 +100,7 @@ class PromptLogger:
         self.settings = logging_settings or {}
         self.enabled = bool(self.settings.get("enabled", False))
         self.network_logging = bool(self.settings.get("network_logging", False))
+        self.pretty = bool(self.settings.get("pretty", False))
         self.logger: logging.Logger | None = None
 
         if not self.enabled:
@@ -39,7 +109,7 @@ class PromptLogger:
         self.logger = self._build_logger()
 
         if self.network_logging:
-            _instrument_network_libs(self)
+            _register_network_logger(self)
 
     def _build_logger(self) -> logging.Logger:
         if _is_django_configured():
@@ -51,24 +121,31 @@ class PromptLogger:
         logger.setLevel(logging.INFO)
         logger.propagate = False
 
-        if not logger.handlers:
+        if _queue_handler is None or _queue_handler not in logger.handlers:
             logfile = Path(str(self.settings.get("logfile_location") or "./simpleai.log"))
             logfile.parent.mkdir(parents=True, exist_ok=True)
-            handler = logging.FileHandler(logfile)
+            handler = logging.FileHandler(logfile, encoding="utf-8")
             formatter = logging.Formatter("%(message)s")
             handler.setFormatter(formatter)
-            logger.addHandler(handler)
+            logger.addHandler(_start_file_listener(handler))
 
         return logger
 
+    def flush(self) -> None:
+        """Block until queued records have been written to the log file."""
+        _flush_file_listener()
+
     def _emit(self, payload: dict[str, Any]) -> None:
         if not self.enabled or self.logger is None:
             return
 
         payload.setdefault("ts", time.time())
-        self.logger.info(json.dumps(payload, default=str, ensure_ascii=True))
+        self.logger.info(_dumps(payload, self.pretty))
 
     def log_start(self, args: dict[str, Any], adapter_payload: dict[str, Any]) -> str:
+        if not self.enabled:
+            # Callers still thread an id through log_end/log_error; skip the urandom read.
+            return f"noop-{next(_noop_event_ids)}"
         event_id = str(uuid4())
         self._emit(
             {
@@ -87,6 +164,8 @@ class PromptLogger:
         result_preview: str,
         citations_count: int,
     ) -> None:
+        if not self.enabled:
+            return
         ended_at = time.time()
         self._emit(
             {
@@ -107,6 +186,8 @@ class PromptLogger:
         error: Exception,
         context: dict[str, Any],
     ) -> None:
+        if not self.enabled:
+            return
         ended_at = time.time()
         self._emit(
             {
@@ -125,33 +206,63 @@ class PromptLogger:
 # --- Instrumentation Helpers ---
 
 
+_REDACTED_HEADERS = frozenset({"authorization", "api-key", "x-api-key", "x-auth-token"})
+
+
+def _is_listening(logger: PromptLogger) -> bool:
+    """True when an emitted INFO record would actually be handled."""
+    return logger.enabled and logger.logger is not None and logger.logger.isEnabledFor(logging.INFO)
+
+
 def _safe_header(key: str, value: Any) -> str:
     """Redact sensitive headers."""
-    if key.lower() in ("authorization", "api-key", "x-api-key", "x-auth-token"):
+    if key.lower() in _REDACTED_HEADERS:
         return "REDACTED"
     return str(value)
 
 
 def _sanitize_headers(headers: Mapping) -> dict[str, str]:
-    return {k: _safe_header(k, v) for k, v in headers.items()}
+    # Inlined `_safe_header`; httpx/requests header values are already str.
+    return {
+        k: "REDACTED" if k.lower() in _REDACTED_HEADERS else v if isinstance(v, str) else str(v)
+        for k, v in headers.items()
+    }
+
+
+DEFAULT_BODY_MAX_BYTES = 16384
 
 
-def _safe_body(body: Any, is_stream: bool = False) -> Any:
+def _body_limit(logger: PromptLogger) -> int:
+    return int(logger.settings.get("body_max_bytes", DEFAULT_BODY_MAX_BYTES))
+
+
+def _safe_body(body: Any, is_stream: bool = False, *, limit: int = DEFAULT_BODY_MAX_BYTES) -> Any:
     if is_stream:
         return "<streaming_content>"
-    if isinstance(body, bytes):
+    if isinstance(body, (bytes, bytearray, memoryview)):
+        body = bytes(body)
+        overflow = len(body) - limit if limit > 0 else 0
+        if overflow > 0:
+            body = body[:limit]
         try:
-            return body.decode("utf-8")
+            # A cut can split a multi-byte character, so only the truncated case is lenient.
+            text = body.decode("utf-8", "replace" if overflow > 0 else "strict")
         except Exception:
             return "<binary_content>"
+        if overflow > 0:
+            text += f"...<truncated {overflow} bytes>"
+        return text
+    if isinstance(body, str) and limit > 0 and len(body) > limit:
+        return body[:limit] + f"...<truncated {len(body) - limit} chars>"
     return body
 
 
 def _log_httpx_exchange(logger: PromptLogger, request: Any, response: Any) -> None:
     try:
         # httpx request/response objects
+        limit = _body_limit(logger)
         request_body = (
-            _safe_body(request.content) if hasattr(request, "content") else None
+            _safe_body(request.content, limit=limit) if hasattr(request, "content") else None
         )
 
         # Check if response is stream
@@ -168,7 +279,7 @@ def _log_httpx_exchange(logger: PromptLogger, request: Any, response: Any) -> No
             # consuming the stream or changing application behavior.
             response_body = _safe_body(None, is_stream=True)
         else:
-            response_body = _safe_body(getattr(response, "content", None), is_stream=False)
+            response_body = _safe_body(getattr(response, "content", None), is_stream=False, limit=limit)
 
         logger._emit(
             {
@@ -192,14 +303,15 @@ def _log_requests_exchange(logger: PromptLogger, response: Any) -> None:
     try:
         request = response.request
 
-        request_body = _safe_body(request.body)
+        limit = _body_limit(logger)
+        request_body = _safe_body(request.body, limit=limit)
 
         # In requests, if stream=True in call, content might not be available
         # raw response usually handles this, but response.content accesses it.
         # We rely on checking if internal content has been consumed or flag
         response_body = "<streaming/binary>"
         if hasattr(response, "_content") and response._content is not None:
-            response_body = _safe_body(response.content)
+            response_body = _safe_body(response.content, limit=limit)
         elif hasattr(response, "_content_consumed") and not response._content_consumed:
             response_body = "<streaming_content>"
 
@@ -220,31 +332,59 @@ def _log_requests_exchange(logger: PromptLogger, response: Any) -> None:
         pass
 
 
-def _instrument_network_libs(logger_instance: PromptLogger) -> None:
-    global _is_instrumented
-    with _instrumentation_lock:
-        if _is_instrumented:
-            return
+def _register_network_logger(logger_instance: PromptLogger) -> None:
+    _install_network_patches()
+    _active_loggers.append(weakref.ref(logger_instance, _forget_network_logger))
 
-        # 1. Patch httpx (Used by OpenAI, Anthropic)
-        try:
-            import httpx
 
-            _orig_httpx_send = httpx.Client.send
-            _orig_httpx_asend = httpx.AsyncClient.send
+def _forget_network_logger(ref: weakref.ref[PromptLogger]) -> None:
+    try:
+        _active_loggers.remove(ref)
+    except ValueError:
+        pass
+
 
-            def _instrumented_httpx_send(self, request, *args, **kwargs):
-                response = _orig_httpx_send(self, request, *args, **kwargs)
-                _log_httpx_exchange(logger_instance, request, response)
-                return response
+def _network_loggers() -> list[PromptLogger]:
+    """Live, listening PromptLoggers; one per underlying `logging.Logger`, newest first."""
+    chosen: dict[int, PromptLogger] = {}
+    for ref in reversed(tuple(_active_loggers)):
+        instance = ref()
+        if instance is not None and _is_listening(instance):
+            chosen.setdefault(id(instance.logger), instance)
+    return list(chosen.values())
 
-            async def _instrumented_httpx_asend(self, request, *args, **kwargs):
-                response = await _orig_httpx_asend(self, request, *args, **kwargs)
-                _log_httpx_exchange(logger_instance, request, response)
-                return response
 
-            httpx.Client.send = _instrumented_httpx_send
-            httpx.AsyncClient.send = _instrumented_httpx_asend
+@lru_cache(maxsize=1)
+def _install_network_patches() -> bool:
+    """Patch httpx/requests once per process; later calls are a cache hit."""
+    # lru_cache does not stop two first callers racing into the body, so the
+    # patch itself is guarded; the lock is never touched once cached.
+    with _instrumentation_lock:
+        # 1. Patch httpx (Used by OpenAI, Anthropic)
+        try:
+            import httpx
+
+            if not getattr(httpx.Client.send, "_simpleai_patched", False):
+                _orig_httpx_send = httpx.Client.send
+                _orig_httpx_asend = httpx.AsyncClient.send
+
+                def _instrumented_httpx_send(self, request, *args, **kwargs):
+                    response = _orig_httpx_send(self, request, *args, **kwargs)
+                    if _active_loggers:
+                        for logger_instance in _network_loggers():
+                            _log_httpx_exchange(logger_instance, request, response)
+                    return response
+
+                async def _instrumented_httpx_asend(self, request, *args, **kwargs):
+                    response = await _orig_httpx_asend(self, request, *args, **kwargs)
+                    if _active_loggers:
+                        for logger_instance in _network_loggers():
+                            _log_httpx_exchange(logger_instance, request, response)
+                    return response
+
+                _instrumented_httpx_send._simpleai_patched = True  # type: ignore[attr-defined]
+                httpx.Client.send = _instrumented_httpx_send
+                httpx.AsyncClient.send = _instrumented_httpx_asend
         except ImportError:
             pass
 
@@ -252,16 +392,19 @@ def _instrument_network_libs(logger_instance: PromptLogger) -> None:
         try:
             import requests
 
-            _orig_requests_request = requests.Session.request
+            if not getattr(requests.Session.request, "_simpleai_patched", False):
+                _orig_requests_request = requests.Session.request
 
-            def _instrumented_requests_request(self, method, url, *args, **kwargs):
-                response = _orig_requests_request(self, method, url, *args, **kwargs)
-                _log_requests_exchange(logger_instance, response)
-                return response
+                def _instrumented_requests_request(self, method, url, *args, **kwargs):
+                    response = _orig_requests_request(self, method, url, *args, **kwargs)
+                    if _active_loggers:
+                        for logger_instance in _network_loggers():
+                            _log_requests_exchange(logger_instance, response)
+                    return response
 
-            requests.Session.request = _instrumented_requests_request
+                _instrumented_requests_request._simpleai_patched = True  # type: ignore[attr-defined]
+                requests.Session.request = _instrumented_requests_request
         except ImportError:
             pass
 
-        _is_instrumented = True
-
+    return True
@@ -2,16 +2,39 @@
 
 from __future__ import annotations
 
+import asyncio
+import mimetypes
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Sequence
+from types import MappingProxyType
+from typing import Any, BinaryIO, Mapping, Sequence
 
 from pydantic import BaseModel
 
+from simpleai.adapters._http import LoopLocal, get_async_httpx, get_sync_httpx
 from simpleai.adapters.base import BaseAdapter
+from simpleai.cache import acached_response, cached_response
 from simpleai.exceptions import ProviderError
 from simpleai.schema import openai_response_schema
-from simpleai.types import AdapterResponse, Citation, PromptInput
+from simpleai.types import AdapterResponse, Citation, LazyRaw, PromptInput
+
+_EMPTY: tuple[Any, ...] = ()
+_EMPTY_MAP: Mapping[str, Any] = MappingProxyType({})
+
+
+@lru_cache(maxsize=1)
+def _sdk() -> tuple[Any, Any]:
+    """Resolve the SDK client classes once, on first use rather than at `import simpleai`."""
+    from openai import AsyncOpenAI, OpenAI
+
+    return OpenAI, AsyncOpenAI
+
+
+def _upload_part(path: Path, handle: BinaryIO) -> tuple[str, BinaryIO, str]:
+    """Multipart file tuple; httpx streams the open handle instead of buffering it."""
+    content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    return (path.name, handle, content_type)
 
 
 class OpenAIAdapter(BaseAdapter):
@@ -22,7 +45,7 @@ class OpenAIAdapter(BaseAdapter):
         super().__init__(provider_settings)
 
         try:
-            from openai import OpenAI
+            OpenAI, AsyncOpenAI = _sdk()
         except ImportError as exc:  # pragma: no cover - dependency missing path
             raise ProviderError("openai package is required for OpenAIAdapter.") from exc
 
@@ -33,7 +56,16 @@ class OpenAIAdapter(BaseAdapter):
         if base_url:
             kwargs["base_url"] = base_url
 
-        self.client = OpenAI(**kwargs)
+        # List prompts go out as one multi-part message unless callers need one message per turn.
+        self._split_turns = bool(provider_settings.get("split_turns", False))
+
+        self.client = OpenAI(**kwargs, http_client=get_sync_httpx())
+        self._aclients = LoopLocal(lambda: AsyncOpenAI(**kwargs, http_client=get_async_httpx()))
+
+    @property
+    def aclient(self) -> Any:
+        """Async SDK client bound to the running event loop."""
+        return self._aclients.get()
 
     def _build_input(self, prompt: PromptInput, file_ids: Sequence[str]) -> list[dict[str, Any]]:
         if isinstance(prompt, str):
@@ -44,13 +76,11 @@ class OpenAIAdapter(BaseAdapter):
                 }
             ]
         else:
-            messages = [
-                {
-                    "role": "user",
-                    "content": [{"type": "input_text", "text": str(turn)}],
-                }
-                for turn in prompt
-            ]
+            content = [{"type": "input_text", "text": text} for text in map(str, prompt)]
+            if self._split_turns:
+                messages = [{"role": "user", "content": [part]} for part in content]
+            else:
+                messages = [{"role": "user", "content": content}] if content else []
 
         if not messages:
             messages = [
@@ -69,7 +99,9 @@ class OpenAIAdapter(BaseAdapter):
 
     def _extract_citations(self, response_dict: dict[str, Any]) -> list[Citation]:
         citations: list[Citation] = []
+        append = citations.append
         seen: set[tuple[Any, ...]] = set()
+        provider = self.provider_name
 
         def append_citation(
             *,
@@ -84,9 +116,9 @@ class OpenAIAdapter(BaseAdapter):
             if key in seen:
                 return
             seen.add(key)
-            citations.append(
+            append(
                 Citation(
-                    provider=self.provider_name,
+                    provider=provider,
                     url=url,
                     title=title,
                     source=source,
@@ -96,26 +128,35 @@ class OpenAIAdapter(BaseAdapter):
                 )
             )
 
-        # 1) Message text annotations (inline citations in generated text).
-        for output in response_dict.get("output", []):
-            if output.get("type") != "message":
+        # Single pass over outputs; web_search_call sources are emitted after inline
+        # annotations so annotation citations keep priority in dedupe and ordering.
+        sources: list[dict[str, Any]] = []
+        for output in response_dict.get("output") or _EMPTY:
+            output_type = output.get("type")
+            if output_type == "web_search_call":
+                action = output.get("action")
+                if action:
+                    sources.extend(action.get("sources") or _EMPTY)
+                continue
+            if output_type != "message":
                 continue
 
-            for part in output.get("content", []):
-                for annotation in part.get("annotations") or []:
-                    url_citation = annotation.get("url_citation") or {}
-                    url = annotation.get("url") or url_citation.get("url")
-                    title = annotation.get("title") or url_citation.get("title")
-                    start_index = annotation.get("start_index")
+            # 1) Message text annotations (inline citations in generated text).
+            for part in output.get("content") or _EMPTY:
+                for annotation in part.get("annotations") or _EMPTY:
+                    get = annotation.get
+                    url_citation = get("url_citation") or _EMPTY_MAP
+                    url = get("url") or url_citation.get("url")
+                    start_index = get("start_index")
                     if start_index is None:
                         start_index = url_citation.get("start_index")
-                    end_index = annotation.get("end_index")
+                    end_index = get("end_index")
                     if end_index is None:
                         end_index = url_citation.get("end_index")
 
                     append_citation(
                         url=url,
-                        title=title,
+                        title=get("title") or url_citation.get("title"),
                         source=url,
                         start_index=start_index,
                         end_index=end_index,
@@ -123,25 +164,82 @@ class OpenAIAdapter(BaseAdapter):
                     )
 
         # 2) Full source list from web_search_call output (when include contains sources).
-        for output in response_dict.get("output", []):
-            if output.get("type") != "web_search_call":
-                continue
-            action = output.get("action") or {}
-            for src in action.get("sources") or []:
-                url = src.get("url")
-                title = src.get("title")
-                source_type = src.get("type") or src.get("source")
-                append_citation(
-                    url=url,
-                    title=title,
-                    source=source_type or url,
-                    start_index=None,
-                    end_index=None,
-                    raw=src,
-                )
+        for src in sources:
+            get = src.get
+            url = get("url")
+            append_citation(
+                url=url,
+                title=get("title"),
+                source=get("type") or get("source") or url,
+                start_index=None,
+                end_index=None,
+                raw=src,
+            )
 
         return citations
 
+    def _build_payload(
+        self,
+        *,
+        prompt: PromptInput,
+        model: str,
+        require_search: bool,
+        return_citations: bool,
+        file_ids: Sequence[str],
+        output_format: type[BaseModel] | None,
+        adapter_options: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        payload: dict[str, Any] = {
+            "model": model,
+            "input": self._build_input(prompt, file_ids),
+        }
+
+        if require_search:
+            payload["tools"] = [{"type": "web_search"}]
+            payload["tool_choice"] = "required"
+            if return_citations:
+                payload["include"] = ["web_search_call.action.sources"]
+
+        if output_format is not None:
+            payload["text"] = {
+                "format": {
+                    "type": "json_schema",
+                    "name": "simpleai_output",
+                    "schema": openai_response_schema(output_format),
+                    "strict": True,
+                }
+            }
+
+        if adapter_options:
+            payload.update(adapter_options)
+
+        return payload
+
+    def _parse_response(self, response: Any, return_citations: bool) -> AdapterResponse:
+        text = getattr(response, "output_text", "")
+        if text and not return_citations:
+            # Nothing needs the dict form; defer the dump until a caller reads `raw`.
+            return AdapterResponse(text=text, raw=LazyRaw(response))
+
+        response_dict = response.model_dump(mode="json") if hasattr(response, "model_dump") else {}
+        if not text and response_dict:
+            text = "".join(
+                filter(
+                    None,
+                    (
+                        part.get("text")
+                        for output in response_dict.get("output") or _EMPTY
+                        if output.get("type") == "message"
+                        for part in output.get("content") or _EMPTY
+                        if part.get("type") == "output_text"
+                    ),
+                )
+            )
+
+        citations = self._extract_citations(response_dict) if return_citations else []
+        return AdapterResponse(text=text, citations=citations, raw=response_dict)
+
+    @cached_response
     def run(
         self,
         *,
@@ -158,47 +256,21 @@ class OpenAIAdapter(BaseAdapter):
             if files:
                 for path in files:
                     with path.open("rb") as handle:
-                        uploaded = self.client.files.create(file=handle, purpose="user_data")
+                        uploaded = self.client.files.create(file=_upload_part(path, handle), purpose="user_data")
                     file_ids.append(uploaded.id)
 
-            payload: dict[str, Any] = {
-                "model": model,
-                "input": self._build_input(prompt, file_ids),
-            }
-
-            if require_search:
-                payload["tools"] = [{"type": "web_search"}]
-                payload["tool_choice"] = "required"
-                if return_citations:
-                    payload["include"] = ["web_search_call.action.sources"]
-
-            if output_format is not None:
-                payload["text"] = {
-                    "format": {
-                        "type": "json_schema",
-                        "name": "simpleai_output",
-                        "schema": openai_response_schema(output_format),
-                        "strict": True,
-                    }
-                }
-
-            if adapter_options:
-                payload.update(adapter_options)
+            payload = self._build_payload(
+                prompt=prompt,
+                model=model,
+                require_search=require_search,
+                return_citations=return_citations,
+                file_ids=file_ids,
+                output_format=output_format,
+                adapter_options=adapter_options,
+            )
 
             response = self.client.responses.create(**payload)
-            response_dict = response.model_dump(mode="json") if hasattr(response, "model_dump") else {}
-            text = getattr(response, "output_text", "")
-            if not text and response_dict:
-                chunks: list[str] = []
-                for output in response_dict.get("output", []):
-                    if output.get("type") != "message":
-                        continue
-                    for part in output.get("content", []):
-                        if part.get("type") == "output_text":
-                            chunks.append(part.get("text", ""))
-                text = "".join(chunks)
-
-            citations = self._extract_citations(response_dict) if return_citations else []
+            result = self._parse_response(response, return_citations)
 
             # Clean up uploaded files
             for file_id in file_ids:
@@ -207,49 +279,111 @@ class OpenAIAdapter(BaseAdapter):
                 except Exception:
                     pass  # Best-effort cleanup
 
-            return AdapterResponse(text=text, citations=citations, raw=response_dict)
+            return result
+
+        except Exception as exc:  # pragma: no cover - network/provider behavior
+            raise self._provider_error(exc) from exc
+
+    @acached_response
+    async def arun(
+        self,
+        *,
+        prompt: PromptInput,
+        model: str,
+        require_search: bool,
+        return_citations: bool,
+        files: Sequence[Path] | None,
+        output_format: type[BaseModel] | None,
+        adapter_options: dict[str, Any] | None,
+    ) -> AdapterResponse:
+        try:
+            file_ids = await self._upload_files(files) if files else []
+
+            payload = self._build_payload(
+                prompt=prompt,
+                model=model,
+                require_search=require_search,
+                return_citations=return_citations,
+                file_ids=file_ids,
+                output_format=output_format,
+                adapter_options=adapter_options,
+            )
+
+            response = await self.aclient.responses.create(**payload)
+            result = self._parse_response(response, return_citations)
+
+            await self._adelete_files(file_ids)
+            return result
 
         except Exception as exc:  # pragma: no cover - network/provider behavior
-            msg = f"OpenAI adapter failed: {exc}"
-
-            # OpenAI's python SDK stores response headers on `exc.response.headers` for API errors.
-            headers = getattr(exc, "headers", None)
-            response = getattr(exc, "response", None)
-            if not headers and response is not None:
-                headers = getattr(response, "headers", None)
-
-            if headers:
-                # Helpful identifiers
-                id_headers = [
-                    "x-request-id",
-                    "openai-request-id",
-                    "cf-ray",
-                ]
-                id_details = [
-                    f"{key}: {headers.get(key)}" for key in id_headers if headers.get(key) is not None
-                ]
-                if id_details:
-                    msg += "\n\nRequest identifiers:\n" + "\n".join(id_details)
-
-                # Rate limiting (docs: https://platform.openai.com/docs/guides/error-codes/api-errors)
-                relevant_headers = [
-                    "x-ratelimit-limit-requests",
-                    "x-ratelimit-limit-tokens",
-                    "x-ratelimit-remaining-requests",
-                    "x-ratelimit-remaining-tokens",
-                    "x-ratelimit-reset-requests",
-                    "x-ratelimit-reset-tokens",
-                ]
-                rate_details = [
-                    f"{key}: {headers.get(key)}"
-                    for key in relevant_headers
-                    if headers.get(key) is not None
-                ]
-                if rate_details:
-                    msg += "\n\nRate limit headers:\n" + "\n".join(rate_details)
-                else:
-                    # Many 429s with `insufficient_quota` are *billing/quota* issues, not rate limit issues,
-                    # and may not include rate limit headers.
-                    msg += "\n\nRate limit headers: (not present in provider response)"
-
-            raise ProviderError(msg) from exc
+            raise self._provider_error(exc) from exc
+
+    async def _upload_files(self, files: Sequence[Path]) -> list[str]:
+        """Upload files concurrently; on any failure, remove the ones that landed."""
+
+        async def upload(path: Path) -> str:
+            with path.open("rb") as handle:
+                uploaded = await self.aclient.files.create(file=_upload_part(path, handle), purpose="user_data")
+            return uploaded.id
+
+        results = await asyncio.gather(*(upload(path) for path in files), return_exceptions=True)
+        file_ids = [item for item in results if isinstance(item, str)]
+        for item in results:
+            if isinstance(item, BaseException):
+                await self._adelete_files(file_ids)
+                raise item
+        return file_ids
+
+    async def _adelete_files(self, file_ids: Sequence[str]) -> None:
+        async def delete(file_id: str) -> None:
+            try:
+                await self.aclient.files.delete(file_id)
+            except Exception:
+                pass  # Best-effort cleanup
+
+        await asyncio.gather(*(delete(file_id) for file_id in file_ids))
+
+    def _provider_error(self, exc: Exception) -> ProviderError:
+        msg = f"OpenAI adapter failed: {exc}"
+
+        # OpenAI's python SDK stores response headers on `exc.response.headers` for API errors.
+        headers = getattr(exc, "headers", None)
+        response = getattr(exc, "response", None)
+        if not headers and response is not None:
+            headers = getattr(response, "headers", None)
+
+        if headers:
+            # Helpful identifiers
+            id_headers = [
+                "x-request-id",
+                "openai-request-id",
+                "cf-ray",
+            ]
+            id_details = [
+                f"{key}: {headers.get(key)}" for key in id_headers if headers.get(key) is not None
+            ]
+            if id_details:
+                msg += "\n\nRequest identifiers:\n" + "\n".join(id_details)
+
+            # Rate limiting (docs: https://platform.openai.com/docs/guides/error-codes/api-errors)
+            relevant_headers = [
+                "x-ratelimit-limit-requests",
+                "x-ratelimit-limit-tokens",
+                "x-ratelimit-remaining-requests",
+                "x-ratelimit-remaining-tokens",
+                "x-ratelimit-reset-requests",
+                "x-ratelimit-reset-tokens",
+            ]
+            rate_details = [
+                f"{key}: {headers.get(key)}"
+                for key in relevant_headers
+                if headers.get(key) is not None
+            ]
+            if rate_details:
+                msg += "\n\nRate limit headers:\n" + "\n".join(rate_details)
+            else:
+                # Many 429s with `insufficient_quota` are *billing/quota* issues, not rate limit issues,
+                # and may not include rate limit headers.
+                msg += "\n\nRate limit headers: (not present in provider response)"
+
+        return ProviderError(msg)
@@ -12,9 +12,12 @@ from urllib.parse import urlparse
 from pydantic import BaseModel
 
 from simpleai.adapters.base import BaseAdapter
+from simpleai.cache import cached_response
 from simpleai.exceptions import ProviderError
 from simpleai.schema import perplexity_response_schema
-from simpleai.types import AdapterResponse, Citation, PromptInput
+from simpleai.types import AdapterResponse, Citation, LazyRaw, PromptInput
+
+_EMPTY: tuple[Any, ...] = ()
 
 
 class PerplexityAdapter(BaseAdapter):
@@ -201,6 +204,7 @@ class PerplexityAdapter(BaseAdapter):
 
         return source or url
 
+    @cached_response
     def run(
         self,
         *,
@@ -255,17 +259,24 @@ class PerplexityAdapter(BaseAdapter):
                 )
                 response = self.client.responses.create(**retry_payload)
 
-            response_dict = response.model_dump(mode="json") if hasattr(response, "model_dump") else {}
             text = getattr(response, "output_text", "") or ""
+            if text and not return_citations:
+                return AdapterResponse(text=text, raw=LazyRaw(response))
+
+            response_dict = response.model_dump(mode="json") if hasattr(response, "model_dump") else {}
             if not text and response_dict:
-                chunks: list[str] = []
-                for output in response_dict.get("output", []):
-                    if output.get("type") != "message":
-                        continue
-                    for part in output.get("content", []):
-                        if part.get("type") == "output_text":
-                            chunks.append(part.get("text", ""))
-                text = "".join(chunks)
+                text = "".join(
+                    filter(
+                        None,
+                        (
+                            part.get("text")
+                            for output in response_dict.get("output") or _EMPTY
+                            if output.get("type") == "message"
+                            for part in output.get("content") or _EMPTY
+                            if part.get("type") == "output_text"
+                        ),
+                    )
+                )
 
             citations = self._extract_citations(response_dict) if return_citations else []
             return AdapterResponse(text=text, citations=citations, raw=response_dict)
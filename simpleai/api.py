@@ -2,19 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Mapping
 
 from pydantic import BaseModel
 
-from .adapters import get_adapter
+from .adapters import BaseAdapter, get_adapter
 from .adapters.logging_adapter import PromptLogger
 from .exceptions import ProviderError, SettingsError, SimpleAIException
 from .files import collect_file_paths, extract_text_from_files
 from .model_registry import resolve_provider_and_model
 from .settings import expected_provider_env_vars, get_provider_api_key, load_settings
-from .types import PromptInput
+from .types import AdapterResponse, PromptInput
 from .utils import coerce_output, validate_citations
 
 
@@ -132,6 +134,196 @@ def _build_log_args(
 
 
 
+@dataclass(slots=True)
+class _PreparedRun:
+    """Resolved adapter call plus the logging context needed to finish it."""
+
+    provider: str
+    model: str
+    adapter: BaseAdapter
+    adapter_kwargs: dict[str, Any]
+    output_format: type[BaseModel] | None
+    return_citations: bool
+    validate_urls: bool
+    logger: PromptLogger
+    event_id: str
+    started_at: float
+
+
+_MAX_ATTEMPTS = 6  # initial attempt + up to 5 retries
+
+
+def _prepare_run(
+    prompt: PromptInput,
+    *,
+    require_search: bool,
+    return_citations: bool | None,
+    validate_urls: bool | None,
+    file: str | Path | None,
+    files: str | Path | Iterable[str | Path] | None,
+    binary_files: bool,
+    model: str | None,
+    output_format: type[BaseModel] | None,
+    settings_file: str | Path | None,
+    adapter_options: dict[str, Any] | None,
+    provider_kwargs: dict[str, Any],
+) -> _PreparedRun:
+    require_search_bool = bool(_coerce_bool(require_search, name="require_search", allow_none=False))
+    return_citations_bool = _coerce_bool(return_citations, name="return_citations", allow_none=True)
+    validate_urls_bool = _coerce_bool(validate_urls, name="validate_urls", allow_none=True)
+    binary_files_bool = bool(_coerce_bool(binary_files, name="binary_files", allow_none=False))
+
+    effective_return_citations = (
+        require_search_bool if return_citations_bool is None else bool(return_citations_bool)
+    )
+    if validate_urls_bool is None:
+        effective_validate_urls = effective_return_citations
+    else:
+        effective_validate_urls = bool(validate_urls_bool)
+    # Citations require grounded search context; citations always force search on.
+    effective_require_search = require_search_bool or effective_return_citations
+
+    settings = load_settings(settings_file)
+    provider, resolved_model = resolve_provider_and_model(settings, model)
+
+    providers = settings.get("providers", {})
+    provider_settings = providers.get(provider, {}) if isinstance(providers, Mapping) else {}
+    if not isinstance(provider_settings, Mapping):
+        raise SettingsError(f"Invalid settings for provider '{provider}'.")
+
+    # Loaded settings are read-only and shared; adapters get their own top-level dict.
+    provider_settings = dict(provider_settings)
+    if not provider_settings.get("api_key"):
+        provider_settings["api_key"] = get_provider_api_key(settings, provider)
+
+    if not provider_settings.get("api_key"):
+        env_vars = expected_provider_env_vars(provider)
+        env_hint = ", ".join(env_vars) if env_vars else "provider-specific env var"
+        raise SettingsError(
+            f"Missing API key for provider '{provider}'. "
+            f"Set providers.{provider}.api_key or one of: {env_hint}."
+        )
+
+    adapter = get_adapter(provider, provider_settings)
+
+    # File handling: binary upload if supported; otherwise append extracted text.
+    prompt_payload: PromptInput = prompt
+    adapter_files: list[Path] | None = None
+    file_paths = collect_file_paths(file=file, files=files)
+    if file_paths:
+        if binary_files_bool and adapter.supports_binary_files:
+            adapter_files = file_paths
+        else:
+            extracted = extract_text_from_files(file_paths)
+            prompt_payload = _append_extracted_files_to_prompt(
+                prompt_payload,
+                ((item.path, item.text) for item in extracted),
+            )
+
+    logger = PromptLogger(settings.get("logging", {}))
+    started_at = time.time()
+
+    combined_adapter_options: dict[str, Any] = {}
+    if adapter_options:
+        combined_adapter_options.update(adapter_options)
+    combined_adapter_options.update(provider_kwargs)
+
+    event_id = logger.log_start(
+        args=_build_log_args(
+            prompt=prompt,
+            require_search=effective_require_search,
+            return_citations=effective_return_citations,
+            validate_urls=effective_validate_urls,
+            file=file,
+            files=files,
+            binary_files=binary_files_bool,
+            model=model,
+            output_format=output_format,
+            provider_kwargs=provider_kwargs,
+        ),
+        adapter_payload={
+            "provider": provider,
+            "model": resolved_model,
+            "require_search": effective_require_search,
+            "return_citations": effective_return_citations,
+            "validate_urls": effective_validate_urls,
+            "binary_files": binary_files_bool,
+            "adapter_supports_binary": adapter.supports_binary_files,
+            "file_count": len(file_paths),
+            "params": _sanitize_dict(combined_adapter_options),
+        },
+    )
+
+    return _PreparedRun(
+        provider=provider,
+        model=resolved_model,
+        adapter=adapter,
+        adapter_kwargs={
+            "prompt": prompt_payload,
+            "model": resolved_model,
+            "require_search": effective_require_search,
+            "return_citations": effective_return_citations,
+            "files": adapter_files,
+            "output_format": output_format,
+            "adapter_options": combined_adapter_options or None,
+        },
+        output_format=output_format,
+        return_citations=effective_return_citations,
+        validate_urls=effective_validate_urls,
+        logger=logger,
+        event_id=event_id,
+        started_at=started_at,
+    )
+
+
+def _log_adapter_error(run: _PreparedRun, exc: Exception) -> None:
+    run.logger.log_error(
+        event_id=run.event_id,
+        started_at=run.started_at,
+        error=exc,
+        context={
+            "provider": run.provider,
+            "model": run.model,
+        },
+    )
+
+
+def _coerce_attempt(run: _PreparedRun, adapter_response: AdapterResponse, attempt: int) -> tuple[bool, Any]:
+    """Return `(done, result)`; `done` is False when a structured-output retry is due."""
+
+    try:
+        return True, coerce_output(adapter_response.text, run.output_format)
+    except ValueError as val_err:
+        if run.output_format is not None and attempt < _MAX_ATTEMPTS - 1:
+            run.logger.log_error(
+                event_id=run.event_id,
+                started_at=run.started_at,
+                error=val_err,
+                context={"provider": run.provider, "model": run.model, "attempt": attempt + 1, "message": "Validation failed, retrying"}
+            )
+            return False, None
+        # If we've exhausted attempts or if it's not a schema-related ValueError (though coerce_output raises ValueError)
+        raise
+
+
+def _finish_run(run: _PreparedRun, adapter_response: AdapterResponse, result: Any) -> Any:
+    if run.validate_urls and run.return_citations:
+        validate_citations(adapter_response.citations)
+
+    citations = [item.to_dict() for item in adapter_response.citations]
+
+    run.logger.log_end(
+        event_id=run.event_id,
+        started_at=run.started_at,
+        result_preview=adapter_response.text,
+        citations_count=len(citations),
+    )
+
+    if run.return_citations:
+        return result, citations
+    return result
+
+
 def run_prompt(
     prompt: PromptInput,
     *,
@@ -169,149 +361,97 @@ def run_prompt(
         If return_citations is True, returns (result, citations).
     """
     try:
-        require_search_bool = bool(_coerce_bool(require_search, name="require_search", allow_none=False))
-        return_citations_bool = _coerce_bool(return_citations, name="return_citations", allow_none=True)
-        validate_urls_bool = _coerce_bool(validate_urls, name="validate_urls", allow_none=True)
-        binary_files_bool = bool(_coerce_bool(binary_files, name="binary_files", allow_none=False))
-
-        effective_return_citations = (
-            require_search_bool if return_citations_bool is None else bool(return_citations_bool)
-        )
-        if validate_urls_bool is None:
-            effective_validate_urls = effective_return_citations
-        else:
-            effective_validate_urls = bool(validate_urls_bool)
-        # Citations require grounded search context; citations always force search on.
-        effective_require_search = require_search_bool or effective_return_citations
-
-        settings = load_settings(settings_file)
-        provider, resolved_model = resolve_provider_and_model(settings, model)
-
-        providers = settings.get("providers", {})
-        provider_settings = providers.get(provider, {}) if isinstance(providers, dict) else {}
-        if not isinstance(provider_settings, dict):
-            raise SettingsError(f"Invalid settings for provider '{provider}'.")
-
-        if not provider_settings.get("api_key"):
-            provider_settings = dict(provider_settings)
-            provider_settings["api_key"] = get_provider_api_key(settings, provider)
-
-        if not provider_settings.get("api_key"):
-            env_vars = expected_provider_env_vars(provider)
-            env_hint = ", ".join(env_vars) if env_vars else "provider-specific env var"
-            raise SettingsError(
-                f"Missing API key for provider '{provider}'. "
-                f"Set providers.{provider}.api_key or one of: {env_hint}."
-            )
-
-        adapter = get_adapter(provider, provider_settings)
-
-        # File handling: binary upload if supported; otherwise append extracted text.
-        prompt_payload: PromptInput = prompt
-        adapter_files: list[Path] | None = None
-        file_paths = collect_file_paths(file=file, files=files)
-        if file_paths:
-            if binary_files_bool and adapter.supports_binary_files:
-                adapter_files = file_paths
-            else:
-                extracted = extract_text_from_files(file_paths)
-                prompt_payload = _append_extracted_files_to_prompt(
-                    prompt_payload,
-                    ((item.path, item.text) for item in extracted),
-                )
-
-        logger = PromptLogger(settings.get("logging", {}))
-        started_at = time.time()
-
-        combined_adapter_options: dict[str, Any] = {}
-        if adapter_options:
-            combined_adapter_options.update(adapter_options)
-        combined_adapter_options.update(provider_kwargs)
-
-        event_id = logger.log_start(
-            args=_build_log_args(
-                prompt=prompt,
-                require_search=effective_require_search,
-                return_citations=effective_return_citations,
-                validate_urls=effective_validate_urls,
-                file=file,
-                files=files,
-                binary_files=binary_files_bool,
-                model=model,
-                output_format=output_format,
-                provider_kwargs=provider_kwargs,
-            ),
-            adapter_payload={
-                "provider": provider,
-                "model": resolved_model,
-                "require_search": effective_require_search,
-                "return_citations": effective_return_citations,
-                "validate_urls": effective_validate_urls,
-                "binary_files": binary_files_bool,
-                "adapter_supports_binary": adapter.supports_binary_files,
-                "file_count": len(file_paths),
-                "params": _sanitize_dict(combined_adapter_options),
-            },
+        run = _prepare_run(
+            prompt,
+            require_search=require_search,
+            return_citations=return_citations,
+            validate_urls=validate_urls,
+            file=file,
+            files=files,
+            binary_files=binary_files,
+            model=model,
+            output_format=output_format,
+            settings_file=settings_file,
+            adapter_options=adapter_options,
+            provider_kwargs=provider_kwargs,
         )
 
-        max_attempts = 6  # initial attempt + up to 5 retries
-        for attempt in range(max_attempts):
+        for attempt in range(_MAX_ATTEMPTS):
             try:
-                adapter_response = adapter.run(
-                    prompt=prompt_payload,
-                    model=resolved_model,
-                    require_search=effective_require_search,
-                    return_citations=effective_return_citations,
-                    files=adapter_files,
-                    output_format=output_format,
-                    adapter_options=combined_adapter_options or None,
-                )
+                adapter_response = run.adapter.run(**run.adapter_kwargs)
             except Exception as exc:
-                logger.log_error(
-                    event_id=event_id,
-                    started_at=started_at,
-                    error=exc,
-                    context={
-                        "provider": provider,
-                        "model": resolved_model,
-                    },
-                )
+                _log_adapter_error(run, exc)
                 if isinstance(exc, ProviderError):
                     raise
-                raise ProviderError(f"Provider '{provider}' failed: {exc}") from exc
+                raise ProviderError(f"Provider '{run.provider}' failed: {exc}") from exc
+            done, result = _coerce_attempt(run, adapter_response, attempt)
+            if done:
+                break
+
+        return _finish_run(run, adapter_response, result)
+    except SimpleAIException:
+        raise
+    except Exception as exc:
+        raise SimpleAIException(
+            f"run_prompt failed: {exc.__class__.__name__}: {exc}",
+            original_exception=exc,
+        ) from exc
 
-            try:
-                result = coerce_output(adapter_response.text, output_format)
-                break  # Successful validation
-            except ValueError as val_err:
-                if output_format is not None and attempt < max_attempts - 1:
-                    logger.log_error(
-                        event_id=event_id,
-                        started_at=started_at,
-                        error=val_err,
-                        context={"provider": provider, "model": resolved_model, "attempt": attempt + 1, "message": "Validation failed, retrying"}
-                    )
-                    continue
-                # If we've exhausted attempts or if it's not a schema-related ValueError (though coerce_output raises ValueError)
-                raise
-        if effective_validate_urls and effective_return_citations:
-            validate_citations(adapter_response.citations)
-            
-        citations = [item.to_dict() for item in adapter_response.citations]
-
-        logger.log_end(
-            event_id=event_id,
-            started_at=started_at,
-            result_preview=adapter_response.text,
-            citations_count=len(citations),
+
+async def arun_prompt(
+    prompt: PromptInput,
+    *,
+    require_search: bool = False,
+    return_citations: bool | None = None,
+    validate_urls: bool | None = None,
+    file: str | Path | None = None,
+    files: str | Path | Iterable[str | Path] | None = None,
+    binary_files: bool = True,
+    model: str | None = None,
+    output_format: type[BaseModel] | None = None,
+    settings_file: str | Path | None = None,
+    adapter_options: dict[str, Any] | None = None,
+    **provider_kwargs: Any,
+) -> Any:
+    """Async variant of `run_prompt` using the adapter's native `arun`.
+
+    Accepts the same arguments and returns the same shapes as `run_prompt`.
+    Settings loading, file extraction, and citation URL validation run in a
+    worker thread so the event loop is never blocked.
+    """
+    try:
+        run = await asyncio.to_thread(
+            _prepare_run,
+            prompt,
+            require_search=require_search,
+            return_citations=return_citations,
+            validate_urls=validate_urls,
+            file=file,
+            files=files,
+            binary_files=binary_files,
+            model=model,
+            output_format=output_format,
+            settings_file=settings_file,
+            adapter_options=adapter_options,
+            provider_kwargs=provider_kwargs,
         )
 
-        if effective_return_citations:
-            return result, citations
-        return result
+        for attempt in range(_MAX_ATTEMPTS):
+            try:
+                adapter_response = await run.adapter.arun(**run.adapter_kwargs)
+            except Exception as exc:
+                _log_adapter_error(run, exc)
+                if isinstance(exc, ProviderError):
+                    raise
+                raise ProviderError(f"Provider '{run.provider}' failed: {exc}") from exc
+            done, result = _coerce_attempt(run, adapter_response, attempt)
+            if done:
+                break
+
+        return await asyncio.to_thread(_finish_run, run, adapter_response, result)
+    except SimpleAIException:
+        raise
     except Exception as exc:
-        if isinstance(exc, SimpleAIException):
-            raise
         raise SimpleAIException(
             f"run_prompt failed: {exc.__class__.__name__}: {exc}",
             original_exception=exc,
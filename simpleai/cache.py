@@ -0,0 +1,192 @@
+"""Exact-match response cache for provider adapters.
+
+Caching is opt-in per provider via `providers.<name>.cache`:
+- `True` or `"memory"`: the process-wide `InMemoryLRU` backend.
+- any object implementing `CacheBackend` (e.g. `FileCache`, or a Redis wrapper).
+
+Loaded settings are frozen views that share backend instances rather than
+copying them; backends also return themselves from `__deepcopy__` so copies
+made by callers keep sharing the same store.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Protocol, runtime_checkable
+
+from .exceptions import SettingsError
+from .types import AdapterResponse, Citation
+from .utils import coerce_output
+
+DEFAULT_MAXSIZE = 1024
+
+
+@runtime_checkable
+class CacheBackend(Protocol):
+    """Key/value store for serialized adapter responses."""
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        ...
+
+    def set(self, key: str, value: dict[str, Any]) -> None:
+        ...
+
+
+class InMemoryLRU:
+    """Thread-safe bounded LRU cache."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> InMemoryLRU:
+        return self
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: dict[str, Any]) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class FileCache:
+    """One JSON file per key in a directory; safe to share across processes."""
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> FileCache:
+        return self
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        try:
+            return json.loads((self.directory / f"{key}.json").read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def set(self, key: str, value: dict[str, Any]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        target = self.directory / f"{key}.json"
+        tmp = target.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(value, default=str, ensure_ascii=True), encoding="utf-8")
+        os.replace(tmp, target)
+
+
+_default_backend = InMemoryLRU()
+
+
+def resolve_cache(value: Any) -> CacheBackend | None:
+    """Map a `providers.<name>.cache` setting to a backend."""
+
+    if value is None or value is False:
+        return None
+    if value is True or value == "memory":
+        return _default_backend
+    if isinstance(value, CacheBackend):
+        return value
+    raise SettingsError(f"Invalid cache setting: {value!r}. Use true, \"memory\", or a CacheBackend.")
+
+
+def cache_key(payload: dict[str, Any]) -> str:
+    """Stable SHA-256 key for a JSON-serializable payload."""
+
+    encoded = json.dumps(payload, sort_keys=True, default=str, ensure_ascii=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _serialize(response: AdapterResponse) -> dict[str, Any]:
+    return {
+        "text": response.text,
+        "citations": [item.to_dict() for item in response.citations],
+        "raw": dict(response.raw) if response.raw is not None else None,
+    }
+
+
+def _deserialize(value: dict[str, Any]) -> AdapterResponse:
+    # Rebuild fresh objects so callers can mutate citations (e.g. `is_alive`).
+    return AdapterResponse(
+        text=value["text"],
+        citations=[Citation(**item) for item in value.get("citations") or []],
+        raw=value.get("raw"),
+    )
+
+
+def _replayable(response: AdapterResponse, output_format: Any) -> bool:
+    """Whether a response satisfies the call's output schema.
+
+    Schema-invalid responses are never stored, and stale ones are not served, so
+    `run_prompt`'s validation retries reach the provider instead of replaying them.
+    """
+
+    if output_format is None:
+        return True
+    try:
+        coerce_output(response.text, output_format)
+    except ValueError:
+        return False
+    return True
+
+
+def cached_response(method: Callable[..., AdapterResponse]) -> Callable[..., AdapterResponse]:
+    """Serve `run` from the adapter's cache backend on an exact-match hit."""
+
+    @functools.wraps(method)
+    def wrapper(self: Any, **kwargs: Any) -> AdapterResponse:
+        key = self._response_cache_key(kwargs)
+        if key is None:
+            return method(self, **kwargs)
+        output_format = kwargs.get("output_format")
+        hit = self.cache.get(key)
+        if hit is not None:
+            cached = _deserialize(hit)
+            if _replayable(cached, output_format):
+                return cached
+        response = method(self, **kwargs)
+        if _replayable(response, output_format):
+            self.cache.set(key, _serialize(response))
+        return response
+
+    return wrapper
+
+
+def acached_response(
+    method: Callable[..., Awaitable[AdapterResponse]],
+) -> Callable[..., Awaitable[AdapterResponse]]:
+    """Async counterpart of `cached_response` for `arun`."""
+
+    @functools.wraps(method)
+    async def wrapper(self: Any, **kwargs: Any) -> AdapterResponse:
+        key = self._response_cache_key(kwargs)
+        if key is None:
+            return await method(self, **kwargs)
+        output_format = kwargs.get("output_format")
+        hit = self.cache.get(key)
+        if hit is not None:
+            cached = _deserialize(hit)
+            if _replayable(cached, output_format):
+                return cached
+        response = await method(self, **kwargs)
+        if _replayable(response, output_format):
+            self.cache.set(key, _serialize(response))
+        return response
+
+    return wrapper
@@ -1,9 +1,17 @@
 """File helpers for SimpleAI."""
 
-from .extractor import collect_file_paths, extract_text_from_file, extract_text_from_files
+from .extractor import (
+    collect_file_paths,
+    extract_pdf,
+    extract_text_from_file,
+    extract_text_from_files,
+    iter_pdf_pages,
+)
 
 __all__ = [
     "collect_file_paths",
+    "extract_pdf",
     "extract_text_from_file",
     "extract_text_from_files",
+    "iter_pdf_pages",
 ]
@@ -2,18 +2,24 @@
 
 from __future__ import annotations
 
+import io
+import itertools
 import json
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Iterable
-
-from pypdf import PdfReader
-from striprtf.striprtf import rtf_to_text
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, Sequence
 
+from simpleai._json import loads_json
 from simpleai.exceptions import FileExtractionError
 from simpleai.types import ExtractedFile
 
-_TEXT_EXTENSIONS = {".txt", ".md"}
-_SUPPORTED_EXTENSIONS = {".pdf", ".doc", ".docx", ".md", ".txt", ".json", ".rtf"}
+# Above this size, .json files are re-indented from a parse-event stream (ijson) when available.
+_JSON_STREAM_THRESHOLD = 4 * 1024 * 1024
+_JSON_SCALAR_ENCODER = json.JSONEncoder()
 
 
 def collect_file_paths(
@@ -22,89 +28,289 @@ def collect_file_paths(
 ) -> list[Path]:
     """Normalize `file`/`files` args into a de-duplicated Path list."""
 
-    values: list[str | Path] = []
+    values: Iterable[str | Path]
+    if files is None:
+        values = ()
+    elif isinstance(files, (str, Path)):
+        values = (files,)
+    else:
+        values = files
     if file is not None:
-        values.append(file)
-
-    if files is not None:
-        if isinstance(files, (str, Path)):
-            values.append(files)
-        else:
-            values.extend(list(files))
+        values = itertools.chain((file,), values)
 
-    normalized: list[Path] = []
-    seen: set[str] = set()
+    # Exact repeats are caught on the absolute spelling before paying for resolve();
+    # resolved keys still merge different spellings of the same file. No normpath here:
+    # collapsing ".." lexically would disagree with resolve() across symlinks.
+    cwd = os.getcwd()
+    seen_spellings: set[str] = set()
+    normalized: dict[str, Path] = {}
     for value in values:
-        path = Path(value).expanduser().resolve()
-        key = str(path)
-        if key in seen:
+        spelling = os.path.join(cwd, os.path.expanduser(value))
+        if spelling in seen_spellings:
             continue
-        seen.add(key)
-        normalized.append(path)
+        seen_spellings.add(spelling)
+        path = Path(spelling).resolve()
+        normalized.setdefault(str(path), path)
 
-    return normalized
+    return list(normalized.values())
 
 
+def _format_json(data: bytes) -> str:
+    """Re-serialize a JSON document with sorted keys and two-space indents.
 
-def extract_text_from_file(path: str | Path) -> str:
-    """Extract plain text from supported file types."""
+    orjson only speeds up parsing: output always comes from `json.dumps`, so the
+    text (ASCII escapes, float repr) is the same with or without orjson and
+    matches `_format_json_stream`.
+    """
+    return json.dumps(loads_json(data), indent=2, sort_keys=True)
+
+
+def _format_json_stream(handle: BinaryIO) -> str:
+    """Streaming equivalent of `json.dumps(json.load(handle), indent=2, sort_keys=True)`.
+
+    Members are rendered as soon as they are parsed, so no Python object tree is
+    built for the document; only the rendered text is held.
+    """
+    import ijson  # lazy import: only needed for large .json files
+
+    encode = _JSON_SCALAR_ENCODER.encode
+    # One frame per open container: object members go in a dict (the last duplicate key
+    # wins, as with json.loads), array items in a list.
+    stack: list[dict[str, str] | list[str]] = []
+    keys: list[str] = []
+    result = ""
+
+    def close(opening: str, closing: str, members: list[str]) -> str:
+        if not members:
+            return opening + closing
+        indent = "  " * len(stack)
+        inner = ",\n".join(f"{indent}  {member}" for member in members)
+        return f"{opening}\n{inner}\n{indent}{closing}"
+
+    for _prefix, event, value in ijson.parse(handle, use_float=True):
+        if event == "map_key":
+            keys[-1] = value
+            continue
+        if event == "start_map":
+            stack.append({})
+            keys.append("")
+            continue
+        if event == "start_array":
+            stack.append([])
+            continue
+
+        if event == "end_map":
+            members = stack.pop()
+            keys.pop()
+            rendered = close("{", "}", [f"{encode(key)}: {members[key]}" for key in sorted(members)])
+        elif event == "end_array":
+            rendered = close("[", "]", stack.pop())
+        else:
+            rendered = encode(value)
+
+        if not stack:
+            result = rendered
+        elif isinstance(stack[-1], dict):
+            stack[-1][keys[-1]] = rendered
+        else:
+            stack[-1].append(rendered)
+
+    return result
+
+
+def _stat_existing(file_path: Path) -> os.stat_result:
+    """One stat call doubles as the existence check; handlers reuse it for size/mtime."""
+    try:
+        return os.stat(file_path)
+    except OSError:
+        raise FileExtractionError(f"File does not exist: {file_path}") from None
+
+
+@lru_cache(maxsize=1)
+def _ijson_available() -> bool:
+    return find_spec("ijson") is not None
+
+
+@lru_cache(maxsize=1)
+def _fitz() -> Any:
+    """PyMuPDF module when installed (the `pdf` extra), else None; probed once."""
+    try:
+        import fitz  # type: ignore
+    except ImportError:
+        return None
+    return fitz
+
+
+def _iter_pdf_page_text(file_path: Path) -> Iterator[str]:
+    """Yield page text from a freshly opened document: PyMuPDF when installed, else pypdf."""
+    fitz = _fitz()
+    if fitz is not None:
+        with fitz.open(str(file_path)) as doc:
+            for index in range(doc.page_count):
+                yield doc[index].get_text("text")
+        return
+
+    from pypdf import PdfReader  # lazy import: pypdf is heavy and only needed for PDFs
+
+    for page in PdfReader(str(file_path)).pages:
+        yield page.extract_text() or ""
+
+
+@lru_cache(maxsize=8)
+def _open_pdf_reader(path: str, mtime_ns: int, size: int) -> tuple[Any, threading.Lock]:
+    """Parse a PDF once per (path, mtime, size) for `extract_pdf`; the lock guards the shared reader."""
+    from pypdf import PdfReader  # lazy import: pypdf is heavy and only needed for PDFs
+
+    return PdfReader(path), threading.Lock()
+
+
+def _pdf_page_texts(file_path: Path, stat: os.stat_result, pages: Sequence[int] | None = None) -> list[str]:
+    fitz = _fitz()
+    if fitz is not None:
+        # MuPDF is fast enough that reopening beats holding parsed documents in memory.
+        with fitz.open(str(file_path)) as doc:
+            indices = range(doc.page_count) if pages is None else pages
+            return [doc[index].get_text("text") for index in indices]
+
+    reader, lock = _open_pdf_reader(str(file_path), stat.st_mtime_ns, stat.st_size)
+    # pypdf reads objects lazily from one stream, so a reader is never shared across threads.
+    with lock:
+        if pages is None:
+            return [page.extract_text() or "" for page in reader.pages]
+        return [reader.pages[index].extract_text() or "" for index in pages]
+
+
+def extract_pdf(path: str | Path, pages: Sequence[int] | None = None) -> list[str]:
+    """Return the text of the selected PDF pages (all by default), in the order requested.
+
+    Uses PyMuPDF when it is installed and pypdf otherwise. With pypdf, the parsed
+    document is kept in a small LRU keyed by path, mtime and size, so repeated
+    extractions of an unchanged file skip re-parsing. Pages are extracted
+    serially: a pypdf reader cannot be shared across threads and its text
+    extraction holds the GIL. For parallelism across documents, use
+    `extract_text_from_files(..., use_processes=True)`.
+    """
 
     file_path = Path(path)
-    if not file_path.exists():
-        raise FileExtractionError(f"File does not exist: {file_path}")
+    stat = _stat_existing(file_path)
+    try:
+        return _pdf_page_texts(file_path, stat, pages)
+    except Exception as exc:
+        raise FileExtractionError(f"Failed extracting text from {file_path}: {exc}") from exc
 
-    ext = file_path.suffix.lower()
-    if ext not in _SUPPORTED_EXTENSIONS:
-        raise FileExtractionError(
-            f"Unsupported file extension '{ext}' for {file_path}. Supported: {sorted(_SUPPORTED_EXTENSIONS)}"
-        )
 
+def iter_pdf_pages(path: str | Path) -> Iterator[str]:
+    """Yield the text of each PDF page in order, without holding the whole document's text."""
+
+    file_path = Path(path)
+    _stat_existing(file_path)
     try:
-        if ext in _TEXT_EXTENSIONS:
-            return file_path.read_text(encoding="utf-8")
+        yield from _iter_pdf_page_text(file_path)
+    except Exception as exc:
+        raise FileExtractionError(f"Failed extracting text from {file_path}: {exc}") from exc
+
+
+def _read_text(file_path: Path, stat: os.stat_result) -> str:
+    return file_path.read_text(encoding="utf-8")
+
+
+def _read_json(file_path: Path, stat: os.stat_result) -> str:
+    if stat.st_size > _JSON_STREAM_THRESHOLD and _ijson_available():
+        try:
+            with file_path.open("rb") as handle:
+                return _format_json_stream(handle)
+        except Exception:
+            # ijson rejects a few inputs json accepts (NaN, trailing data); use the full parse.
+            pass
+    return _format_json(file_path.read_bytes())
+
 
-        if ext == ".json":
-            payload = json.loads(file_path.read_text(encoding="utf-8"))
-            return json.dumps(payload, indent=2, sort_keys=True)
+def _read_rtf(file_path: Path, stat: os.stat_result) -> str:
+    from striprtf.striprtf import rtf_to_text  # lazy import, like docx/textract
 
-        if ext == ".rtf":
-            return rtf_to_text(file_path.read_text(encoding="utf-8", errors="ignore"))
+    return rtf_to_text(file_path.read_bytes().decode("utf-8", errors="ignore"))
 
-        if ext == ".pdf":
-            reader = PdfReader(str(file_path))
-            parts: list[str] = []
-            for page in reader.pages:
-                parts.append(page.extract_text() or "")
-            return "\n".join(parts).strip()
 
-        if ext == ".docx":
-            from docx import Document  # lazy import for smaller import surface
+def _read_pdf(file_path: Path, stat: os.stat_result) -> str:
+    # A one-off read: stream pages from a fresh document instead of pinning a parsed
+    # reader in `extract_pdf`'s cache.
+    buffer = io.StringIO()
+    for index, text in enumerate(_iter_pdf_page_text(file_path)):
+        if index:
+            buffer.write("\n")
+        buffer.write(text)
+    return buffer.getvalue().strip()
 
-            doc = Document(str(file_path))
-            return "\n".join(paragraph.text for paragraph in doc.paragraphs).strip()
 
-        if ext == ".doc":
-            try:
-                import textract  # type: ignore
+def _read_docx(file_path: Path, stat: os.stat_result) -> str:
+    from docx import Document  # lazy import for smaller import surface
 
-                content = textract.process(str(file_path))
-                return content.decode("utf-8", errors="ignore").strip()
-            except (ImportError, OSError, RuntimeError):
-                # Fallback when optional doc extractors are unavailable.
-                return file_path.read_bytes().decode("latin-1", errors="ignore").strip()
+    doc = Document(str(file_path))
+    return "\n".join(paragraph.text for paragraph in doc.paragraphs).strip()
 
+
+def _read_doc(file_path: Path, stat: os.stat_result) -> str:
+    try:
+        import textract  # type: ignore
+
+        content = textract.process(str(file_path))
+        return content.decode("utf-8", errors="ignore").strip()
+    except (ImportError, OSError, RuntimeError):
+        # Fallback when optional doc extractors are unavailable.
+        return file_path.read_bytes().decode("latin-1", errors="ignore").strip()
+
+
+_HANDLERS: dict[str, Callable[[Path, os.stat_result], str]] = {
+    ".txt": _read_text,
+    ".md": _read_text,
+    ".json": _read_json,
+    ".rtf": _read_rtf,
+    ".pdf": _read_pdf,
+    ".docx": _read_docx,
+    ".doc": _read_doc,
+}
+_SUPPORTED_EXTENSIONS = frozenset(_HANDLERS)
+
+
+def extract_text_from_file(path: str | Path) -> str:
+    """Extract plain text from supported file types."""
+
+    file_path = Path(path)
+    stat = _stat_existing(file_path)
+
+    ext = file_path.suffix.lower()
+    handler = _HANDLERS.get(ext)
+    if handler is None:
+        raise FileExtractionError(
+            f"Unsupported file extension '{ext}' for {file_path}. Supported: {sorted(_SUPPORTED_EXTENSIONS)}"
+        )
+
+    try:
+        return handler(file_path, stat)
     except Exception as exc:
         raise FileExtractionError(f"Failed extracting text from {file_path}: {exc}") from exc
 
-    raise FileExtractionError(f"Unable to extract text from {file_path}")
 
+def extract_text_from_files(
+    paths: Iterable[str | Path],
+    *,
+    max_workers: int | None = None,
+    use_processes: bool = False,
+) -> list[ExtractedFile]:
+    """Extract text from a list of files.
 
+    Files are extracted concurrently on a thread pool (or a process pool with
+    `use_processes=True`, for CPU-heavy PDF/DOCX batches). Results keep input
+    order, and the first failing file in input order raises.
+    """
 
-def extract_text_from_files(paths: Iterable[str | Path]) -> list[ExtractedFile]:
-    """Extract text from a list of files."""
+    # Paths from `collect_file_paths` are already absolute; only resolve the rest.
+    resolved = [path if path.is_absolute() else path.expanduser().resolve() for path in map(Path, paths)]
+    if len(resolved) <= 1 or max_workers == 1:
+        return [ExtractedFile(path=path, text=extract_text_from_file(path)) for path in resolved]
 
-    extracted: list[ExtractedFile] = []
-    for item in paths:
-        path = Path(item).expanduser().resolve()
-        extracted.append(ExtractedFile(path=path, text=extract_text_from_file(path)))
-    return extracted
+    workers = max_workers or min(32, len(resolved))
+    executor_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    with executor_cls(max_workers=workers) as executor:
+        futures = [executor.submit(extract_text_from_file, path) for path in resolved]
+        return [ExtractedFile(path=path, text=future.result()) for path, future in zip(resolved, futures)]
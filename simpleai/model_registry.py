@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Any
+import re
+import sys
+from functools import lru_cache
+from typing import Any, Mapping
 
 from .exceptions import ModelResolutionError
-from .settings import canonical_provider_name, get_provider_api_key
+from .settings import canonical_provider_name, get_default_model, get_provider_api_key
 
 # Known model IDs from official provider model docs as of 2026-02-06.
 MODEL_PROVIDER_MAP: dict[str, str] = {
@@ -111,6 +114,8 @@ MODEL_PROVIDER_MAP: dict[str, str] = {
     "openai/gpt-4.1": "perplexity",
     "xai/grok-4-1": "perplexity",
 }
+# Keys are already lowercase; interning lets the per-prompt lookup hit on identity.
+MODEL_PROVIDER_MAP = {sys.intern(model): sys.intern(provider) for model, provider in MODEL_PROVIDER_MAP.items()}
 
 _PROVIDER_HINTS: dict[str, str] = {
     "openai": "openai",
@@ -127,25 +132,65 @@ _PROVIDER_HINTS: dict[str, str] = {
 }
 
 
-def _default_model(settings: dict[str, Any], provider: str) -> str:
-    provider_config = settings.get("providers", {}).get(provider, {})
-    model = provider_config.get("default_model") if isinstance(provider_config, dict) else None
+# One C-level scan finds every hint token; ties go to the earliest entry in
+# `_PROVIDER_HINTS`, which is the precedence the original per-token loop had.
+_HINT_RE = re.compile("|".join(map(re.escape, sorted(_PROVIDER_HINTS, key=len, reverse=True))))
+_HINT_RANK = {token: rank for rank, token in enumerate(_PROVIDER_HINTS)}
+
+
+def _match_provider_hint(requested_lower: str) -> str | None:
+    found = _HINT_RE.findall(requested_lower)
+    if not found:
+        return None
+    return min(found, key=_HINT_RANK.__getitem__)
+
+
+@lru_cache(maxsize=4096)
+def _lookup_provider(requested_lower: str) -> tuple[str, bool] | None:
+    """Return `(provider, is_alias)` for a lowered model/alias string, or None.
+
+    This part of resolution only reads the static tables above, so it is memoized;
+    call `clear_resolution_cache()` after changing those tables at runtime.
+    """
+
+    provider_alias = canonical_provider_name(requested_lower)
+    if provider_alias:
+        return provider_alias, True
+
+    mapped_provider = MODEL_PROVIDER_MAP.get(requested_lower)
+    if mapped_provider:
+        return mapped_provider, False
+
+    hint = _match_provider_hint(requested_lower)
+    if hint:
+        return _PROVIDER_HINTS[hint], False
+    return None
+
+
+def clear_resolution_cache() -> None:
+    """Forget memoized model-name lookups."""
+
+    _lookup_provider.cache_clear()
+
+
+def _default_model(settings: Mapping[str, Any], provider: str) -> str:
+    model = get_default_model(settings, provider)
     if model:
         return str(model)
     raise ModelResolutionError(f"No default model configured for provider '{provider}'.")
 
 
 
-def _provider_has_credentials(settings: dict[str, Any], provider: str) -> bool:
+def _provider_has_credentials(settings: Mapping[str, Any], provider: str) -> bool:
     return bool(get_provider_api_key(settings, provider))
 
 
 
-def select_default_provider(settings: dict[str, Any]) -> str:
+def select_default_provider(settings: Mapping[str, Any]) -> str:
     """Select first configured default provider with credentials."""
 
     defaults = settings.get("defaults", [])
-    if not isinstance(defaults, list):
+    if not isinstance(defaults, (list, tuple)):
         defaults = []
 
     canonical_defaults: list[str] = []
@@ -171,7 +216,7 @@ def select_default_provider(settings: dict[str, Any]) -> str:
 
 
 def resolve_provider_and_model(
-    settings: dict[str, Any],
+    settings: Mapping[str, Any],
     requested_model: str | None,
 ) -> tuple[str, str]:
     """Resolve canonical provider + model from user input and settings."""
@@ -181,19 +226,13 @@ def resolve_provider_and_model(
         return provider, _default_model(settings, provider)
 
     requested = requested_model.strip()
-    requested_lower = requested.lower()
-
-    provider_alias = canonical_provider_name(requested_lower)
-    if provider_alias:
-        return provider_alias, _default_model(settings, provider_alias)
-
-    mapped_provider = MODEL_PROVIDER_MAP.get(requested_lower)
-    if mapped_provider:
-        return mapped_provider, requested
-
-    for token, provider in _PROVIDER_HINTS.items():
-        if token in requested_lower:
-            return provider, requested
+    found = _lookup_provider(requested.lower())
+    if found is not None:
+        provider, is_alias = found
+        if is_alias:
+            # Alias defaults come from settings, so only the provider lookup is cached.
+            return provider, _default_model(settings, provider)
+        return provider, requested
 
     raise ModelResolutionError(
         "Unable to resolve provider for model "
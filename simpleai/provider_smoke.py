@@ -2,15 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Literal, Sequence
+from typing import Any, Callable, Literal, Mapping, Sequence
 
 from pydantic import BaseModel, Field
 
 from .adapters import ADAPTER_CLASSES
-from .api import run_prompt
+from .api import arun_prompt
 from .settings import canonical_provider_name, expected_provider_env_vars, get_provider_api_key, load_settings
 
 PROMPT = (
@@ -151,7 +152,102 @@ def _file_handling_mode(provider: str) -> str:
     return "binary upload" if supports_binary else "parsed text"
 
 
-def run_provider_matrix(
+async def _run_target(
+    target: ProviderTarget,
+    *,
+    settings: Mapping[str, Any],
+    file_path: Path,
+    settings_file: str | Path | None,
+    use_color: bool,
+) -> tuple[list[str], ProviderRunResult]:
+    """Run one provider target, buffering its output so concurrent runs do not interleave."""
+
+    lines: list[str] = []
+    emit = lines.append
+
+    _emit_provider_header(emit, use_color, target, file_path)
+    file_handling = _file_handling_mode(target.settings_provider)
+    emit(f"File handling: {file_handling}")
+
+    api_key = get_provider_api_key(settings, target.settings_provider)
+    if not api_key:
+        envs = expected_provider_env_vars(target.settings_provider)
+        msg = (
+            f"API key not set. Configure providers.{target.settings_provider}.api_key "
+            f"or env vars: {', '.join(envs)}"
+        )
+        emit(colorize(msg, "yellow", use_color))
+        return lines, ProviderRunResult(
+            display_name=target.display_name,
+            model_arg=target.model_arg,
+            status="missing_key",
+            message=msg,
+            file_handling=file_handling,
+        )
+
+    try:
+        response = await arun_prompt(
+            PROMPT,
+            output_format=JobHistory,
+            return_citations=True,
+            binary_files=True,
+            model=target.model_arg,
+            file=str(file_path),
+            settings_file=settings_file,
+        )
+
+        if not isinstance(response, tuple) or len(response) != 2:
+            raise ValueError("run_prompt did not return (result, citations) tuple")
+
+        result_obj, citations_obj = response
+
+        if not isinstance(result_obj, JobHistory):
+            raise TypeError(f"Expected JobHistory, got {type(result_obj).__name__}")
+        if not isinstance(citations_obj, list):
+            raise TypeError(f"Expected citations list, got {type(citations_obj).__name__}")
+        if not citations_obj:
+            raise ValueError("No citations returned")
+
+        citations: list[dict[str, Any]] = [
+            item if isinstance(item, dict) else {"raw": item}
+            for item in citations_obj
+        ]
+
+        emit(colorize("SUCCESS", "green", use_color))
+        emit("JobHistory:")
+        emit(result_obj.model_dump_json(indent=2))
+        emit(f"Citations returned: {len(citations)}")
+        for index, citation in enumerate(citations[:5], start=1):
+            label = citation.get("title") or citation.get("url") or citation.get("source") or "(no source label)"
+            emit(f"  {index}. {label}")
+        if len(citations) > 5:
+            emit(f"  ... and {len(citations) - 5} more")
+
+        return lines, ProviderRunResult(
+            display_name=target.display_name,
+            model_arg=target.model_arg,
+            status="success",
+            message=(
+                f"Structured output validated; "
+                f"{len(result_obj.latest_job_experiences)} experiences; {len(citations)} citations"
+            ),
+            file_handling=file_handling,
+            job_history=result_obj,
+            citations=citations,
+        )
+    except Exception as exc:  # pragma: no cover - intentionally runtime-facing
+        msg = _short_error(exc)
+        emit(colorize(f"FAILED: {msg}", "red", use_color))
+        return lines, ProviderRunResult(
+            display_name=target.display_name,
+            model_arg=target.model_arg,
+            status="failed",
+            message=msg,
+            file_handling=file_handling,
+        )
+
+
+async def arun_provider_matrix(
     *,
     file_path: Path,
     settings_file: str | Path | None = None,
@@ -159,93 +255,35 @@ def run_provider_matrix(
     emit: Callable[[str], None] = print,
     use_color: bool = True,
 ) -> list[ProviderRunResult]:
-    """Run the same structured+search prompt against each configured provider."""
+    """Run the same structured+search prompt against each configured provider concurrently."""
 
     settings = load_settings(settings_file)
     requested = _provider_filter(providers)
-    results: list[ProviderRunResult] = []
-
-    for target in PROVIDER_TARGETS:
-        if requested is not None and target.settings_provider not in requested and target.model_arg not in requested:
-            continue
-
-        _emit_provider_header(emit, use_color, target, file_path)
-        file_handling = _file_handling_mode(target.settings_provider)
-        emit(f"File handling: {file_handling}")
-
-        api_key = get_provider_api_key(settings, target.settings_provider)
-        if not api_key:
-            envs = expected_provider_env_vars(target.settings_provider)
-            msg = (
-                f"API key not set. Configure providers.{target.settings_provider}.api_key "
-                f"or env vars: {', '.join(envs)}"
-            )
-            emit(colorize(msg, "yellow", use_color))
-            results.append(
-                ProviderRunResult(
-                    display_name=target.display_name,
-                    model_arg=target.model_arg,
-                    status="missing_key",
-                    message=msg,
-                    file_handling=file_handling,
-                )
-            )
-            continue
-
-        try:
-            response = run_prompt(
-                PROMPT,
-                output_format=JobHistory,
-                return_citations=True,
-                binary_files=True,
-                model=target.model_arg,
-                file=str(file_path),
+    targets = [
+        target
+        for target in PROVIDER_TARGETS
+        if requested is None or target.settings_provider in requested or target.model_arg in requested
+    ]
+
+    outcomes = await asyncio.gather(
+        *(
+            _run_target(
+                target,
+                settings=settings,
+                file_path=file_path,
                 settings_file=settings_file,
+                use_color=use_color,
             )
+            for target in targets
+        ),
+        return_exceptions=True,
+    )
 
-            if not isinstance(response, tuple) or len(response) != 2:
-                raise ValueError("run_prompt did not return (result, citations) tuple")
-
-            result_obj, citations_obj = response
-
-            if not isinstance(result_obj, JobHistory):
-                raise TypeError(f"Expected JobHistory, got {type(result_obj).__name__}")
-            if not isinstance(citations_obj, list):
-                raise TypeError(f"Expected citations list, got {type(citations_obj).__name__}")
-            if not citations_obj:
-                raise ValueError("No citations returned")
-
-            citations: list[dict[str, Any]] = [
-                item if isinstance(item, dict) else {"raw": item}
-                for item in citations_obj
-            ]
-
-            emit(colorize("SUCCESS", "green", use_color))
-            emit("JobHistory:")
-            emit(result_obj.model_dump_json(indent=2))
-            emit(f"Citations returned: {len(citations)}")
-            for index, citation in enumerate(citations[:5], start=1):
-                label = citation.get("title") or citation.get("url") or citation.get("source") or "(no source label)"
-                emit(f"  {index}. {label}")
-            if len(citations) > 5:
-                emit(f"  ... and {len(citations) - 5} more")
-
-            results.append(
-                ProviderRunResult(
-                    display_name=target.display_name,
-                    model_arg=target.model_arg,
-                    status="success",
-                    message=(
-                        f"Structured output validated; "
-                        f"{len(result_obj.latest_job_experiences)} experiences; {len(citations)} citations"
-                    ),
-                    file_handling=file_handling,
-                    job_history=result_obj,
-                    citations=citations,
-                )
-            )
-        except Exception as exc:  # pragma: no cover - intentionally runtime-facing
-            msg = _short_error(exc)
+    results: list[ProviderRunResult] = []
+    for target, outcome in zip(targets, outcomes):
+        if isinstance(outcome, BaseException):
+            msg = _short_error(outcome)
+            _emit_provider_header(emit, use_color, target, file_path)
             emit(colorize(f"FAILED: {msg}", "red", use_color))
             results.append(
                 ProviderRunResult(
@@ -253,9 +291,15 @@ def run_provider_matrix(
                     model_arg=target.model_arg,
                     status="failed",
                     message=msg,
-                    file_handling=file_handling,
+                    file_handling=_file_handling_mode(target.settings_provider),
                 )
             )
+            continue
+
+        lines, result = outcome
+        for line in lines:
+            emit(line)
+        results.append(result)
 
     emit("\n" + "=" * 88)
     emit(colorize("Provider Summary", "bold", use_color))
@@ -271,3 +315,24 @@ def run_provider_matrix(
         emit(f"{item.display_name:<12} {status:<20} [{item.file_handling}] {item.message}")
 
     return results
+
+
+def run_provider_matrix(
+    *,
+    file_path: Path,
+    settings_file: str | Path | None = None,
+    providers: Sequence[str] | None = None,
+    emit: Callable[[str], None] = print,
+    use_color: bool = True,
+) -> list[ProviderRunResult]:
+    """Sync wrapper around `arun_provider_matrix` for scripts and management commands."""
+
+    return asyncio.run(
+        arun_provider_matrix(
+            file_path=file_path,
+            settings_file=settings_file,
+            providers=providers,
+            emit=emit,
+            use_color=use_color,
+        )
+    )
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
-from typing import Any, Iterable
+from functools import lru_cache
+from typing import Any, Iterable, Iterator
 
 from pydantic import BaseModel
 
@@ -23,69 +23,94 @@ ANTHROPIC_UNSUPPORTED_SCHEMA_KEYS = frozenset(
 )
 
 
+@lru_cache(maxsize=256)
+def _cached_model_schema(output_format: type[BaseModel]) -> dict[str, Any]:
+    # Shared across calls: never mutate the returned dict.
+    return output_format.model_json_schema()
+
+
 def output_model_schema(output_format: type[BaseModel]) -> dict[str, Any]:
-    """Return the Pydantic-generated JSON schema for an output model."""
+    """Return the Pydantic-generated JSON schema for an output model.
 
-    return output_format.model_json_schema()
+    Schema generation is memoized per model class; each call returns a private
+    copy because some provider SDKs mutate the schema they are given.
+    """
 
+    return _clone_tree(_cached_model_schema(output_format))
 
-def enforce_closed_objects(schema: dict[str, Any]) -> dict[str, Any]:
-    """Set additionalProperties=false on all object-like schema nodes."""
 
-    normalized = deepcopy(schema)
+_OBJECTISH_KEYS = ("properties", "required", "patternProperties", "additionalProperties")
+
+
+def _clone_tree(schema: Any) -> Any:
+    """Copy the dict/list skeleton of a JSON schema; scalar leaves are shared."""
+
+    root = dict(schema) if isinstance(schema, dict) else list(schema) if isinstance(schema, list) else schema
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        items = node.items() if isinstance(node, dict) else enumerate(node)
+        for key, value in items:
+            if isinstance(value, dict):
+                value = node[key] = dict(value)
+                stack.append(value)
+            elif isinstance(value, list):
+                value = node[key] = list(value)
+                stack.append(value)
+    return root
+
 
-    def walk(node: Any) -> None:
+def _iter_nodes(root: Any) -> Iterator[dict[str, Any]]:
+    """Yield every dict in the tree, parents before children.
+
+    Children are read after the parent has been yielded, so callers may rewrite a
+    node's values in place and the walk continues into the rewritten values.
+    """
+
+    stack = [root]
+    while stack:
+        node = stack.pop()
         if isinstance(node, dict):
-            node_type = node.get("type")
-            is_object = node_type == "object" or (
-                isinstance(node_type, list) and "object" in node_type
-            )
-            looks_objectish = any(
-                key in node
-                for key in ("properties", "required", "patternProperties", "additionalProperties")
-            )
-            if is_object or looks_objectish:
-                node["additionalProperties"] = False
-
-            for value in node.values():
-                walk(value)
-            return
-
-        if isinstance(node, list):
-            for item in node:
-                walk(item)
-
-    walk(normalized)
+            yield node
+            stack.extend(value for value in node.values() if isinstance(value, (dict, list)))
+        elif isinstance(node, list):
+            stack.extend(item for item in node if isinstance(item, (dict, list)))
+
+
+def _is_objectish(node: dict[str, Any]) -> bool:
+    node_type = node.get("type")
+    if node_type == "object" or (isinstance(node_type, list) and "object" in node_type):
+        return True
+    return any(key in node for key in _OBJECTISH_KEYS)
+
+
+def enforce_closed_objects(schema: dict[str, Any]) -> dict[str, Any]:
+    """Set additionalProperties=false on all object-like schema nodes."""
+
+    normalized = _clone_tree(schema)
+    for node in _iter_nodes(normalized):
+        if _is_objectish(node):
+            node["additionalProperties"] = False
     return normalized
 
 
 def strip_schema_keywords(schema: dict[str, Any], keys: Iterable[str]) -> dict[str, Any]:
     """Remove unsupported JSON Schema keywords recursively."""
 
-    keys_set = set(keys)
-    normalized = deepcopy(schema)
-
-    def walk(node: Any) -> None:
-        if isinstance(node, dict):
-            for key in list(node.keys()):
-                if key in keys_set:
-                    node.pop(key, None)
-                    continue
-                walk(node[key])
-            return
-
-        if isinstance(node, list):
-            for item in node:
-                walk(item)
-
-    walk(normalized)
+    keys_set = frozenset(keys)
+    normalized = _clone_tree(schema)
+    for node in _iter_nodes(normalized):
+        for key in keys_set.intersection(node):
+            del node[key]
     return normalized
 
 
-def _make_nullable(schema: dict[str, Any]) -> dict[str, Any]:
-    """Return a schema variant that accepts null as a value."""
+def _make_nullable(node: dict[str, Any]) -> dict[str, Any]:
+    """Return a schema variant that accepts null as a value.
 
-    node = deepcopy(schema)
+    `node` must be privately owned by the caller: it may be updated in place or
+    reused inside the returned wrapper.
+    """
 
     # Already nullable.
     node_type = node.get("type")
@@ -111,12 +136,12 @@ def _make_nullable(schema: dict[str, Any]) -> dict[str, Any]:
     # OpenAI Structured Outputs do not support type: [type, "null"].
     # They require anyOf: [{type: type}, {type: "null"}].
     if isinstance(node_type, str):
-        new_node = deepcopy(node)
+        new_node = dict(node)
         new_node.pop("type", None)
         return {"anyOf": [{"type": node_type}, {"type": "null"}], **new_node}
 
     if isinstance(node_type, list):
-        new_node = deepcopy(node)
+        new_node = dict(node)
         new_node.pop("type", None)
         types = [{"type": t} for t in node_type if t != "null"] + [{"type": "null"}]
         return {"anyOf": types, **new_node}
@@ -128,64 +153,114 @@ def _make_nullable(schema: dict[str, Any]) -> dict[str, Any]:
 def enforce_openai_required_all_properties(schema: dict[str, Any]) -> dict[str, Any]:
     """OpenAI strict mode requires all object properties to be listed in required."""
 
-    normalized = deepcopy(schema)
+    normalized = _clone_tree(schema)
+    for node in _iter_nodes(normalized):
+        if not _is_objectish(node):
+            continue
+        properties = node.get("properties")
+        if isinstance(properties, dict):
+            all_keys = list(properties)
+            if node.get("required") == all_keys:
+                continue  # Already compliant: nothing optional to make nullable.
+            required = set(node.get("required") or [])
+            for key in all_keys:
+                if key not in required and isinstance(properties.get(key), dict):
+                    properties[key] = _make_nullable(properties[key])
+            node["required"] = all_keys
+        elif "required" not in node:
+            # Even if no properties are present, OpenAI wants 'required' array.
+            node["required"] = []
+    return normalized
 
-    def walk(node: Any) -> None:
-        if isinstance(node, dict):
-            node_type = node.get("type")
-            is_object = node_type == "object" or (
-                isinstance(node_type, list) and "object" in node_type
-            )
-            looks_objectish = any(
-                key in node
-                for key in ("properties", "required", "patternProperties", "additionalProperties")
-            )
-
-            if is_object or looks_objectish:
-                if "properties" in node and isinstance(node["properties"], dict):
-                    properties = node["properties"]
+
+# OpenAI Structured Outputs (strict mode) does not support 'default' or 'title'.
+OPENAI_UNSUPPORTED_SCHEMA_KEYS = frozenset({"default", "title"})
+
+
+def _close_and_strip(schema: dict[str, Any], keys: frozenset[str]) -> dict[str, Any]:
+    """Fused `enforce_closed_objects` + `strip_schema_keywords` in one walk."""
+
+    normalized = _clone_tree(schema)
+    for node in _iter_nodes(normalized):
+        if _is_objectish(node):
+            node["additionalProperties"] = False
+        for key in keys.intersection(node):
+            del node[key]
+    return normalized
+
+
+def _normalize_openai(schema: dict[str, Any]) -> dict[str, Any]:
+    """Single-walk equivalent of closed objects -> required-all -> keyword strip."""
+
+    normalized = _clone_tree(schema)
+    optional: list[tuple[dict[str, Any], str]] = []
+    for node in _iter_nodes(normalized):
+        if _is_objectish(node):
+            node["additionalProperties"] = False
+            properties = node.get("properties")
+            if isinstance(properties, dict):
+                all_keys = list(properties)
+                # Nodes already requiring every property in order need no rewrite.
+                if node.get("required") != all_keys:
                     required = set(node.get("required") or [])
-                    all_keys = list(properties.keys())
-                    for key in all_keys:
-                        if key not in required and isinstance(properties.get(key), dict):
-                            properties[key] = _make_nullable(properties[key])
+                    optional.extend(
+                        (properties, key)
+                        for key in all_keys
+                        if key not in required and isinstance(properties[key], dict)
+                    )
                     node["required"] = all_keys
-                else:
-                    # Even if no properties are present, OpenAI wants 'required' array.
-                    if "required" not in node:
-                        node["required"] = []
+            elif "required" not in node:
+                node["required"] = []
+        for key in OPENAI_UNSUPPORTED_SCHEMA_KEYS.intersection(node):
+            del node[key]
+
+    # Nullable wrappers are applied after the walk, as the staged pipeline did:
+    # the property bodies are already normalized and new `{"type": ...}` members
+    # only pick up `required`, never `additionalProperties`.
+    for properties, key in optional:
+        node = properties.get(key)
+        if not isinstance(node, dict):
+            continue  # Property named like a stripped keyword.
+        wrapped = properties[key] = _make_nullable(node)
+        if wrapped is not node:
+            for member in wrapped["anyOf"]:
+                if member is not node and member.get("type") == "object":
+                    member["required"] = []
+    return normalized
 
-            for value in node.values():
-                walk(value)
-            return
 
-        if isinstance(node, list):
-            for item in node:
-                walk(item)
+# Provider schemas are pure functions of the model class, so each is computed once
+# per class; the public builders hand out private copies of the cached result.
 
-    walk(normalized)
-    return normalized
+
+@lru_cache(maxsize=256)
+def _cached_openai_schema(output_format: type[BaseModel]) -> dict[str, Any]:
+    return _normalize_openai(_cached_model_schema(output_format))
+
+
+@lru_cache(maxsize=256)
+def _cached_anthropic_schema(output_format: type[BaseModel]) -> dict[str, Any]:
+    return _close_and_strip(_cached_model_schema(output_format), ANTHROPIC_UNSUPPORTED_SCHEMA_KEYS)
+
+
+@lru_cache(maxsize=256)
+def _cached_perplexity_schema(output_format: type[BaseModel]) -> dict[str, Any]:
+    return enforce_closed_objects(_cached_model_schema(output_format))
 
 
 def openai_response_schema(output_format: type[BaseModel]) -> dict[str, Any]:
     """Build strict-schema payload for OpenAI Responses API."""
 
-    schema = output_model_schema(output_format)
-    schema = enforce_closed_objects(schema)
-    schema = enforce_openai_required_all_properties(schema)
-    # OpenAI Structured Outputs (strict mode) does not support 'default' or 'title'.
-    # We strip these LAST to ensure we catch everything.
-    return strip_schema_keywords(schema, ["default", "title"])
+    return _clone_tree(_cached_openai_schema(output_format))
 
 
 def anthropic_response_schema(output_format: type[BaseModel]) -> dict[str, Any]:
     """Build output schema compatible with Anthropic output_config constraints."""
 
-    schema = enforce_closed_objects(output_model_schema(output_format))
-    return strip_schema_keywords(schema, ANTHROPIC_UNSUPPORTED_SCHEMA_KEYS)
+    return _clone_tree(_cached_anthropic_schema(output_format))
 
 
 def perplexity_response_schema(output_format: type[BaseModel]) -> dict[str, Any]:
     """Build JSON schema payload for Perplexity responses."""
 
-    return enforce_closed_objects(output_model_schema(output_format))
+    return _clone_tree(_cached_perplexity_schema(output_format))
@@ -11,14 +11,35 @@ from __future__ import annotations
 import json
 import os
 import sys
-from collections.abc import Mapping
-from copy import deepcopy
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+from ._json import loads_json
 from .exceptions import SettingsError
 
-DEFAULT_SETTINGS: dict[str, Any] = {
+
+def _freeze(obj: Any) -> Any:
+    """Read-only deep view: mappings become MappingProxyType, lists become tuples.
+
+    String keys are interned, so lookups with literal keys ("providers", "api_key")
+    match on identity.
+    """
+
+    if isinstance(obj, Mapping):
+        return MappingProxyType(
+            {sys.intern(key) if type(key) is str else key: _freeze(value) for key, value in obj.items()}
+        )
+    if isinstance(obj, list):
+        return tuple(_freeze(item) for item in obj)
+    return obj
+
+
+# Read-only, so merges can share its nested values instead of deep-copying them.
+DEFAULT_SETTINGS: Mapping[str, Any] = _freeze({
     "defaults": ["gemini", "openai", "claude", "grok", "perplexity"],
     "providers": {
         "gemini": {
@@ -56,10 +77,12 @@ DEFAULT_SETTINGS: dict[str, Any] = {
     "logging": {
         "enabled": False,
         "network_logging": False,
+        "pretty": False,
+        "body_max_bytes": 16384,
         "django_logfile": "django",
         "logfile_location": "./simpleai.log",
     },
-}
+})
 
 PROVIDER_ENV_VARS: dict[str, tuple[str, ...]] = {
     "gemini": ("GEMINI_API_KEY", "GOOGLE_API_KEY"),
@@ -69,7 +92,8 @@ PROVIDER_ENV_VARS: dict[str, tuple[str, ...]] = {
     "perplexity": ("PERPLEXITY_API_KEY", "PPLX_API_KEY"),
 }
 
-_PROVIDER_ALIASES = {
+# Frozen at import; read on every settings normalization and model resolution.
+_PROVIDER_ALIASES: Mapping[str, str] = MappingProxyType({
     "google": "gemini",
     "gemini": "gemini",
     "anthropic": "claude",
@@ -80,24 +104,11 @@ _PROVIDER_ALIASES = {
     "xai": "grok",
     "perplexity": "perplexity",
     "perplexityai": "perplexity",
-}
+})
 
 _APP_ROOT_MARKERS = ("pyproject.toml", "setup.py", "manage.py", ".git")
 
 
-def _dedupe_paths(paths: list[Path]) -> list[Path]:
-    deduped: list[Path] = []
-    seen: set[str] = set()
-
-    for path in paths:
-        key = str(path.resolve()) if path.exists() else str(path)
-        if key in seen:
-            continue
-        seen.add(key)
-        deduped.append(path)
-    return deduped
-
-
 def canonical_provider_name(name: str) -> str | None:
     """Return canonical provider key for aliases."""
 
@@ -105,12 +116,12 @@ def canonical_provider_name(name: str) -> str | None:
 
 
 
-def _deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
-    merged = deepcopy(base)
+def _deep_merge(base: Mapping[str, Any], override: Mapping[str, Any]) -> dict[str, Any]:
+    # Copies one level per overridden mapping; untouched values are shared with `base`.
+    merged = dict(base)
     for key, value in override.items():
-        if isinstance(value, Mapping) and isinstance(merged.get(key), dict):
-            # Convert Mapping to dict for recursive merge
-            merged[key] = _deep_merge(merged[key], dict(value))
+        if isinstance(value, Mapping) and isinstance(merged.get(key), Mapping):
+            merged[key] = _deep_merge(merged[key], value)
         else:
             merged[key] = value
     return merged
@@ -118,14 +129,14 @@ def _deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any
 
 
 def _normalize_user_settings(raw: dict[str, Any]) -> dict[str, Any]:
-    normalized = deepcopy(raw)
+    # Only top-level keys are replaced, so a shallow copy keeps `raw` untouched.
+    normalized = dict(raw)
 
     providers_raw = normalized.get("providers") or normalized.get("provider") or {}
-    providers_normalized: dict[str, Any] = {}
-    for key, value in providers_raw.items():
-        canonical = canonical_provider_name(str(key)) or str(key).lower()
-        providers_normalized[canonical] = value
-    normalized["providers"] = providers_normalized
+    normalized["providers"] = {
+        sys.intern(canonical_provider_name(str(key)) or str(key).lower()): value
+        for key, value in providers_raw.items()
+    }
 
     defaults_raw = normalized.get("defaults")
     if isinstance(defaults_raw, list):
@@ -144,10 +155,12 @@ def _normalize_user_settings(raw: dict[str, Any]) -> dict[str, Any]:
 
 
 def _load_from_django() -> dict[str, Any] | None:
-    try:
-        from django.conf import settings as django_settings  # type: ignore
-    except Exception:
+    # Django settings can only be configured once django.conf has been imported, so
+    # never import it here: pure-SDK processes skip Django's import cost entirely.
+    django_conf = sys.modules.get("django.conf")
+    if django_conf is None:
         return None
+    django_settings = getattr(django_conf, "settings", None)
 
     if not getattr(django_settings, "configured", False):
         return None
@@ -161,82 +174,136 @@ def _load_from_django() -> dict[str, Any] | None:
 
 
 
-def _json_candidates(explicit: str | Path | None) -> list[Path]:
-    candidates: list[Path] = []
+def _json_candidates(explicit: str | Path | None) -> Iterator[Path]:
+    """Yield settings file candidates in priority order.
+
+    Lazy, so an existing explicit or `$SIMPLEAI_SETTINGS_FILE` path is found
+    without walking the app-root ancestors at all.
+    """
 
     if explicit is not None:
-        candidates.append(Path(explicit))
+        yield Path(explicit)
 
     env_path = os.getenv("SIMPLEAI_SETTINGS_FILE")
     if env_path:
-        candidates.append(Path(env_path))
+        yield Path(env_path)
 
     for root in _application_roots():
-        candidates.append(root / "ai_settings.json")
-        candidates.append(root / "config" / "ai_settings.json")
-        candidates.append(root / "settings" / "ai_settings.json")
+        yield root / "ai_settings.json"
+        yield root / "config" / "ai_settings.json"
+        yield root / "settings" / "ai_settings.json"
 
     # Allow package-local example to be copied and edited.
-    candidates.append(Path(__file__).resolve().parents[1] / "ai_settings.json")
-
-    return _dedupe_paths(candidates)
+    yield Path(__file__).resolve().parents[1] / "ai_settings.json"
 
 
 def _application_roots() -> list[Path]:
-    seed_roots: list[Path] = [Path.cwd()]
-
     main_mod = sys.modules.get("__main__")
     main_file = getattr(main_mod, "__file__", None)
-    if main_file:
-        seed_roots.append(Path(main_file).expanduser().resolve().parent)
+    return list(_find_app_roots(os.getcwd(), main_file, os.getenv("SIMPLEAI_APP_ROOT")))
 
-    env_root = os.getenv("SIMPLEAI_APP_ROOT")
+
+@lru_cache(maxsize=32)
+def _find_app_roots(cwd: str, main_file: str | None, env_root: str | None) -> tuple[Path, ...]:
+    """Ancestor walk for app roots; memoized because it stats every marker in every ancestor.
+
+    Works on plain strings (os.path) and only builds Path objects for the result.
+    """
+
+    seeds = [cwd]  # os.getcwd() is already a real path
+    if main_file:
+        seeds.append(os.path.dirname(os.path.realpath(os.path.expanduser(main_file))))
     if env_root:
-        seed_roots.append(Path(env_root).expanduser().resolve())
+        seeds.append(os.path.realpath(os.path.expanduser(env_root)))
 
-    traversed: list[Path] = []
-    for seed in _dedupe_paths(seed_roots):
-        traversed.append(seed)
-        traversed.extend(seed.parents)
+    # Seeds are real paths, so their ancestors are too and string keys dedupe exactly.
+    traversed: dict[str, None] = {}
+    for seed in seeds:
+        current = seed
+        while current not in traversed:
+            traversed[current] = None
+            parent = os.path.dirname(current)
+            if parent == current:
+                break
+            current = parent
 
-    traversed = _dedupe_paths(traversed)
-    marked = [root for root in traversed if any((root / marker).exists() for marker in _APP_ROOT_MARKERS)]
+    join, exists = os.path.join, os.path.exists
+    marked = [root for root in traversed if any(exists(join(root, marker)) for marker in _APP_ROOT_MARKERS)]
 
-    return _dedupe_paths(marked + traversed)
+    return tuple(map(Path, dict.fromkeys(marked + list(traversed))))
 
 
 
-def _load_from_json(explicit: str | Path | None) -> dict[str, Any] | None:
+def _find_settings_file(explicit: str | Path | None) -> Path | None:
     for path in _json_candidates(explicit):
-        if not path.exists():
-            continue
-        try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError as exc:
-            raise SettingsError(f"Invalid JSON in settings file {path}: {exc}") from exc
-        if not isinstance(data, dict):
-            raise SettingsError(f"Settings file {path} must contain a JSON object.")
-        return data
-
+        if path.exists():
+            return path
     return None
 
 
+def _read_settings_file(path: Path) -> tuple[dict[str, Any], tuple[int, int]]:
+    """Parse a settings file; also return the (mtime_ns, size) of the bytes that were read."""
+
+    # Settings files are small regular files: one fstat-sized read, no text layer.
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        stat = os.fstat(fd)
+        raw = os.read(fd, stat.st_size)
+    finally:
+        os.close(fd)
+
+    try:
+        data = loads_json(raw)
+    except json.JSONDecodeError as exc:
+        raise SettingsError(f"Invalid JSON in settings file {path}: {exc}") from exc
+    if not isinstance(data, dict):
+        raise SettingsError(f"Settings file {path} must contain a JSON object.")
+    return data, (stat.st_mtime_ns, stat.st_size)
+
+
+
+@dataclass(slots=True, frozen=True)
+class ProviderConfig:
+    """Typed, immutable view of the fields SimpleAI reads from `providers.<name>`."""
+
+    default_model: str | None = None
+    api_key: str | None = None
+
+    @classmethod
+    def from_mapping(cls, config: Any) -> ProviderConfig:
+        if not isinstance(config, Mapping):
+            return _EMPTY_PROVIDER_CONFIG
+        return cls(default_model=config.get("default_model"), api_key=config.get("api_key"))
 
-def get_provider_api_key(settings: dict[str, Any], provider: str) -> str | None:
+
+_EMPTY_PROVIDER_CONFIG = ProviderConfig()
+
+
+def get_provider_config(settings: Mapping[str, Any], provider: str) -> ProviderConfig:
+    """Return the typed config for a provider (empty when it is not configured)."""
+
+    typed = settings.get("_typed_providers")
+    if typed is not None:
+        return typed.get(provider, _EMPTY_PROVIDER_CONFIG)
+    return ProviderConfig.from_mapping(settings.get("providers", {}).get(provider))
+
+
+def get_provider_api_key(settings: Mapping[str, Any], provider: str) -> str | None:
     """Resolve provider API key from settings first, then environment."""
 
-    provider_config = settings.get("providers", {}).get(provider, {})
-    if isinstance(provider_config, dict):
-        configured = provider_config.get("api_key")
-        if configured:
-            return str(configured)
+    configured = get_provider_config(settings, provider).api_key
+    if configured:
+        return str(configured)
 
-    for env_var in PROVIDER_ENV_VARS.get(provider, ()):
-        value = os.getenv(env_var)
-        if value:
-            return value
+    # Read os.environ on every call rather than caching a snapshot: keys may be set or
+    # rotated at runtime, and a cache keyed on the env values would probe them anyway.
+    return next(filter(None, map(os.environ.get, PROVIDER_ENV_VARS.get(provider, ()))), None)
 
-    return None
+
+def get_default_model(settings: Mapping[str, Any], provider: str) -> str | None:
+    """Return the configured default model for a provider, if any."""
+
+    return get_provider_config(settings, provider).default_model
 
 
 def expected_provider_env_vars(provider: str) -> tuple[str, ...]:
@@ -246,18 +313,84 @@ def expected_provider_env_vars(provider: str) -> tuple[str, ...]:
 
 
 
-def load_settings(settings_file: str | Path | None = None) -> dict[str, Any]:
-    """Load settings from Django, JSON file, then defaults."""
+# Frozen merged settings per settings file path (None = built-in defaults only), stamped
+# with the file's (mtime_ns, size) so edits are picked up on the next call.
+_SETTINGS_CACHE: dict[str | None, tuple[tuple[int, int], Mapping[str, Any]]] = {}
+
+
+def _finalize(merged: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Freeze merged settings, adding a `_typed_providers` table for per-call reads."""
+
+    providers = merged.get("providers")
+    configs = providers.items() if isinstance(providers, Mapping) else ()
+    configs = [(name, config) for name, config in configs if isinstance(config, Mapping)]
+    return _freeze(
+        {
+            **merged,
+            "_typed_providers": {name: ProviderConfig.from_mapping(config) for name, config in configs},
+        }
+    )
+
+
+_LOADED_DEFAULTS = _finalize(DEFAULT_SETTINGS)
 
-    merged = deepcopy(DEFAULT_SETTINGS)
+
+def clear_settings_cache() -> None:
+    """Forget memoized settings files and app roots; the next `load_settings` re-reads from disk."""
+
+    _SETTINGS_CACHE.clear()
+    _find_app_roots.cache_clear()
+
+
+def _load_json_settings(explicit: str | Path | None) -> Mapping[str, Any]:
+    path = _find_settings_file(explicit)
+    key = str(path) if path is not None else None
+    stamp = (0, 0)
+    if path is not None:
+        stat = path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _SETTINGS_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    frozen = _LOADED_DEFAULTS
+    if path is not None:
+        # Stamp with what was actually read, in case the file changed since the stat above.
+        json_data, stamp = _read_settings_file(path)
+        if json_data:
+            frozen = _finalize(_deep_merge(DEFAULT_SETTINGS, _normalize_user_settings(json_data)))
+    _SETTINGS_CACHE[key] = (stamp, frozen)
+    return frozen
+
+
+def load_settings(settings_file: str | Path | None = None) -> Mapping[str, Any]:
+    """Load settings from Django, JSON file, then defaults.
+
+    The result is read-only (nested mappings are `MappingProxyType`, lists are
+    tuples). JSON-file settings are memoized per file, so repeated calls return
+    the same object until the file's mtime or size changes. Use `thaw_settings`
+    for a mutable copy.
+    """
 
     django_data = _load_from_django()
     if django_data:
-        merged = _deep_merge(merged, _normalize_user_settings(django_data))
-        return merged
+        return _finalize(_deep_merge(DEFAULT_SETTINGS, _normalize_user_settings(django_data)))
 
-    json_data = _load_from_json(settings_file)
-    if json_data:
-        merged = _deep_merge(merged, _normalize_user_settings(json_data))
+    return _load_json_settings(settings_file)
 
-    return merged
+
+def _thaw(obj: Any) -> Any:
+    if isinstance(obj, Mapping):
+        return {key: _thaw(value) for key, value in obj.items()}
+    if isinstance(obj, tuple):
+        return [_thaw(item) for item in obj]
+    return obj
+
+
+def thaw_settings(settings: Mapping[str, Any]) -> dict[str, Any]:
+    """Mutable deep copy of settings returned by `load_settings`."""
+
+    # The typed provider table would go stale once "providers" is edited; the
+    # `providers` section stays the source of truth for mutable copies.
+    return {key: _thaw(value) for key, value in settings.items() if key != "_typed_providers"}
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, TypeAlias
 
@@ -25,7 +26,48 @@ class Citation:
     raw: dict[str, Any] | None = None
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        """Plain-dict form. `raw` is shared, not copied; treat it as read-only."""
+        return {
+            "provider": self.provider,
+            "url": self.url,
+            "title": self.title,
+            "source": self.source,
+            "snippet": self.snippet,
+            "citation_id": self.citation_id,
+            "start_index": self.start_index,
+            "end_index": self.end_index,
+            "is_alive": self.is_alive,
+            "raw": self.raw,
+        }
+
+
+class LazyRaw(Mapping[str, Any]):
+    """Read-only view of an SDK response that defers `model_dump` until first access."""
+
+    __slots__ = ("_response", "_data")
+
+    def __init__(self, response: Any) -> None:
+        self._response = response
+        self._data: dict[str, Any] | None = None
+
+    def _materialize(self) -> dict[str, Any]:
+        if self._data is None:
+            response = self._response
+            self._data = response.model_dump(mode="json") if hasattr(response, "model_dump") else {}
+            self._response = None
+        return self._data
+
+    def __getitem__(self, key: str) -> Any:
+        return self._materialize()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._materialize())
+
+    def __len__(self) -> int:
+        return len(self._materialize())
+
+    def __repr__(self) -> str:
+        return repr(self._materialize())
 
 
 @dataclass(slots=True)
@@ -34,7 +76,7 @@ class AdapterResponse:
 
     text: str
     citations: list[Citation] = field(default_factory=list)
-    raw: dict[str, Any] | None = None
+    raw: Mapping[str, Any] | None = None
 
 
 @dataclass(slots=True)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import re
 import urllib.request
 import urllib.error
 from concurrent.futures import ThreadPoolExecutor
@@ -10,10 +11,14 @@ from typing import Any, TypeVar
 
 from pydantic import BaseModel, TypeAdapter
 
+from .schema import output_model_schema
 from .types import Citation, PromptInput
 
 T = TypeVar("T")
 
+_JSON_START_RE = re.compile(r"[\[{]")
+_JSON_DECODER = json.JSONDecoder()
+
 
 def normalize_prompt(prompt: PromptInput) -> str:
     """Normalize supported prompt shapes into a single string."""
@@ -24,15 +29,17 @@ def normalize_prompt(prompt: PromptInput) -> str:
     if not prompt:
         return ""
 
-    turns = [str(item) for item in prompt]
-    return "\n\n".join(f"Turn {idx + 1}: {item}" for idx, item in enumerate(turns))
+    if len(prompt) == 1:
+        return f"Turn 1: {prompt[0]}"
+
+    return "\n\n".join([f"Turn {idx}: {item}" for idx, item in enumerate(prompt, 1)])
 
 
 
 def pydantic_schema(output_format: type[BaseModel] | None) -> dict[str, Any] | None:
     if output_format is None:
         return None
-    return output_format.model_json_schema()
+    return output_model_schema(output_format)
 
 
 
@@ -52,20 +59,20 @@ def _extract_candidate_json_blocks(text: str) -> list[str]:
         except json.JSONDecodeError:
             pass  # Fall through to raw_decode path
 
-    decoder = json.JSONDecoder()
-    start = 0
-    length = len(stripped)
-    while start < length:
-        char = stripped[start]
-        if char not in "[{":
-            start += 1
-            continue
+    # Jump between candidate openers with the regex engine and decode in place;
+    # `raw_decode(s, idx)` returns an absolute end index, so nothing is sliced
+    # until a block actually parses.
+    search = _JSON_START_RE.search
+    pos = 0
+    while (match := search(stripped, pos)) is not None:
+        start = match.start()
         try:
-            _, end = decoder.raw_decode(stripped[start:])
-            blocks.append(stripped[start : start + end])
-            start += end
+            _, end = _JSON_DECODER.raw_decode(stripped, start)
         except json.JSONDecodeError:
-            start += 1
+            pos = start + 1
+            continue
+        blocks.append(stripped[start:end])
+        pos = end
 
     return blocks
 
@@ -3,6 +3,17 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(autouse=True)
+def _clear_settings_cache():
+    from simpleai.settings import clear_settings_cache
+
+    clear_settings_cache()
+    yield
+    clear_settings_cache()
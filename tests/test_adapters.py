@@ -4,13 +4,16 @@ from pathlib import Path
 from types import SimpleNamespace
 from typing import Any
 
+import pytest
 from pydantic import BaseModel, Field
 
+from simpleai.adapters._http import LoopLocal
 from simpleai.adapters.anthropic_adapter import AnthropicAdapter
 from simpleai.adapters.gemini_adapter import GeminiAdapter
 from simpleai.adapters.grok_adapter import GrokAdapter
 from simpleai.adapters.openai_adapter import OpenAIAdapter
 from simpleai.adapters.perplexity_adapter import PerplexityAdapter
+from simpleai.exceptions import ProviderError
 
 
 class OutputModel(BaseModel):
@@ -72,8 +75,9 @@ def test_openai_adapter_payload_and_citations(tmp_path: Path) -> None:
             self.calls = []
 
         def create(self, file, purpose: str):
-            self.calls.append((purpose, bool(file.read())))
-            file.seek(0)
+            name, handle, content_type = file
+            self.calls.append((purpose, name, content_type, bool(handle.read())))
+            handle.seek(0)
             return SimpleNamespace(id="file-1")
 
     class FakeResponses:
@@ -110,6 +114,35 @@ def test_openai_adapter_payload_and_citations(tmp_path: Path) -> None:
     assert fake_responses.payload["text"]["format"]["type"] == "json_schema"
     assert fake_responses.payload["text"]["format"]["schema"]["additionalProperties"] is False
     assert fake_responses.payload["temperature"] == 0.2
+    assert fake_files.calls == [("user_data", "data.txt", "text/plain", True)]
+
+
+def test_list_prompts_build_one_multipart_message_unless_split_turns() -> None:
+    openai = OpenAIAdapter({"api_key": "sk-test"})
+    assert openai._build_input(["a", "b"], ["file-1"]) == [
+        {
+            "role": "user",
+            "content": [
+                {"type": "input_text", "text": "a"},
+                {"type": "input_text", "text": "b"},
+                {"type": "input_file", "file_id": "file-1"},
+            ],
+        }
+    ]
+    assert openai._build_input([], []) == [{"role": "user", "content": [{"type": "input_text", "text": ""}]}]
+
+    split_openai = OpenAIAdapter({"api_key": "sk-test", "split_turns": True})
+    assert [len(m["content"]) for m in split_openai._build_input(["a", "b"], [])] == [1, 1]
+
+    claude = AnthropicAdapter({"api_key": "test"})
+    assert claude._build_messages(["a", 2]) == [
+        {"role": "user", "content": [{"type": "text", "text": "a"}, {"type": "text", "text": "2"}]}
+    ]
+    split_claude = AnthropicAdapter({"api_key": "test", "split_turns": True})
+    assert split_claude._build_messages(["a", "b"]) == [
+        {"role": "user", "content": [{"type": "text", "text": "a"}]},
+        {"role": "user", "content": [{"type": "text", "text": "b"}]},
+    ]
 
 
 def test_anthropic_adapter_payload_and_citations() -> None:
@@ -451,6 +484,61 @@ def test_gemini_adapter_vertexai_global_location_override(tmp_path: Path) -> Non
     assert fake_genai.client_instance.kwargs.get("location") == "global"
     assert fake_genai.client_instance.models.payload is not None
 
+
+def test_adapters_defer_model_dump_when_citations_are_off() -> None:
+    class FakeResponse:
+        output_text = "ok"
+        text = "ok"
+        candidates = [SimpleNamespace(finish_reason=SimpleNamespace(name="STOP"))]
+
+        def __init__(self) -> None:
+            self.dumps = 0
+
+        def model_dump(self, mode: str = "json") -> dict[str, Any]:
+            self.dumps += 1
+            return {"id": "resp-1"}
+
+    openai_response = FakeResponse()
+    adapter = OpenAIAdapter({"api_key": "sk-test"})
+    result = adapter._parse_response(openai_response, return_citations=False)
+    assert result.text == "ok"
+    assert openai_response.dumps == 0
+    assert result.raw["id"] == "resp-1"
+    assert dict(result.raw) == {"id": "resp-1"}
+    assert openai_response.dumps == 1
+
+    gemini_response = FakeResponse()
+    gemini = GeminiAdapter({"api_key": "test"})
+    result = gemini._parse_response(
+        gemini_response,
+        model="gemini-3-pro-preview",
+        config_kwargs={},
+        return_citations=False,
+        output_format=None,
+    )
+    assert result.text == "ok"
+    assert gemini_response.dumps == 0
+
+
+def test_gemini_adapter_detects_max_tokens_without_dump() -> None:
+    class FakeResponse:
+        text = "{\"value\": 1"
+        candidates = [SimpleNamespace(finish_reason=SimpleNamespace(name="MAX_TOKENS"))]
+
+        def model_dump(self, mode: str = "json") -> dict[str, Any]:
+            raise AssertionError("model_dump should not be called")
+
+    adapter = GeminiAdapter({"api_key": "test"})
+    with pytest.raises(ProviderError, match="MAX_TOKENS"):
+        adapter._parse_response(
+            FakeResponse(),
+            model="gemini-3-pro-preview",
+            config_kwargs={"max_output_tokens": 10},
+            return_citations=False,
+            output_format=OutputModel,
+        )
+
+
 def test_gemini_adapter_empty_response(tmp_path: Path) -> None:
     class FakeGeminiEmptyResponse:
         text = ""
@@ -471,9 +559,6 @@ def test_gemini_adapter_empty_response(tmp_path: Path) -> None:
     adapter = GeminiAdapter({"api_key": "test"})
     adapter.client = SimpleNamespace(models=FakeModels())
 
-    import pytest
-    from simpleai.exceptions import ProviderError
-
     with pytest.raises(ProviderError) as exc:
         adapter.run(
             prompt="hello",
@@ -777,3 +862,289 @@ def test_perplexity_adapter_retries_without_response_format_on_invalid_request()
     assert len(fake_responses.calls) == 2
     assert "response_format" in fake_responses.calls[0]
     assert "response_format" not in fake_responses.calls[1]
+
+
+def test_openai_adapter_arun_uses_async_client() -> None:
+    import asyncio
+
+    class FakeOpenAIResponse:
+        output_text = "async ok"
+
+        def model_dump(self, mode: str = "json") -> dict[str, Any]:
+            return {"output": []}
+
+    class FakeAsyncResponses:
+        def __init__(self) -> None:
+            self.payload = None
+
+        async def create(self, **kwargs):
+            self.payload = kwargs
+            return FakeOpenAIResponse()
+
+    fake_responses = FakeAsyncResponses()
+
+    adapter = OpenAIAdapter({"api_key": "sk-test"})
+    adapter.client = None
+    adapter._aclients = LoopLocal(lambda: SimpleNamespace(responses=fake_responses))
+
+    response = asyncio.run(
+        adapter.arun(
+            prompt="hello",
+            model="gpt-5",
+            require_search=True,
+            return_citations=False,
+            files=None,
+            output_format=None,
+            adapter_options=None,
+        )
+    )
+
+    assert response.text == "async ok"
+    assert fake_responses.payload["tools"] == [{"type": "web_search"}]
+    assert "include" not in fake_responses.payload
+
+
+def test_openai_adapter_upload_files_runs_concurrently_and_cleans_up_on_failure(tmp_path: Path) -> None:
+    import asyncio
+
+    paths = []
+    for name in ("a.txt", "b.txt", "bad.txt"):
+        path = tmp_path / name
+        path.write_text(name, encoding="utf-8")
+        paths.append(path)
+
+    class FakeAsyncFiles:
+        def __init__(self) -> None:
+            self.in_flight = 0
+            self.max_in_flight = 0
+            self.deleted: list[str] = []
+
+        async def create(self, *, file, purpose):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            name = file[0]
+            if name == "bad.txt":
+                raise RuntimeError("upload failed")
+            return SimpleNamespace(id=f"file-{name}")
+
+        async def delete(self, file_id):
+            self.deleted.append(file_id)
+
+    fake_files = FakeAsyncFiles()
+    adapter = OpenAIAdapter({"api_key": "sk-test"})
+    adapter._aclients = LoopLocal(lambda: SimpleNamespace(files=fake_files))
+
+    assert asyncio.run(adapter._upload_files(paths[:2])) == ["file-a.txt", "file-b.txt"]
+    assert fake_files.max_in_flight == 2
+
+    try:
+        asyncio.run(adapter._upload_files(paths))
+    except RuntimeError as exc:
+        assert str(exc) == "upload failed"
+    else:  # pragma: no cover - assertion path
+        raise AssertionError("expected upload failure")
+    assert sorted(fake_files.deleted) == ["file-a.txt", "file-b.txt"]
+
+
+def test_anthropic_adapter_arun_collects_followup_citations() -> None:
+    import asyncio
+
+    class FakeAnthropicResponse:
+        def __init__(self, payload: dict[str, Any]) -> None:
+            self._payload = payload
+
+        def model_dump(self, mode: str = "json") -> dict[str, Any]:
+            return self._payload
+
+    class FakeAsyncMessages:
+        def __init__(self) -> None:
+            self.calls: list[dict[str, Any]] = []
+
+        async def create(self, **kwargs):
+            self.calls.append(kwargs)
+            if len(self.calls) == 1:
+                return FakeAnthropicResponse({"content": [{"type": "text", "text": "{\"value\": 9}"}]})
+            return FakeAnthropicResponse(
+                {
+                    "content": [
+                        {
+                            "type": "web_search_tool_result",
+                            "content": [{"title": "Ref", "url": "https://citation.example"}],
+                        }
+                    ]
+                }
+            )
+
+    fake_messages = FakeAsyncMessages()
+    adapter = AnthropicAdapter({"api_key": "test", "max_tokens": 100})
+    adapter.client = None
+    adapter._aclients = LoopLocal(lambda: SimpleNamespace(messages=fake_messages))
+
+    response = asyncio.run(
+        adapter.arun(
+            prompt="Return JSON and cite sources",
+            model="claude-opus-4-6",
+            require_search=True,
+            return_citations=True,
+            files=None,
+            output_format=OutputModel,
+            adapter_options=None,
+        )
+    )
+
+    assert response.text == "{\"value\": 9}"
+    assert any(c.url == "https://citation.example" for c in response.citations)
+    assert len(fake_messages.calls) == 2
+
+
+def test_gemini_adapter_arun_uses_aio_surface() -> None:
+    import asyncio
+
+    class FakeGeminiResponse:
+        text = "gemini async"
+
+        def model_dump(self, mode: str = "json") -> dict[str, Any]:
+            return {}
+
+    class FakeAsyncModels:
+        def __init__(self) -> None:
+            self.payload = None
+
+        async def generate_content(self, **kwargs):
+            self.payload = kwargs
+            return FakeGeminiResponse()
+
+    fake_models = FakeAsyncModels()
+    adapter = GeminiAdapter({"api_key": "test"})
+    adapter._aclients = LoopLocal(lambda: SimpleNamespace(aio=SimpleNamespace(models=fake_models)))
+
+    response = asyncio.run(
+        adapter.arun(
+            prompt="hello",
+            model="gemini-2.5-pro",
+            require_search=False,
+            return_citations=False,
+            files=None,
+            output_format=None,
+            adapter_options=None,
+        )
+    )
+
+    assert response.text == "gemini async"
+    assert fake_models.payload["contents"] == "hello"
+
+
+def test_base_adapter_arun_defaults_to_sync_run() -> None:
+    import asyncio
+
+    class FakeResponses:
+        def create(self, **kwargs):
+            return SimpleNamespace(output_text="perplexity sync")
+
+    adapter = PerplexityAdapter({"api_key": "test"})
+    adapter.client = SimpleNamespace(responses=FakeResponses())
+
+    response = asyncio.run(
+        adapter.arun(
+            prompt="hello",
+            model="sonar-pro",
+            require_search=False,
+            return_citations=False,
+            files=None,
+            output_format=None,
+            adapter_options=None,
+        )
+    )
+
+    assert response.text == "perplexity sync"
+
+
+def test_adapters_share_pooled_http_clients() -> None:
+    import asyncio
+
+    from simpleai.adapters._http import get_async_httpx, get_sync_httpx
+
+    first = OpenAIAdapter({"api_key": "sk-test"})
+    second = OpenAIAdapter({"api_key": "sk-other"})
+    claude = AnthropicAdapter({"api_key": "test"})
+
+    assert first.client._client is get_sync_httpx()
+    assert second.client._client is get_sync_httpx()
+    assert claude.client._client is get_sync_httpx()
+
+    async def async_transports() -> tuple[object, ...]:
+        pooled = get_async_httpx()
+        assert first.aclient is first.aclient
+        return pooled, first.aclient._client, claude.aclient._client
+
+    pooled, openai_transport, claude_transport = asyncio.run(async_transports())
+    assert openai_transport is pooled and claude_transport is pooled
+
+    # A new event loop gets fresh clients instead of connections bound to the closed one.
+    assert asyncio.run(async_transports())[0] is not pooled
+
+
+def test_get_adapter_pools_instances_per_settings() -> None:
+    from simpleai.adapters import clear_adapter_cache, get_adapter
+
+    clear_adapter_cache()
+    settings = {"api_key": "sk-test", "extra": {"b": 1, "a": [1, 2]}}
+
+    first = get_adapter("openai", settings)
+    assert get_adapter("openai", dict(settings)) is first
+    assert get_adapter("openai", {**settings, "api_key": "sk-other"}) is not first
+
+    clear_adapter_cache()
+    assert get_adapter("openai", settings) is not first
+    clear_adapter_cache()
+
+
+def test_text_fallbacks_join_non_empty_parts() -> None:
+    class FakeOpenAIResponse:
+        output_text = ""
+
+        def model_dump(self, mode: str = "json") -> dict[str, Any]:
+            return {
+                "output": [
+                    {"type": "reasoning", "content": [{"type": "output_text", "text": "skip"}]},
+                    {
+                        "type": "message",
+                        "content": [
+                            {"type": "output_text", "text": "a"},
+                            {"type": "refusal", "text": "skip"},
+                            {"type": "output_text", "text": None},
+                            {"type": "output_text", "text": "b"},
+                        ],
+                    },
+                ]
+            }
+
+    openai = OpenAIAdapter({"api_key": "sk-test"})
+    assert openai._parse_response(FakeOpenAIResponse(), return_citations=False).text == "ab"
+
+    class FakeGeminiResponse:
+        text = ""
+
+        def model_dump(self, mode: str = "json") -> dict[str, Any]:
+            return {
+                "candidates": [
+                    {"content": {"parts": [{"text": "a"}, {"inline_data": {}}, {"text": "b"}]}},
+                    {"content": None},
+                ]
+            }
+
+    gemini = GeminiAdapter({"api_key": "test"})
+    result = gemini._parse_response(
+        FakeGeminiResponse(),
+        model="gemini-3-pro-preview",
+        config_kwargs={},
+        return_citations=False,
+        output_format=None,
+    )
+    assert result.text == "a\nb"
+
+    claude = AnthropicAdapter({"api_key": "test"})
+    content = [{"type": "text", "text": " x"}, {"type": "tool_use"}, {"type": "text", "text": ""}, {"type": "text", "text": "y "}]
+    assert claude._extract_text({"content": content}) == "x\ny"
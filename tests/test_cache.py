@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from simpleai.adapters._http import LoopLocal
+from simpleai.adapters.openai_adapter import OpenAIAdapter
+from simpleai.cache import FileCache, InMemoryLRU, cache_key, resolve_cache
+from simpleai.exceptions import SettingsError
+from simpleai.types import Citation
+
+
+class FakeOpenAIResponse:
+    output_text = "cached answer"
+
+    def model_dump(self, mode: str = "json") -> dict[str, Any]:
+        return {"output": []}
+
+
+class FakeResponses:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def create(self, **kwargs):
+        self.calls += 1
+        return FakeOpenAIResponse()
+
+    async def acreate(self, **kwargs):
+        return self.create(**kwargs)
+
+
+def _run_kwargs(**overrides: Any) -> dict[str, Any]:
+    kwargs: dict[str, Any] = {
+        "prompt": "hello",
+        "model": "gpt-5",
+        "require_search": False,
+        "return_citations": False,
+        "files": None,
+        "output_format": None,
+        "adapter_options": None,
+    }
+    kwargs.update(overrides)
+    return kwargs
+
+
+def test_cache_key_is_order_independent() -> None:
+    assert cache_key({"a": 1, "b": [1, 2]}) == cache_key({"b": [1, 2], "a": 1})
+    assert cache_key({"a": 1}) != cache_key({"a": 2})
+
+
+def test_in_memory_lru_evicts_least_recently_used() -> None:
+    cache = InMemoryLRU(maxsize=2)
+    cache.set("a", {"v": 1})
+    cache.set("b", {"v": 2})
+    assert cache.get("a") == {"v": 1}
+    cache.set("c", {"v": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"v": 1}
+    assert cache.get("c") == {"v": 3}
+
+
+def test_file_cache_round_trip(tmp_path: Path) -> None:
+    cache = FileCache(tmp_path / "cache")
+    assert cache.get("missing") is None
+    cache.set("key", {"text": "hi"})
+    assert cache.get("key") == {"text": "hi"}
+
+
+def test_resolve_cache_rejects_unknown_values() -> None:
+    assert resolve_cache(None) is None
+    assert isinstance(resolve_cache("memory"), InMemoryLRU)
+    with pytest.raises(SettingsError):
+        resolve_cache("redis")
+
+
+def test_adapter_serves_identical_calls_from_cache() -> None:
+    responses = FakeResponses()
+    adapter = OpenAIAdapter({"api_key": "sk-test", "cache": InMemoryLRU()})
+    adapter.client = SimpleNamespace(responses=responses)
+
+    first = adapter.run(**_run_kwargs())
+    second = adapter.run(**_run_kwargs())
+    adapter.run(**_run_kwargs(prompt="different"))
+
+    assert first.text == second.text == "cached answer"
+    assert responses.calls == 2
+
+
+def test_adapter_cache_is_shared_between_run_and_arun() -> None:
+    responses = FakeResponses()
+    adapter = OpenAIAdapter({"api_key": "sk-test", "cache": InMemoryLRU()})
+    adapter.client = SimpleNamespace(responses=responses)
+    adapter._aclients = LoopLocal(lambda: SimpleNamespace(responses=SimpleNamespace(create=responses.acreate)))
+
+    adapter.run(**_run_kwargs())
+    response = asyncio.run(adapter.arun(**_run_kwargs()))
+
+    assert response.text == "cached answer"
+    assert responses.calls == 1
+
+
+def test_adapter_cache_skips_non_deterministic_calls() -> None:
+    responses = FakeResponses()
+    adapter = OpenAIAdapter({"api_key": "sk-test", "cache": InMemoryLRU()})
+    adapter.client = SimpleNamespace(responses=responses)
+
+    adapter.run(**_run_kwargs(adapter_options={"temperature": 0.7}))
+    adapter.run(**_run_kwargs(adapter_options={"temperature": 0.7}))
+
+    assert responses.calls == 2
+
+
+def test_adapter_cache_never_replays_schema_invalid_responses(tmp_path: Path) -> None:
+    from pydantic import BaseModel
+
+    class Answer(BaseModel):
+        value: int
+
+    texts = iter(["not json", '{"value": 1}'])
+
+    class SequencedResponses(FakeResponses):
+        def create(self, **kwargs):
+            self.calls += 1
+            return SimpleNamespace(output_text=next(texts))
+
+    responses = SequencedResponses()
+    cache = FileCache(tmp_path)
+    adapter = OpenAIAdapter({"api_key": "sk-test", "cache": cache})
+    adapter.client = SimpleNamespace(responses=responses)
+    kwargs = _run_kwargs(output_format=Answer)
+    key = adapter._response_cache_key(kwargs)
+
+    # A stale invalid entry (e.g. written by an older process) is not served.
+    cache.set(key, {"text": "stale", "citations": [], "raw": None})
+    assert adapter.run(**kwargs).text == "not json"
+    assert cache.get(key)["text"] == "stale"
+
+    assert adapter.run(**kwargs).text == '{"value": 1}'
+    assert adapter.run(**kwargs).text == '{"value": 1}'
+    assert responses.calls == 2
+    assert cache.get(key)["text"] == '{"value": 1}'
+
+
+def test_citation_to_dict_matches_fields_and_shares_raw() -> None:
+    from dataclasses import asdict
+
+    raw = {"nested": {"payload": [1, 2, 3]}}
+    citation = Citation(provider="openai", url="https://a", start_index=1, is_alive=True, raw=raw)
+
+    as_dict = citation.to_dict()
+    assert as_dict == asdict(citation)
+    assert as_dict["raw"] is raw
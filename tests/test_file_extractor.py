@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 from pypdf import PdfWriter
@@ -19,6 +20,19 @@ def test_collect_file_paths_deduplicates(tmp_path: Path) -> None:
     assert paths[0] == a.resolve()
 
 
+def test_collect_file_paths_merges_relative_and_symlinked_spellings(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    a = tmp_path / "a.txt"
+    a.write_text("hello", encoding="utf-8")
+    b = tmp_path / "b.txt"
+    b.write_text("world", encoding="utf-8")
+    link = tmp_path / "link.txt"
+    link.symlink_to(a)
+    monkeypatch.chdir(tmp_path)
+
+    paths = collect_file_paths(file="a.txt", files=iter([link, str(a), "b.txt"]))
+    assert paths == [a.resolve(), b.resolve()]
+
+
 def test_extract_text_plain_and_json(tmp_path: Path) -> None:
     txt = tmp_path / "test.txt"
     txt.write_text("plain", encoding="utf-8")
@@ -30,6 +44,46 @@ def test_extract_text_plain_and_json(tmp_path: Path) -> None:
     assert '"x": 1' in extract_text_from_file(js)
 
 
+def test_extract_json_sorts_keys_and_handles_wide_ints(tmp_path: Path) -> None:
+    js = tmp_path / "wide.json"
+    js.write_text('{"b": 1, "a": 123456789012345678901234567890}', encoding="utf-8")
+
+    assert extract_text_from_file(js) == '{\n  "a": 123456789012345678901234567890,\n  "b": 1\n}'
+
+
+def test_extract_large_json_streams_with_ijson(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("ijson")
+    monkeypatch.setattr("simpleai.files.extractor._JSON_STREAM_THRESHOLD", 0)
+    payload = {"b": [1, 2.5, None, True, {}], "a": {"z": "caf\u00e9", "y": []}, "c": 123456789}
+    js = tmp_path / "big.json"
+    js.write_text(json.dumps(payload), encoding="utf-8")
+
+    assert extract_text_from_file(js) == json.dumps(payload, indent=2, sort_keys=True)
+
+    # ijson rejects NaN; the full-parse path still handles it.
+    nan = tmp_path / "nan.json"
+    nan.write_text('{"x": NaN}', encoding="utf-8")
+    assert extract_text_from_file(nan) == '{\n  "x": NaN\n}'
+
+
+@pytest.mark.parametrize("stream", [False, True])
+@pytest.mark.parametrize("use_orjson", [False, True])
+def test_extract_json_output_is_canonical_across_paths(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, stream: bool, use_orjson: bool
+) -> None:
+    if stream:
+        pytest.importorskip("ijson")
+        monkeypatch.setattr("simpleai.files.extractor._JSON_STREAM_THRESHOLD", 0)
+    if not use_orjson:
+        monkeypatch.setattr("simpleai._json.orjson", None)
+    js = tmp_path / "canonical.json"
+    js.write_text('{"name": "caf\u00e9 \U0001f600", "big": 1e100, "small": 1e-7}', encoding="utf-8")
+
+    assert extract_text_from_file(js) == (
+        '{\n  "big": 1e+100,\n  "name": "caf\\u00e9 \\ud83d\\ude00",\n  "small": 1e-07\n}'
+    )
+
+
 def test_extract_rtf(tmp_path: Path) -> None:
     rtf = tmp_path / "sample.rtf"
     rtf.write_text(r"{\rtf1\ansi This is {\b bold}.}", encoding="utf-8")
@@ -77,3 +131,103 @@ def test_unsupported_extension_raises(tmp_path: Path) -> None:
 
     with pytest.raises(FileExtractionError):
         extract_text_from_file(path)
+
+
+def test_extract_text_from_files_preserves_order_across_workers(tmp_path: Path) -> None:
+    paths = []
+    for index in range(8):
+        path = tmp_path / f"{index}.txt"
+        path.write_text(f"file {index}", encoding="utf-8")
+        paths.append(path)
+
+    extracted = extract_text_from_files(paths, max_workers=4)
+    assert [item.text for item in extracted] == [f"file {index}" for index in range(8)]
+
+    bad = tmp_path / "bad.csv"
+    bad.write_text("x", encoding="utf-8")
+    with pytest.raises(FileExtractionError, match="bad.csv"):
+        extract_text_from_files([paths[0], bad, paths[1]], max_workers=2)
+
+
+def test_iter_pdf_pages_yields_one_entry_per_page(tmp_path: Path) -> None:
+    from simpleai.files import iter_pdf_pages
+
+    path = tmp_path / "pages.pdf"
+    writer = PdfWriter()
+    for _ in range(3):
+        writer.add_blank_page(width=72, height=72)
+    with path.open("wb") as handle:
+        writer.write(handle)
+
+    assert list(iter_pdf_pages(path)) == ["", "", ""]
+    with pytest.raises(FileExtractionError):
+        list(iter_pdf_pages(tmp_path / "missing.pdf"))
+
+
+def test_extract_pdf_reuses_parsed_reader_until_file_changes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from simpleai.files import extract_pdf
+    from simpleai.files.extractor import _open_pdf_reader
+
+    monkeypatch.setattr("simpleai.files.extractor._fitz", lambda: None)
+
+    path = tmp_path / "cached.pdf"
+
+    def write(page_count: int) -> None:
+        writer = PdfWriter()
+        for _ in range(page_count):
+            writer.add_blank_page(width=72, height=72)
+        with path.open("wb") as handle:
+            writer.write(handle)
+
+    write(3)
+    _open_pdf_reader.cache_clear()
+    assert extract_pdf(path) == ["", "", ""]
+    assert extract_pdf(path, pages=[2, 0]) == ["", ""]
+    assert _open_pdf_reader.cache_info().misses == 1
+
+    write(2)
+    assert extract_pdf(path) == ["", ""]
+    assert _open_pdf_reader.cache_info().misses == 2
+
+    # One-off extraction parses its own reader and leaves nothing cached.
+    _open_pdf_reader.cache_clear()
+    assert extract_text_from_file(path) == ""
+    assert _open_pdf_reader.cache_info().currsize == 0
+
+
+def test_pdf_extraction_prefers_pymupdf_when_installed(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from simpleai.files import extract_pdf, iter_pdf_pages
+
+    class FakePage:
+        def __init__(self, index: int) -> None:
+            self.index = index
+
+        def get_text(self, mode: str) -> str:
+            return f"page {self.index}\n"
+
+    class FakeDoc:
+        page_count = 3
+
+        def __enter__(self) -> "FakeDoc":
+            return self
+
+        def __exit__(self, *exc: object) -> None:
+            return None
+
+        def __getitem__(self, index: int) -> FakePage:
+            return FakePage(index)
+
+    opened: list[str] = []
+
+    def fake_open(path: str) -> FakeDoc:
+        opened.append(path)
+        return FakeDoc()
+
+    monkeypatch.setattr("simpleai.files.extractor._fitz", lambda: SimpleNamespace(open=fake_open))
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(b"%PDF-stub")
+
+    assert extract_text_from_file(path) == "page 0\n\npage 1\n\npage 2"
+    assert extract_pdf(path, pages=[1]) == ["page 1\n"]
+    assert list(iter_pdf_pages(path)) == ["page 0\n", "page 1\n", "page 2\n"]
+    assert opened == [str(path), str(path), str(path)]
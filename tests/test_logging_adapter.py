@@ -18,6 +18,7 @@ def test_prompt_logger_writes_json_lines(tmp_path: Path) -> None:
 
     event_id = logger.log_start(args={"prompt": "hi"}, adapter_payload={"provider": "openai"})
     logger.log_end(event_id=event_id, started_at=0.0, result_preview="ok", citations_count=1)
+    logger.flush()
 
     lines = logfile.read_text(encoding="utf-8").strip().splitlines()
     assert len(lines) == 2
@@ -28,3 +29,133 @@ def test_prompt_logger_writes_json_lines(tmp_path: Path) -> None:
     assert start_payload["event"] == "run_prompt.start"
     assert end_payload["event"] == "run_prompt.end"
     assert end_payload["citations_count"] == 1
+
+
+def test_prompt_logger_pretty_flag_indents_events(tmp_path: Path) -> None:
+    from simpleai.adapters import logging_adapter
+
+    logging_adapter._stop_file_listener()
+    logfile = tmp_path / "pretty.log"
+    logger = PromptLogger({"enabled": True, "pretty": True, "logfile_location": str(logfile)})
+
+    logger._emit({"event": "custom", "data": {1: "non-str key"}, "text": "café"})
+    logger.flush()
+
+    content = logfile.read_text(encoding="utf-8")
+    assert content.startswith("{\n  ")
+    payload = json.loads(content)
+    assert payload["data"] == {"1": "non-str key"}
+    assert payload["text"] == "café"
+
+
+def test_network_logging_skips_work_when_logger_is_not_listening() -> None:
+    import logging
+
+    from simpleai.adapters import logging_adapter
+
+    disabled = PromptLogger({"enabled": False})
+    assert not logging_adapter._is_listening(disabled)
+
+    quiet = PromptLogger({"enabled": False})
+    quiet.enabled = True
+    quiet.logger = logging.getLogger("simpleai.tests.quiet")
+    quiet.logger.setLevel(logging.WARNING)
+    assert not logging_adapter._is_listening(quiet)
+
+    quiet.logger.setLevel(logging.INFO)
+    assert logging_adapter._is_listening(quiet)
+
+    assert logging_adapter._safe_header("Authorization", "Bearer x") == "REDACTED"
+    assert logging_adapter._safe_header("Content-Type", "text/plain") == "text/plain"
+
+
+def test_safe_body_truncates_to_limit() -> None:
+    from simpleai.adapters.logging_adapter import _safe_body
+
+    assert _safe_body(b"abcdef", limit=4) == "abcd...<truncated 2 bytes>"
+    assert _safe_body(b"abcdef", limit=0) == "abcdef"
+    assert _safe_body("abcdef", limit=3) == "abc...<truncated 3 chars>"
+    # Cutting through a multi-byte character must not turn text into "<binary_content>".
+    assert _safe_body("é".encode("utf-8") * 3, limit=3).startswith("é")
+    assert _safe_body(b"\xff\xfe", limit=16) == "<binary_content>"
+
+
+def test_prompt_logger_writes_through_background_listener(tmp_path: Path) -> None:
+    import logging
+    from logging.handlers import QueueHandler
+
+    from simpleai.adapters import logging_adapter
+
+    logging_adapter._stop_file_listener()
+    logfile = tmp_path / "queued.log"
+    logger = PromptLogger({"enabled": True, "logfile_location": str(logfile)})
+
+    assert any(isinstance(h, QueueHandler) for h in logging.getLogger("simpleai").handlers)
+    for index in range(50):
+        logger._emit({"event": "custom", "index": index})
+    logger.flush()
+
+    lines = logfile.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["index"] for line in lines] == list(range(50))
+
+    queue_handler = logging_adapter._queue_handler
+    logging_adapter._stop_file_listener()
+    assert queue_handler not in logging.getLogger("simpleai").handlers
+
+
+def test_network_logging_patches_once_and_fans_out_to_live_loggers(tmp_path: Path) -> None:
+    import gc
+
+    import httpx
+
+    from simpleai.adapters import logging_adapter
+
+    logging_adapter._stop_file_listener()
+    first = PromptLogger(
+        {"enabled": True, "network_logging": True, "logfile_location": str(tmp_path / "net.log")}
+    )
+    patched_send = httpx.Client.send
+    second = PromptLogger({"enabled": True, "network_logging": True})
+    assert httpx.Client.send is patched_send
+
+    logging_adapter._install_network_patches.cache_clear()
+    logging_adapter._install_network_patches()
+    assert httpx.Client.send is patched_send
+
+    # Both loggers share the "simpleai" logger, so each exchange is written once.
+    assert logging_adapter._network_loggers() == [second]
+
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=b"pong"))
+    with httpx.Client(transport=transport) as client:
+        client.post("https://example.test/ping", content=b"ping")
+    first.flush()
+
+    events = [json.loads(line) for line in (tmp_path / "net.log").read_text(encoding="utf-8").splitlines()]
+    assert [(event["request_body"], event["response_body"]) for event in events] == [("ping", "pong")]
+
+    del first, second
+    gc.collect()
+    assert logging_adapter._network_loggers() == []
+    logging_adapter._stop_file_listener()
+
+
+def test_sanitize_headers_redacts_case_insensitively() -> None:
+    from simpleai.adapters.logging_adapter import _sanitize_headers
+
+    assert _sanitize_headers({"X-Api-Key": "secret", "Authorization": "Bearer x", "Content-Length": 3}) == {
+        "X-Api-Key": "REDACTED",
+        "Authorization": "REDACTED",
+        "Content-Length": "3",
+    }
+
+
+def test_disabled_logger_returns_cheap_event_ids() -> None:
+    logger = PromptLogger({"enabled": False})
+
+    first = logger.log_start(args={}, adapter_payload={})
+    second = PromptLogger(None).log_start(args={}, adapter_payload={})
+
+    assert first.startswith("noop-") and second.startswith("noop-")
+    assert first != second
+    logger.log_end(event_id=first, started_at=0.0, result_preview="", citations_count=0)
+    logger.log_error(event_id=first, started_at=0.0, error=RuntimeError("x"), context={})
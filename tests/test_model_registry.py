@@ -49,3 +49,31 @@ def test_default_provider_prefers_credentials() -> None:
     provider, model = resolve_provider_and_model(BASE_SETTINGS, None)
     assert provider == "openai"
     assert model == "gpt-5.2"
+
+
+def test_provider_hints_keep_table_precedence() -> None:
+    # "openai" precedes "claude" in the hint table even though "claude" appears first.
+    assert resolve_provider_and_model(BASE_SETTINGS, "claude-via-openai-proxy")[0] == "openai"
+    assert resolve_provider_and_model(BASE_SETTINGS, "my-sonar-finetune")[0] == "perplexity"
+    assert resolve_provider_and_model(BASE_SETTINGS, "X-o4-Custom")[0] == "openai"
+
+
+
+def test_model_lookups_are_memoized_until_cleared(monkeypatch) -> None:
+    from simpleai import model_registry
+
+    monkeypatch.setitem(model_registry.MODEL_PROVIDER_MAP, "in-house-model", "gemini")
+    model_registry.clear_resolution_cache()
+    assert resolve_provider_and_model(BASE_SETTINGS, "in-house-model") == ("gemini", "in-house-model")
+
+    monkeypatch.setitem(model_registry.MODEL_PROVIDER_MAP, "in-house-model", "claude")
+    assert resolve_provider_and_model(BASE_SETTINGS, "in-house-model")[0] == "gemini"
+    model_registry.clear_resolution_cache()
+    assert resolve_provider_and_model(BASE_SETTINGS, "in-house-model")[0] == "claude"
+    model_registry.clear_resolution_cache()
+
+
+def test_alias_default_model_is_read_from_current_settings() -> None:
+    settings = {**BASE_SETTINGS, "providers": {**BASE_SETTINGS["providers"], "openai": {"default_model": "gpt-4.1"}}}
+    assert resolve_provider_and_model(BASE_SETTINGS, "openai") == ("openai", "gpt-5.2")
+    assert resolve_provider_and_model(settings, "openai") == ("openai", "gpt-4.1")
@@ -28,7 +28,7 @@ def test_run_provider_matrix_classifies_outcomes(monkeypatch, tmp_path: Path) ->
 
     monkeypatch.setattr("simpleai.provider_smoke.get_provider_api_key", fake_key)
 
-    def fake_run_prompt(prompt: str, **kwargs):
+    async def fake_arun_prompt(prompt: str, **kwargs):
         model = kwargs["model"]
         if model == "openai":
             return (
@@ -49,7 +49,7 @@ def test_run_provider_matrix_classifies_outcomes(monkeypatch, tmp_path: Path) ->
             raise RuntimeError("provider exploded")
         raise RuntimeError(f"unexpected model: {model}")
 
-    monkeypatch.setattr("simpleai.provider_smoke.run_prompt", fake_run_prompt)
+    monkeypatch.setattr("simpleai.provider_smoke.arun_prompt", fake_arun_prompt)
 
     output_lines: list[str] = []
     results = run_provider_matrix(
@@ -72,9 +72,9 @@ def test_run_provider_matrix_requires_citations(monkeypatch, tmp_path: Path) ->
 
     monkeypatch.setattr("simpleai.provider_smoke.load_settings", lambda settings_file=None: {})
     monkeypatch.setattr("simpleai.provider_smoke.get_provider_api_key", lambda settings, provider: "key")
-    monkeypatch.setattr(
-        "simpleai.provider_smoke.run_prompt",
-        lambda prompt, **kwargs: (
+
+    async def fake_arun_prompt(prompt: str, **kwargs):
+        return (
             JobHistory(
                 latest_job_experiences=[
                     JobExperience(
@@ -86,8 +86,9 @@ def test_run_provider_matrix_requires_citations(monkeypatch, tmp_path: Path) ->
                 ]
             ),
             [],
-        ),
-    )
+        )
+
+    monkeypatch.setattr("simpleai.provider_smoke.arun_prompt", fake_arun_prompt)
 
     results = run_provider_matrix(
         file_path=sample_file,
@@ -101,6 +102,43 @@ def test_run_provider_matrix_requires_citations(monkeypatch, tmp_path: Path) ->
 
 
 
+def test_run_provider_matrix_runs_providers_concurrently(monkeypatch, tmp_path: Path) -> None:
+    import asyncio
+
+    sample_file = tmp_path / "resume.pdf"
+    sample_file.write_bytes(b"%PDF-1.4\n")
+
+    monkeypatch.setattr("simpleai.provider_smoke.load_settings", lambda settings_file=None: {})
+    monkeypatch.setattr("simpleai.provider_smoke.get_provider_api_key", lambda settings, provider: "key")
+
+    started: list[str] = []
+    release = asyncio.Event()
+
+    async def fake_arun_prompt(prompt: str, **kwargs):
+        started.append(kwargs["model"])
+        if len(started) == 2:
+            release.set()
+        # Deadlocks unless both providers are in flight at the same time.
+        await asyncio.wait_for(release.wait(), timeout=2)
+        raise RuntimeError(f"{kwargs['model']} done")
+
+    monkeypatch.setattr("simpleai.provider_smoke.arun_prompt", fake_arun_prompt)
+
+    output_lines: list[str] = []
+    results = run_provider_matrix(
+        file_path=sample_file,
+        providers=["openai", "gemini"],
+        emit=output_lines.append,
+        use_color=False,
+    )
+
+    assert [item.display_name for item in results] == ["OpenAI", "Gemini"]
+    assert [item.message for item in results] == ["openai done", "gemini done"]
+    # Output stays grouped per provider in target order.
+    assert output_lines.index("FAILED: openai done") < output_lines.index("FAILED: gemini done")
+
+
+
 def test_resolve_sample_file_path_missing_falls_back_to_bundled_sample(tmp_path: Path) -> None:
     resolved = resolve_sample_file_path(tmp_path / "missing.pdf")
     assert resolved.exists()
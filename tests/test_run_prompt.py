@@ -6,7 +6,7 @@ from typing import Any
 import pytest
 from pydantic import BaseModel
 
-from simpleai.api import run_prompt
+from simpleai.api import arun_prompt, run_prompt
 from simpleai.exceptions import SettingsError, SimpleAIException
 from simpleai.types import AdapterResponse, Citation
 
@@ -26,6 +26,9 @@ class DummyAdapter:
         citations = [Citation(provider="openai", url="https://example.com", title="Example")]
         return AdapterResponse(text=text, citations=citations, raw={"ok": True})
 
+    async def arun(self, **kwargs: Any) -> AdapterResponse:
+        return self.run(**kwargs)
+
 
 BASE_SETTINGS = {
     "defaults": ["openai"],
@@ -215,3 +218,62 @@ def test_run_prompt_wraps_unexpected_errors_in_simpleai_exception(monkeypatch) -
     assert "run_prompt failed" in str(exc.value)
     assert isinstance(exc.value.original_exception, ValueError)
     assert str(exc.value.original_exception) == "bad parse"
+
+
+def test_arun_prompt_returns_tuple_when_citations_enabled(monkeypatch) -> None:
+    import asyncio
+
+    adapter = DummyAdapter()
+
+    monkeypatch.setattr("simpleai.api.load_settings", lambda settings_file=None: BASE_SETTINGS)
+    monkeypatch.setattr("simpleai.api.resolve_provider_and_model", lambda settings, model: ("openai", "gpt-5"))
+    monkeypatch.setattr("simpleai.api.get_adapter", lambda provider, provider_settings: adapter)
+
+    result, citations = asyncio.run(
+        arun_prompt("hello", model="openai", output_format=PayloadModel, return_citations=True, validate_urls=False)
+    )
+    assert isinstance(result, PayloadModel)
+    assert result.value == 7
+    assert citations[0]["url"] == "https://example.com"
+    assert adapter.last_kwargs["require_search"] is True
+
+
+def test_coerce_output_finds_json_blocks_in_prose() -> None:
+    from simpleai.utils import _extract_candidate_json_blocks, coerce_output
+
+    text = 'Sure! [draft] {"value": 1, "note": "{"} then {broken and finally {"value": 2}'
+    assert _extract_candidate_json_blocks(text) == ['{"value": 1, "note": "{"}', '{"value": 2}']
+    assert coerce_output(text, PayloadModel) == PayloadModel(value=1)
+
+
+def test_coerce_output_keeps_wide_integers_exact() -> None:
+    from simpleai.utils import coerce_output
+
+    class WideModel(BaseModel):
+        value: int
+
+    assert coerce_output('{"value": 123456789012345678901234567890}', WideModel).value == 123456789012345678901234567890
+
+
+def test_normalize_prompt_labels_turns() -> None:
+    from simpleai.utils import normalize_prompt
+
+    assert normalize_prompt("plain") == "plain"
+    assert normalize_prompt([]) == ""
+    assert normalize_prompt(["only"]) == "Turn 1: only"
+    assert normalize_prompt(["a", "b"]) == "Turn 1: a\n\nTurn 2: b"
+
+
+def test_coerce_output_accepts_json_strings_for_strict_fields() -> None:
+    from datetime import datetime
+
+    from pydantic import ConfigDict
+
+    from simpleai.utils import coerce_output
+
+    class StrictModel(BaseModel):
+        model_config = ConfigDict(strict=True)
+
+        when: datetime
+
+    assert coerce_output('{"when": "2026-01-02T03:04:05"}', StrictModel).when == datetime(2026, 1, 2, 3, 4, 5)
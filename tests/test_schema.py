@@ -32,3 +32,109 @@ def test_openai_schema_requires_all_object_properties_and_nullable_optionals() -
     assert set(schema["required"]) == set(props.keys())
     assert _is_nullable(props["optional_text"])
     assert _is_nullable(props["optional_number"])
+
+
+def test_output_model_schema_is_memoized_but_returns_private_copies(monkeypatch) -> None:
+    from simpleai.schema import _cached_model_schema, output_model_schema
+
+    _cached_model_schema.cache_clear()
+    calls: list[int] = []
+    original = OpenAIStrictExample.model_json_schema.__func__
+
+    def counting_schema(cls, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        calls.append(1)
+        return original(cls, *args, **kwargs)
+
+    monkeypatch.setattr(OpenAIStrictExample, "model_json_schema", classmethod(counting_schema))
+
+    first = output_model_schema(OpenAIStrictExample)
+    first["properties"].clear()
+    second = output_model_schema(OpenAIStrictExample)
+    openai_response_schema(OpenAIStrictExample)
+
+    assert len(calls) == 1
+    assert "required_value" in second["properties"]
+    _cached_model_schema.cache_clear()
+
+
+def test_schema_helpers_never_mutate_their_input() -> None:
+    import json
+
+    from simpleai.schema import (
+        enforce_closed_objects,
+        enforce_openai_required_all_properties,
+        strip_schema_keywords,
+    )
+
+    schema = {
+        "type": "object",
+        "title": "Root",
+        "properties": {
+            "child": {"type": "object", "properties": {"x": {"type": "integer", "default": 1}}},
+            "items": {"type": "array", "items": [{"type": "string", "title": "Item"}]},
+        },
+    }
+    before = json.dumps(schema, sort_keys=True)
+
+    closed = enforce_closed_objects(schema)
+    required = enforce_openai_required_all_properties(closed)
+    stripped = strip_schema_keywords(required, ["default", "title"])
+
+    assert json.dumps(schema, sort_keys=True) == before
+    assert closed["properties"]["child"]["additionalProperties"] is False
+    assert "required" not in closed["properties"]["child"]
+    assert required["properties"]["child"]["properties"]["x"]["anyOf"] == [{"type": "integer"}, {"type": "null"}]
+    assert "default" in required["properties"]["child"]["properties"]["x"]
+    assert "default" not in stripped["properties"]["child"]["properties"]["x"]
+    assert "title" not in stripped["properties"]["items"]["items"][0]
+
+
+class _FusedInner(BaseModel):
+    label: str = "x"
+    count: int | None = None
+    tags: list[str] = []
+
+
+class _FusedOuter(BaseModel):
+    inner: _FusedInner
+    maybe: _FusedInner | None = None
+    mapping: dict[str, _FusedInner] = {}
+    items: list[_FusedInner | int]
+
+
+def test_fused_provider_schemas_match_staged_helpers() -> None:
+    from simpleai.schema import (
+        ANTHROPIC_UNSUPPORTED_SCHEMA_KEYS,
+        anthropic_response_schema,
+        enforce_closed_objects,
+        enforce_openai_required_all_properties,
+        strip_schema_keywords,
+    )
+
+    raw = _FusedOuter.model_json_schema()
+    staged_openai = strip_schema_keywords(
+        enforce_openai_required_all_properties(enforce_closed_objects(raw)), ["default", "title"]
+    )
+    staged_anthropic = strip_schema_keywords(enforce_closed_objects(raw), ANTHROPIC_UNSUPPORTED_SCHEMA_KEYS)
+
+    assert openai_response_schema(_FusedOuter) == staged_openai
+    assert anthropic_response_schema(_FusedOuter) == staged_anthropic
+
+
+def test_provider_schemas_are_cached_per_model_and_copied_per_call() -> None:
+    from simpleai.schema import _cached_openai_schema
+
+    _cached_openai_schema.cache_clear()
+    first = openai_response_schema(OpenAIStrictExample)
+    first["properties"].clear()
+    second = openai_response_schema(OpenAIStrictExample)
+
+    assert "required_value" in second["properties"]
+    assert _cached_openai_schema.cache_info().hits == 1
+
+
+def test_openai_required_all_properties_is_idempotent() -> None:
+    from simpleai.schema import enforce_openai_required_all_properties
+
+    once = openai_response_schema(_FusedOuter)
+    assert enforce_openai_required_all_properties(once) == once
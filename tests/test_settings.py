@@ -3,6 +3,9 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+import pytest
+
+from simpleai.exceptions import SettingsError
 from simpleai.settings import get_provider_api_key, load_settings
 
 
@@ -25,7 +28,7 @@ def test_load_settings_from_json_file(tmp_path: Path) -> None:
 
     settings = load_settings(settings_file=settings_path)
 
-    assert settings["defaults"][:2] == ["openai", "gemini"]
+    assert settings["defaults"][:2] == ("openai", "gemini")
     assert settings["providers"]["openai"]["default_model"] == "gpt-5-mini"
     assert settings["providers"]["claude"]["default_model"] == "claude-sonnet-4-5-20250929"
     assert settings["providers"]["grok"]["default_model"] == "grok-4-1-fast-reasoning"
@@ -38,11 +41,11 @@ def test_load_settings_defaults_when_no_sources(tmp_path: Path, monkeypatch) ->
 
     settings = load_settings()
 
-    assert settings["defaults"] == ["gemini", "openai", "claude", "grok", "perplexity"]
+    assert settings["defaults"] == ("gemini", "openai", "claude", "grok", "perplexity")
     assert "providers" in settings
 
 
-def test_django_settings_take_priority(monkeypatch) -> None:
+def test_django_settings_take_priority(tmp_path: Path, monkeypatch) -> None:
     monkeypatch.setattr(
         "simpleai.settings._load_from_django",
         lambda: {
@@ -50,11 +53,19 @@ def test_django_settings_take_priority(monkeypatch) -> None:
             "providers": {"openai": {"default_model": "gpt-5-mini"}},
         },
     )
-    monkeypatch.setattr("simpleai.settings._load_from_json", lambda explicit: None)
+    settings_path = tmp_path / "ai_settings.json"
+    settings_path.write_text(
+        json.dumps({"defaults": ["claude"], "providers": {"openai": {"default_model": "gpt-4.1"}}}),
+        encoding="utf-8",
+    )
+    reads: list[Path] = []
+    monkeypatch.setattr("simpleai.settings._read_settings_file", lambda path: reads.append(path))
 
-    settings = load_settings()
+    settings = load_settings(settings_file=settings_path)
+
+    assert reads == []
 
-    assert settings["defaults"] == ["openai"]
+    assert settings["defaults"] == ("openai",)
     assert settings["providers"]["openai"]["default_model"] == "gpt-5-mini"
 
 
@@ -90,3 +101,163 @@ def test_get_provider_api_key_supports_grok_alias_env_var(monkeypatch) -> None:
     monkeypatch.setenv("GROK_API_KEY", "grok-test-key")
 
     assert get_provider_api_key(settings, "grok") == "grok-test-key"
+
+
+def test_load_settings_memoizes_file_until_it_changes(tmp_path: Path, monkeypatch) -> None:
+    import os
+
+    from simpleai import settings as settings_module
+
+    settings_path = tmp_path / "ai_settings.json"
+    settings_path.write_text(json.dumps({"providers": {"openai": {"default_model": "gpt-5-mini"}}}), encoding="utf-8")
+
+    reads: list[Path] = []
+    real_read = settings_module._read_settings_file
+    monkeypatch.setattr(settings_module, "_read_settings_file", lambda path: reads.append(path) or real_read(path))
+
+    first = load_settings(settings_file=settings_path)
+    with pytest.raises(TypeError):
+        first["providers"]["openai"]["default_model"] = "mutated"  # type: ignore[index]
+    assert load_settings(settings_file=settings_path) is first
+    assert first["providers"]["openai"]["default_model"] == "gpt-5-mini"
+    assert len(reads) == 1
+
+    settings_path.write_text(json.dumps({"providers": {"openai": {"default_model": "gpt-5.2-pro"}}}), encoding="utf-8")
+    stat = settings_path.stat()
+    os.utime(settings_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_settings(settings_file=settings_path)["providers"]["openai"]["default_model"] == "gpt-5.2-pro"
+    assert len(reads) == 2
+
+
+def test_settings_json_accepts_what_the_stdlib_parser_accepts(tmp_path: Path) -> None:
+    import math
+
+    settings_path = tmp_path / "ai_settings.json"
+    settings_path.write_text('{"logging": {"x": NaN}}', encoding="utf-8")
+
+    assert math.isnan(load_settings(settings_file=settings_path)["logging"]["x"])
+
+
+def test_invalid_settings_json_raises_settings_error(tmp_path: Path) -> None:
+    settings_path = tmp_path / "ai_settings.json"
+    settings_path.write_text('{"providers": ', encoding="utf-8")
+    with pytest.raises(SettingsError, match="Invalid JSON"):
+        load_settings(settings_file=settings_path)
+
+    settings_path.write_text("[1, 2]", encoding="utf-8")
+    with pytest.raises(SettingsError, match="JSON object"):
+        load_settings(settings_file=settings_path)
+
+
+def test_app_root_walk_is_memoized_per_cwd(tmp_path: Path, monkeypatch) -> None:
+    from simpleai.settings import _find_app_roots
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("SIMPLEAI_SETTINGS_FILE", raising=False)
+    monkeypatch.delenv("SIMPLEAI_APP_ROOT", raising=False)
+
+    load_settings()
+    load_settings()
+    info = _find_app_roots.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+
+
+def test_django_settings_read_only_when_django_conf_is_loaded(monkeypatch) -> None:
+    import sys
+    from types import SimpleNamespace
+
+    from simpleai.settings import _load_from_django
+
+    monkeypatch.delitem(sys.modules, "django.conf", raising=False)
+    assert _load_from_django() is None
+    assert "django.conf" not in sys.modules
+
+    fake_settings = SimpleNamespace(configured=True, SIMPLEAI={"defaults": ["claude"]})
+    monkeypatch.setitem(sys.modules, "django.conf", SimpleNamespace(settings=fake_settings))
+    assert _load_from_django() == {"defaults": ["claude"]}
+
+
+def test_thaw_settings_returns_mutable_copy(tmp_path: Path, monkeypatch) -> None:
+    from simpleai.settings import thaw_settings
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("SIMPLEAI_SETTINGS_FILE", raising=False)
+    frozen = load_settings()
+    thawed = thaw_settings(frozen)
+
+    thawed["defaults"].append("extra")
+    thawed["providers"]["openai"]["default_model"] = "changed"
+    assert frozen["defaults"][-1] == "perplexity"
+    assert frozen["providers"]["openai"]["default_model"] == "gpt-5.2"
+
+
+def test_merge_shares_defaults_without_mutating_inputs(tmp_path: Path) -> None:
+    from simpleai.settings import DEFAULT_SETTINGS
+
+    raw = {"providers": {"chatgpt": {"default_model": "gpt-5-mini"}}, "logging": {"enabled": True}}
+    settings_path = tmp_path / "ai_settings.json"
+    settings_path.write_text(json.dumps(raw), encoding="utf-8")
+
+    settings = load_settings(settings_file=settings_path)
+
+    assert settings["providers"]["openai"]["default_model"] == "gpt-5-mini"
+    assert settings["providers"]["openai"]["max_output_tokens"] == 128000
+    assert settings["providers"]["gemini"] == DEFAULT_SETTINGS["providers"]["gemini"]
+    assert settings["logging"]["logfile_location"] == "./simpleai.log"
+    assert DEFAULT_SETTINGS["providers"]["openai"]["default_model"] == "gpt-5.2"
+    assert DEFAULT_SETTINGS["logging"]["enabled"] is False
+
+
+def test_settings_file_env_var_skips_app_root_walk(tmp_path: Path, monkeypatch) -> None:
+    from simpleai.settings import _find_app_roots
+
+    settings_path = tmp_path / "custom.json"
+    settings_path.write_text(json.dumps({"providers": {"openai": {"default_model": "gpt-4.1"}}}), encoding="utf-8")
+    monkeypatch.setenv("SIMPLEAI_SETTINGS_FILE", str(settings_path))
+
+    assert load_settings()["providers"]["openai"]["default_model"] == "gpt-4.1"
+    assert _find_app_roots.cache_info().misses == 0
+
+
+def test_loaded_settings_resolve_models_and_keys_from_typed_table(tmp_path: Path, monkeypatch) -> None:
+    from simpleai.settings import get_default_model, thaw_settings
+
+    settings_path = tmp_path / "ai_settings.json"
+    settings_path.write_text(
+        json.dumps({"providers": {"xai": {"default_model": "grok-4", "api_key": "xai-settings-key"}}}),
+        encoding="utf-8",
+    )
+    monkeypatch.delenv("XAI_API_KEY", raising=False)
+    monkeypatch.delenv("GROK_API_KEY", raising=False)
+
+    settings = load_settings(settings_file=settings_path)
+    assert settings["_typed_providers"]["grok"].default_model == "grok-4"
+    assert get_default_model(settings, "grok") == "grok-4"
+    assert get_provider_api_key(settings, "grok") == "xai-settings-key"
+
+    plain = thaw_settings(settings)
+    assert "_typed_providers" not in plain
+    plain["providers"]["grok"]["default_model"] = "grok-3"
+    assert get_default_model(plain, "grok") == "grok-3"
+
+
+def test_loaded_settings_carry_typed_provider_configs(tmp_path: Path) -> None:
+    from simpleai.settings import ProviderConfig, get_provider_config, thaw_settings
+
+    settings_path = tmp_path / "ai_settings.json"
+    settings_path.write_text(
+        json.dumps({"providers": {"openai": {"default_model": "gpt-4.1", "api_key": "sk-settings"}}}),
+        encoding="utf-8",
+    )
+
+    settings = load_settings(settings_file=settings_path)
+    config = get_provider_config(settings, "openai")
+    assert config == ProviderConfig(default_model="gpt-4.1", api_key="sk-settings")
+    assert config is settings["_typed_providers"]["openai"]
+    assert get_provider_config(settings, "unknown") == ProviderConfig()
+    with pytest.raises(AttributeError):
+        config.api_key = "other"  # type: ignore[misc]
+
+    plain = thaw_settings(settings)
+    assert "_typed_providers" not in plain
+    assert get_provider_config(plain, "openai").default_model == "gpt-4.1"